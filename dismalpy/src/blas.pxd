@@ -91,6 +91,23 @@ ctypedef int ssymv_t(
     int *incy,            # The increment between elements of y (usually 1)
 ) nogil
 
+ctypedef int ssyr2k_t(
+    # SSYR2K - perform one of the symmetric rank 2k operations   C :=
+    # alpha*A*B' + alpha*B*A' + beta*C,
+    char *uplo,           # {'U','L'}, upper, lower
+    char *trans,          # {'N'}: A, B are nxk; {'T'}: A, B are kxn
+    int *n,               # Order of C
+    int *k,               # Rank of the update
+    np.float32_t *alpha,  # Scalar multiple
+    np.float32_t *a,      # Matrix A
+    int *lda,             # The size of the first dimension of A (in memory)
+    np.float32_t *b,      # Matrix B
+    int *ldb,             # The size of the first dimension of B (in memory)
+    np.float32_t *beta,   # Scalar multiple
+    np.float32_t *c,      # Matrix C
+    int *ldc,             # The size of the first dimension of C (in memory)
+) nogil
+
 ctypedef int strmm_t(
     # STRMM - perform one of the matrix-matrix operations   B :=
     # alpha*op( A )*B, or B := alpha*B*op( A ),
@@ -252,6 +269,23 @@ ctypedef int dsymv_t(
     int *incy,            # The increment between elements of y (usually 1)
 ) nogil
 
+ctypedef int dsyr2k_t(
+    # DSYR2K - perform one of the symmetric rank 2k operations   C :=
+    # alpha*A*B' + alpha*B*A' + beta*C,
+    char *uplo,           # {'U','L'}, upper, lower
+    char *trans,          # {'N'}: A, B are nxk; {'T'}: A, B are kxn
+    int *n,               # Order of C
+    int *k,               # Rank of the update
+    np.float64_t *alpha,  # Scalar multiple
+    np.float64_t *a,      # Matrix A
+    int *lda,             # The size of the first dimension of A (in memory)
+    np.float64_t *b,      # Matrix B
+    int *ldb,             # The size of the first dimension of B (in memory)
+    np.float64_t *beta,   # Scalar multiple
+    np.float64_t *c,      # Matrix C
+    int *ldc,             # The size of the first dimension of C (in memory)
+) nogil
+
 ctypedef int dtrmm_t(
     # DTRMM - perform one of the matrix-matrix operations   B :=
     # alpha*op( A )*B, or B := alpha*B*op( A ),
@@ -413,6 +447,23 @@ ctypedef int csymv_t(
     int *incy,              # The increment between elements of y (usually 1)
 ) nogil
 
+ctypedef int csyr2k_t(
+    # CSYR2K - perform one of the symmetric rank 2k operations   C :=
+    # alpha*A*B' + alpha*B*A' + beta*C,
+    char *uplo,             # {'U','L'}, upper, lower
+    char *trans,            # {'N'}: A, B are nxk; {'T'}: A, B are kxn
+    int *n,                 # Order of C
+    int *k,                 # Rank of the update
+    np.complex64_t *alpha,  # Scalar multiple
+    np.complex64_t *a,      # Matrix A
+    int *lda,               # The size of the first dimension of A (in memory)
+    np.complex64_t *b,      # Matrix B
+    int *ldb,               # The size of the first dimension of B (in memory)
+    np.complex64_t *beta,   # Scalar multiple
+    np.complex64_t *c,      # Matrix C
+    int *ldc,               # The size of the first dimension of C (in memory)
+) nogil
+
 ctypedef int ctrmm_t(
     # CTRMM - perform one of the matrix-matrix operations   B :=
     # alpha*op( A )*B, or B := alpha*B*op( A ),
@@ -574,6 +625,23 @@ ctypedef int zsymv_t(
     int *incy,              # The increment between elements of y (usually 1)
 ) nogil
 
+ctypedef int zsyr2k_t(
+    # ZSYR2K - perform one of the symmetric rank 2k operations   C :=
+    # alpha*A*B' + alpha*B*A' + beta*C,
+    char *uplo,             # {'U','L'}, upper, lower
+    char *trans,            # {'N'}: A, B are nxk; {'T'}: A, B are kxn
+    int *n,                 # Order of C
+    int *k,                 # Rank of the update
+    np.complex128_t *alpha, # Scalar multiple
+    np.complex128_t *a,     # Matrix A
+    int *lda,               # The size of the first dimension of A (in memory)
+    np.complex128_t *b,     # Matrix B
+    int *ldb,               # The size of the first dimension of B (in memory)
+    np.complex128_t *beta,  # Scalar multiple
+    np.complex128_t *c,     # Matrix C
+    int *ldc,               # The size of the first dimension of C (in memory)
+) nogil
+
 ctypedef int ztrmm_t(
     # ZTRMM - perform one of the matrix-matrix operations   B :=
     # alpha*op( A )*B, or B := alpha*B*op( A ),
@@ -655,6 +723,7 @@ cdef:
     sgemv_t *sgemv
     ssymm_t *ssymm
     ssymv_t *ssymv
+    ssyr2k_t *ssyr2k
     strmm_t *strmm
     strmv_t *strmv
     scopy_t *scopy
@@ -668,6 +737,7 @@ cdef:
     dgemv_t *dgemv
     dsymm_t *dsymm
     dsymv_t *dsymv
+    dsyr2k_t *dsyr2k
     dtrmm_t *dtrmm
     dtrmv_t *dtrmv
     dcopy_t *dcopy
@@ -681,6 +751,7 @@ cdef:
     cgemv_t *cgemv
     csymm_t *csymm
     csymv_t *csymv
+    csyr2k_t *csyr2k
     ctrmm_t *ctrmm
     ctrmv_t *ctrmv
     ccopy_t *ccopy
@@ -694,6 +765,7 @@ cdef:
     zgemv_t *zgemv
     zsymm_t *zsymm
     zsymv_t *zsymv
+    zsyr2k_t *zsyr2k
     ztrmm_t *ztrmm
     ztrmv_t *ztrmv
     zcopy_t *zcopy
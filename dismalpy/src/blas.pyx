@@ -15,6 +15,7 @@ cdef:
     sgemv_t *sgemv = <sgemv_t*>Capsule_AsVoidPtr(blas.sgemv._cpointer)
     ssymm_t *ssymm = <ssymm_t*>Capsule_AsVoidPtr(blas.ssymm._cpointer)
     ssymv_t *ssymv = <ssymv_t*>Capsule_AsVoidPtr(blas.ssymv._cpointer)
+    ssyr2k_t *ssyr2k = <ssyr2k_t*>Capsule_AsVoidPtr(blas.ssyr2k._cpointer)
     strmv_t *strmv = <strmv_t*>Capsule_AsVoidPtr(blas.strmv._cpointer)
     strmm_t *strmm = <strmm_t*>Capsule_AsVoidPtr(blas.strmm._cpointer)
     scopy_t *scopy = <scopy_t*>Capsule_AsVoidPtr(blas.scopy._cpointer)
@@ -28,6 +29,7 @@ cdef:
     dgemv_t *dgemv = <dgemv_t*>Capsule_AsVoidPtr(blas.dgemv._cpointer)
     dsymm_t *dsymm = <dsymm_t*>Capsule_AsVoidPtr(blas.dsymm._cpointer)
     dsymv_t *dsymv = <dsymv_t*>Capsule_AsVoidPtr(blas.dsymv._cpointer)
+    dsyr2k_t *dsyr2k = <dsyr2k_t*>Capsule_AsVoidPtr(blas.dsyr2k._cpointer)
     dtrmm_t *dtrmm = <dtrmm_t*>Capsule_AsVoidPtr(blas.dtrmm._cpointer)
     dtrmv_t *dtrmv = <dtrmv_t*>Capsule_AsVoidPtr(blas.dtrmv._cpointer)
     dcopy_t *dcopy = <dcopy_t*>Capsule_AsVoidPtr(blas.dcopy._cpointer)
@@ -41,6 +43,7 @@ cdef:
     cgemv_t *cgemv = <cgemv_t*>Capsule_AsVoidPtr(blas.cgemv._cpointer)
     csymm_t *csymm = <csymm_t*>Capsule_AsVoidPtr(blas.csymm._cpointer)
     #csymv_t *csymv = <csymv_t*>Capsule_AsVoidPtr(blas.csymv._cpointer)
+    csyr2k_t *csyr2k = <csyr2k_t*>Capsule_AsVoidPtr(blas.csyr2k._cpointer)
     ctrmm_t *ctrmm = <ctrmm_t*>Capsule_AsVoidPtr(blas.ctrmm._cpointer)
     ctrmv_t *ctrmv = <ctrmv_t*>Capsule_AsVoidPtr(blas.ctrmv._cpointer)
     ccopy_t *ccopy = <ccopy_t*>Capsule_AsVoidPtr(blas.ccopy._cpointer)
@@ -54,6 +57,7 @@ cdef:
     zgemv_t *zgemv = <zgemv_t*>Capsule_AsVoidPtr(blas.zgemv._cpointer)
     zsymm_t *zsymm = <zsymm_t*>Capsule_AsVoidPtr(blas.zsymm._cpointer)
     #zsymv_t *zsymv = <zsymv_t*>Capsule_AsVoidPtr(blas.zsymv._cpointer)
+    zsyr2k_t *zsyr2k = <zsyr2k_t*>Capsule_AsVoidPtr(blas.zsyr2k._cpointer)
     ztrmm_t *trmm = <ztrmm_t*>Capsule_AsVoidPtr(blas.ztrmm._cpointer)
     ztrmv_t *ztrmv = <ztrmv_t*>Capsule_AsVoidPtr(blas.ztrmv._cpointer)
     zcopy_t *zcopy = <zcopy_t*>Capsule_AsVoidPtr(blas.zcopy._cpointer)
@@ -132,6 +132,19 @@ ctypedef int strtrs_t(
     int *info         # 0 if success, otherwise an error code (integer)
 ) nogil
 
+ctypedef int sgeqrf_t(
+    # SGEQRF computes a QR factorization of a real M-by-N matrix A:
+    # A = Q * R.
+    int *m,           # The number of rows of the matrix A.  m >= 0.
+    int *n,           # The number of columns of the matrix A.  n >= 0.
+    np.float32_t *a,  # Matrix A: mxn; on exit, R is stored in the upper triangle
+    int *lda,         # The size of the first dimension of A (in memory)
+    np.float32_t *tau,  # The scalar factors of the elementary reflectors: min(m,n)
+    np.float32_t *work,  # Workspace
+    int *lwork,       # The dimension of the array work. lwork >= max(1,n)
+    int *info         # 0 if success, otherwise an error code (integer)
+) nogil
+
 ctypedef int dgees_t(
     char *jobvs,
     char *sort,
@@ -256,6 +269,19 @@ ctypedef int dtrtrs_t(
     int *info         # 0 if success, otherwise an error code (integer)
 ) nogil
 
+ctypedef int dgeqrf_t(
+    # DGEQRF computes a QR factorization of a real M-by-N matrix A:
+    # A = Q * R.
+    int *m,           # The number of rows of the matrix A.  m >= 0.
+    int *n,           # The number of columns of the matrix A.  n >= 0.
+    np.float64_t *a,  # Matrix A: mxn; on exit, R is stored in the upper triangle
+    int *lda,         # The size of the first dimension of A (in memory)
+    np.float64_t *tau,  # The scalar factors of the elementary reflectors: min(m,n)
+    np.float64_t *work,  # Workspace
+    int *lwork,       # The dimension of the array work. lwork >= max(1,n)
+    int *info         # 0 if success, otherwise an error code (integer)
+) nogil
+
 ctypedef int cgees_t(
     char *jobvs,
     char *sort,
@@ -380,6 +406,19 @@ ctypedef int ctrtrs_t(
     int *info         # 0 if success, otherwise an error code (integer)
 ) nogil
 
+ctypedef int cgeqrf_t(
+    # CGEQRF computes a QR factorization of a complex M-by-N matrix A:
+    # A = Q * R.
+    int *m,           # The number of rows of the matrix A.  m >= 0.
+    int *n,           # The number of columns of the matrix A.  n >= 0.
+    np.complex64_t *a,  # Matrix A: mxn; on exit, R is stored in the upper triangle
+    int *lda,         # The size of the first dimension of A (in memory)
+    np.complex64_t *tau,  # The scalar factors of the elementary reflectors: min(m,n)
+    np.complex64_t *work,  # Workspace
+    int *lwork,       # The dimension of the array work. lwork >= max(1,n)
+    int *info         # 0 if success, otherwise an error code (integer)
+) nogil
+
 ctypedef int zgees_t(
     char *jobvs,
     char *sort,
@@ -504,6 +543,19 @@ ctypedef int ztrtrs_t(
     int *info         # 0 if success, otherwise an error code (integer)
 ) nogil
 
+ctypedef int zgeqrf_t(
+    # ZGEQRF computes a QR factorization of a complex M-by-N matrix A:
+    # A = Q * R.
+    int *m,           # The number of rows of the matrix A.  m >= 0.
+    int *n,           # The number of columns of the matrix A.  n >= 0.
+    np.complex128_t *a,  # Matrix A: mxn; on exit, R is stored in the upper triangle
+    int *lda,         # The size of the first dimension of A (in memory)
+    np.complex128_t *tau,  # The scalar factors of the elementary reflectors: min(m,n)
+    np.complex128_t *work,  # Workspace
+    int *lwork,       # The dimension of the array work. lwork >= max(1,n)
+    int *info         # 0 if success, otherwise an error code (integer)
+) nogil
+
 cdef:
     cgees_t  *cgees
     ctrsyl_t *ctrsyl
@@ -514,6 +566,7 @@ cdef:
     cpotri_t *cpotri
     cpotrs_t *cpotrs
     ctrtrs_t *ctrtrs
+    cgeqrf_t *cgeqrf
     sgees_t  *sgees
     strsyl_t *strsyl
     sgetrf_t *sgetrf
@@ -523,6 +576,7 @@ cdef:
     spotri_t *spotri
     spotrs_t *spotrs
     strtrs_t *strtrs
+    sgeqrf_t *sgeqrf
     zgees_t  *zgees
     ztrsyl_t *ztrsyl
     zgetrf_t *zgetrf
@@ -532,6 +586,7 @@ cdef:
     zpotri_t *zpotri
     zpotrs_t *zpotrs
     ztrtrs_t *ztrtrs
+    zgeqrf_t *zgeqrf
     dgees_t  *dgees
     dtrsyl_t *dtrsyl
     dgetrf_t *dgetrf
@@ -540,4 +595,5 @@ cdef:
     dpotrf_t *dpotrf
     dpotri_t *dpotri
     dpotrs_t *dpotrs
-    dtrtrs_t * dtrtrs
\ No newline at end of file
+    dtrtrs_t * dtrtrs
+    dgeqrf_t *dgeqrf
\ No newline at end of file
@@ -17,6 +17,7 @@ cdef:
     cpotri_t *cpotri = <cpotri_t*>Capsule_AsVoidPtr(lapack.cpotri._cpointer)
     cpotrs_t *cpotrs = <cpotrs_t*>Capsule_AsVoidPtr(lapack.cpotrs._cpointer)
     ctrtrs_t *ctrtrs = <ctrtrs_t*>Capsule_AsVoidPtr(lapack.ctrtrs._cpointer)
+    cgeqrf_t *cgeqrf = <cgeqrf_t*>Capsule_AsVoidPtr(lapack.cgeqrf._cpointer)
     sgees_t  *sgees  = <sgees_t *>Capsule_AsVoidPtr(lapack.sgees._cpointer)
     strsyl_t *strsyl = <strsyl_t*>Capsule_AsVoidPtr(lapack.strsyl._cpointer)
     sgetrf_t *sgetrf = <sgetrf_t*>Capsule_AsVoidPtr(lapack.sgetrf._cpointer)
@@ -26,6 +27,7 @@ cdef:
     spotri_t *spotri = <spotri_t*>Capsule_AsVoidPtr(lapack.spotri._cpointer)
     spotrs_t *spotrs = <spotrs_t*>Capsule_AsVoidPtr(lapack.spotrs._cpointer)
     strtrs_t *strtrs = <strtrs_t*>Capsule_AsVoidPtr(lapack.strtrs._cpointer)
+    sgeqrf_t *sgeqrf = <sgeqrf_t*>Capsule_AsVoidPtr(lapack.sgeqrf._cpointer)
     zgees_t  *zgees  = <zgees_t *>Capsule_AsVoidPtr(lapack.zgees._cpointer)
     ztrsyl_t *ztrsyl = <ztrsyl_t*>Capsule_AsVoidPtr(lapack.ztrsyl._cpointer)
     zgetrf_t *zgetrf = <zgetrf_t*>Capsule_AsVoidPtr(lapack.zgetrf._cpointer)
@@ -35,6 +37,7 @@ cdef:
     zpotri_t *zpotri = <zpotri_t*>Capsule_AsVoidPtr(lapack.zpotri._cpointer)
     zpotrs_t *zpotrs = <zpotrs_t*>Capsule_AsVoidPtr(lapack.zpotrs._cpointer)
     ztrtrs_t *ztrtrs = <ztrtrs_t*>Capsule_AsVoidPtr(lapack.ztrtrs._cpointer)
+    zgeqrf_t *zgeqrf = <zgeqrf_t*>Capsule_AsVoidPtr(lapack.zgeqrf._cpointer)
     dgees_t  *dgees  = <dgees_t *>Capsule_AsVoidPtr(lapack.dgees._cpointer)
     dtrsyl_t *dtrsyl = <dtrsyl_t*>Capsule_AsVoidPtr(lapack.dtrsyl._cpointer)
     dgetrf_t *dgetrf = <dgetrf_t*>Capsule_AsVoidPtr(lapack.dgetrf._cpointer)
@@ -43,4 +46,5 @@ cdef:
     dpotrf_t *dpotrf = <dpotrf_t*>Capsule_AsVoidPtr(lapack.dpotrf._cpointer)
     dpotri_t *dpotri = <dpotri_t*>Capsule_AsVoidPtr(lapack.dpotri._cpointer)
     dpotrs_t *dpotrs = <dpotrs_t*>Capsule_AsVoidPtr(lapack.dpotrs._cpointer)
-    dtrtrs_t *dtrtrs = <dtrtrs_t*>Capsule_AsVoidPtr(lapack.dtrtrs._cpointer)
\ No newline at end of file
+    dtrtrs_t *dtrtrs = <dtrtrs_t*>Capsule_AsVoidPtr(lapack.dtrtrs._cpointer)
+    dgeqrf_t *dgeqrf = <dgeqrf_t*>Capsule_AsVoidPtr(lapack.dgeqrf._cpointer)
\ No newline at end of file
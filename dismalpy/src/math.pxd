@@ -1,17 +1,23 @@
 # ## Math Functions
-# Real and complex log and abs functions
-from libc.math cimport log as dlog, abs as dabs
+# Real and complex log, abs and sqrt functions
+from libc.math cimport log as dlog, abs as dabs, sqrt as dsqrt
 cimport numpy as np
 
-cdef extern from "numpy/npy_math.h":
+cdef extern from "numpy/npy_math.h" nogil:
     np.float64_t NPY_PI
     np.float64_t npy_cabs(np.npy_cdouble z)
     np.npy_cdouble npy_clog(np.npy_cdouble z)
+    np.npy_cdouble npy_csqrt(np.npy_cdouble z)
 
-cdef inline np.float64_t zabs(np.complex128_t z):
+cdef inline np.float64_t zabs(np.complex128_t z) nogil:
     return npy_cabs((<np.npy_cdouble *> &z)[0])
 
-cdef inline np.complex128_t zlog(np.complex128_t z):
+cdef inline np.complex128_t zlog(np.complex128_t z) nogil:
     cdef np.npy_cdouble x
     x = npy_clog((<np.npy_cdouble*> &z)[0])
-    return (<np.complex128_t *> &x)[0]
\ No newline at end of file
+    return (<np.complex128_t *> &x)[0]
+
+cdef inline np.complex128_t zsqrt(np.complex128_t z) nogil:
+    cdef np.npy_cdouble x
+    x = npy_csqrt((<np.npy_cdouble*> &z)[0])
+    return (<np.complex128_t *> &x)[0]
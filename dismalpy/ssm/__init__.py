@@ -3,7 +3,7 @@ test = Tester().test
 
 from .representation import Representation
 from .kalman_filter import (
-    KalmanFilter, FilterResults,
+    KalmanFilter, FilterResults, PanelFilterResults,
 
     FILTER_CONVENTIONAL,
     FILTER_EXACT_INITIAL,
@@ -13,6 +13,10 @@ from .kalman_filter import (
     FILTER_COLLAPSED,
     FILTER_EXTENDED,
     FILTER_UNSCENTED,
+    FILTER_STEADY_STATE,
+    FILTER_CHANDRASEKHAR,
+    FILTER_INFORMATION,
+    FILTER_BLOCK_SEQUENTIAL,
 
     INVERT_UNIVARIATE,
     SOLVE_LU,
@@ -30,6 +34,7 @@ from .kalman_filter import (
     MEMORY_NO_LIKELIHOOD,
     MEMORY_NO_GAIN,
     MEMORY_NO_SMOOTHING,
+    MEMORY_PACK_COV,
     MEMORY_CONSERVE
 )
 from .kalman_smoother import (
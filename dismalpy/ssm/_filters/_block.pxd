@@ -0,0 +1,29 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Block-Sequential Filter declarations
+
+Author: Chad Fulton  
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from dismalpy.ssm._statespace cimport (
+    sStatespace, dStatespace, cStatespace, zStatespace
+)
+from dismalpy.ssm._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter, cKalmanFilter, zKalmanFilter
+)
+
+# Single precision
+cdef int sforecast_block_sequential(sKalmanFilter kfilter, sStatespace model) nogil
+
+# Double precision
+cdef int dforecast_block_sequential(dKalmanFilter kfilter, dStatespace model) nogil
+
+# Single precision complex
+cdef int cforecast_block_sequential(cKalmanFilter kfilter, cStatespace model) nogil
+
+# Double precision complex
+cdef int zforecast_block_sequential(zKalmanFilter kfilter, zStatespace model) nogil
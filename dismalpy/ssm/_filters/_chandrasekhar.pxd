@@ -0,0 +1,33 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Chandrasekhar Recursions declarations
+
+Author: Chad Fulton  
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from dismalpy.ssm._statespace cimport (
+    sStatespace, dStatespace, cStatespace, zStatespace
+)
+from dismalpy.ssm._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter, cKalmanFilter, zKalmanFilter
+)
+
+# Single precision
+cdef int supdating_chandrasekhar(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_chandrasekhar(sKalmanFilter kfilter, sStatespace model) nogil
+
+# Double precision
+cdef int dupdating_chandrasekhar(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_chandrasekhar(dKalmanFilter kfilter, dStatespace model) nogil
+
+# Single precision complex
+cdef int cupdating_chandrasekhar(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_chandrasekhar(cKalmanFilter kfilter, cStatespace model) nogil
+
+# Double precision complex
+cdef int zupdating_chandrasekhar(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_chandrasekhar(zKalmanFilter kfilter, zStatespace model) nogil
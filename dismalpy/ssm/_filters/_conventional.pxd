@@ -17,45 +17,49 @@ from dismalpy.ssm._kalman_filter cimport (
 )
 
 # Single precision
-cdef int sforecast_missing_conventional(sKalmanFilter kfilter, sStatespace model)
-cdef int supdating_missing_conventional(sKalmanFilter kfilter, sStatespace model)
-cdef np.float32_t sinverse_missing_conventional(sKalmanFilter kfilter, sStatespace model, np.float32_t determinant)  except *
-cdef np.float32_t sloglikelihood_missing_conventional(sKalmanFilter kfilter, sStatespace model, np.float32_t determinant)
+cdef int sforecast_missing_conventional(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_missing_conventional(sKalmanFilter kfilter, sStatespace model) nogil
+cdef np.float64_t sinverse_missing_conventional(sKalmanFilter kfilter, sStatespace model, np.float64_t determinant) nogil
+cdef np.float64_t sloglikelihood_missing_conventional(sKalmanFilter kfilter, sStatespace model, np.float64_t determinant) nogil
 
-cdef int sforecast_conventional(sKalmanFilter kfilter, sStatespace model)
-cdef int supdating_conventional(sKalmanFilter kfilter, sStatespace model)
-cdef int sprediction_conventional(sKalmanFilter kfilter, sStatespace model)
-cdef np.float32_t sloglikelihood_conventional(sKalmanFilter kfilter, sStatespace model, np.float32_t determinant)
+cdef int sforecast_conventional(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_conventional(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_conventional(sKalmanFilter kfilter, sStatespace model) nogil
+cdef np.float64_t sloglikelihood_conventional(sKalmanFilter kfilter, sStatespace model, np.float64_t determinant) nogil
+cdef int spanel_conventional(sKalmanFilter kfilter, sStatespace model) nogil
 
 # Double precision
-cdef int dforecast_missing_conventional(dKalmanFilter kfilter, dStatespace model)
-cdef int dupdating_missing_conventional(dKalmanFilter kfilter, dStatespace model)
-cdef np.float64_t dinverse_missing_conventional(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant)  except *
-cdef np.float64_t dloglikelihood_missing_conventional(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant)
+cdef int dforecast_missing_conventional(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_missing_conventional(dKalmanFilter kfilter, dStatespace model) nogil
+cdef np.float64_t dinverse_missing_conventional(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) nogil
+cdef np.float64_t dloglikelihood_missing_conventional(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) nogil
 
-cdef int dforecast_conventional(dKalmanFilter kfilter, dStatespace model)
-cdef int dupdating_conventional(dKalmanFilter kfilter, dStatespace model)
-cdef int dprediction_conventional(dKalmanFilter kfilter, dStatespace model)
-cdef np.float64_t dloglikelihood_conventional(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant)
+cdef int dforecast_conventional(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_conventional(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_conventional(dKalmanFilter kfilter, dStatespace model) nogil
+cdef np.float64_t dloglikelihood_conventional(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) nogil
+cdef int dpanel_conventional(dKalmanFilter kfilter, dStatespace model) nogil
 
 # Single precision complex
-cdef int cforecast_missing_conventional(cKalmanFilter kfilter, cStatespace model)
-cdef int cupdating_missing_conventional(cKalmanFilter kfilter, cStatespace model)
-cdef np.complex64_t cinverse_missing_conventional(cKalmanFilter kfilter, cStatespace model, np.complex64_t determinant)  except *
-cdef np.complex64_t cloglikelihood_missing_conventional(cKalmanFilter kfilter, cStatespace model, np.complex64_t determinant)
+cdef int cforecast_missing_conventional(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_missing_conventional(cKalmanFilter kfilter, cStatespace model) nogil
+cdef np.complex128_t cinverse_missing_conventional(cKalmanFilter kfilter, cStatespace model, np.complex128_t determinant) nogil
+cdef np.complex128_t cloglikelihood_missing_conventional(cKalmanFilter kfilter, cStatespace model, np.complex128_t determinant) nogil
 
-cdef int cforecast_conventional(cKalmanFilter kfilter, cStatespace model)
-cdef int cupdating_conventional(cKalmanFilter kfilter, cStatespace model)
-cdef int cprediction_conventional(cKalmanFilter kfilter, cStatespace model)
-cdef np.complex64_t cloglikelihood_conventional(cKalmanFilter kfilter, cStatespace model, np.complex64_t determinant)
+cdef int cforecast_conventional(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_conventional(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_conventional(cKalmanFilter kfilter, cStatespace model) nogil
+cdef np.complex128_t cloglikelihood_conventional(cKalmanFilter kfilter, cStatespace model, np.complex128_t determinant) nogil
+cdef int cpanel_conventional(cKalmanFilter kfilter, cStatespace model) nogil
 
 # Double precision complex
-cdef int zforecast_missing_conventional(zKalmanFilter kfilter, zStatespace model)
-cdef int zupdating_missing_conventional(zKalmanFilter kfilter, zStatespace model)
-cdef np.complex128_t zinverse_missing_conventional(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant)  except *
-cdef np.complex128_t zloglikelihood_missing_conventional(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant)
-
-cdef int zforecast_conventional(zKalmanFilter kfilter, zStatespace model)
-cdef int zupdating_conventional(zKalmanFilter kfilter, zStatespace model)
-cdef int zprediction_conventional(zKalmanFilter kfilter, zStatespace model)
-cdef np.complex128_t zloglikelihood_conventional(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant)
+cdef int zforecast_missing_conventional(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_missing_conventional(zKalmanFilter kfilter, zStatespace model) nogil
+cdef np.complex128_t zinverse_missing_conventional(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant) nogil
+cdef np.complex128_t zloglikelihood_missing_conventional(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant) nogil
+
+cdef int zforecast_conventional(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_conventional(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_conventional(zKalmanFilter kfilter, zStatespace model) nogil
+cdef np.complex128_t zloglikelihood_conventional(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant) nogil
+cdef int zpanel_conventional(zKalmanFilter kfilter, zStatespace model) nogil
@@ -0,0 +1,49 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Exact Diffuse Initialization declarations
+
+Author: Chad Fulton  
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from dismalpy.ssm._statespace cimport (
+    sStatespace, dStatespace, cStatespace, zStatespace
+)
+from dismalpy.ssm._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter, cKalmanFilter, zKalmanFilter
+)
+
+# Single precision
+cdef int sforecast_diffuse(sKalmanFilter kfilter, sStatespace model) nogil
+cdef np.float64_t sinverse_diffuse(sKalmanFilter kfilter, sStatespace model, np.float64_t determinant) nogil
+cdef int supdating_diffuse(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_missing_diffuse(sKalmanFilter kfilter, sStatespace model) nogil
+cdef np.float64_t sloglikelihood_diffuse(sKalmanFilter kfilter, sStatespace model, np.float64_t determinant) nogil
+cdef int sprediction_diffuse(sKalmanFilter kfilter, sStatespace model) nogil
+
+# Double precision
+cdef int dforecast_diffuse(dKalmanFilter kfilter, dStatespace model) nogil
+cdef np.float64_t dinverse_diffuse(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) nogil
+cdef int dupdating_diffuse(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_missing_diffuse(dKalmanFilter kfilter, dStatespace model) nogil
+cdef np.float64_t dloglikelihood_diffuse(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) nogil
+cdef int dprediction_diffuse(dKalmanFilter kfilter, dStatespace model) nogil
+
+# Single precision complex
+cdef int cforecast_diffuse(cKalmanFilter kfilter, cStatespace model) nogil
+cdef np.complex128_t cinverse_diffuse(cKalmanFilter kfilter, cStatespace model, np.complex128_t determinant) nogil
+cdef int cupdating_diffuse(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_missing_diffuse(cKalmanFilter kfilter, cStatespace model) nogil
+cdef np.complex128_t cloglikelihood_diffuse(cKalmanFilter kfilter, cStatespace model, np.complex128_t determinant) nogil
+cdef int cprediction_diffuse(cKalmanFilter kfilter, cStatespace model) nogil
+
+# Double precision complex
+cdef int zforecast_diffuse(zKalmanFilter kfilter, zStatespace model) nogil
+cdef np.complex128_t zinverse_diffuse(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant) nogil
+cdef int zupdating_diffuse(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_missing_diffuse(zKalmanFilter kfilter, zStatespace model) nogil
+cdef np.complex128_t zloglikelihood_diffuse(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant) nogil
+cdef int zprediction_diffuse(zKalmanFilter kfilter, zStatespace model) nogil
@@ -0,0 +1,33 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Information Filter declarations
+
+Author: Chad Fulton  
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from dismalpy.ssm._statespace cimport (
+    sStatespace, dStatespace, cStatespace, zStatespace
+)
+from dismalpy.ssm._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter, cKalmanFilter, zKalmanFilter
+)
+
+# Single precision
+cdef int sforecast_information(sKalmanFilter kfilter, sStatespace model) nogil
+cdef np.float64_t sinverse_information(sKalmanFilter kfilter, sStatespace model, np.float64_t determinant) nogil
+
+# Double precision
+cdef int dforecast_information(dKalmanFilter kfilter, dStatespace model) nogil
+cdef np.float64_t dinverse_information(dKalmanFilter kfilter, dStatespace model, np.float64_t determinant) nogil
+
+# Single precision complex
+cdef int cforecast_information(cKalmanFilter kfilter, cStatespace model) nogil
+cdef np.complex128_t cinverse_information(cKalmanFilter kfilter, cStatespace model, np.complex128_t determinant) nogil
+
+# Double precision complex
+cdef int zforecast_information(zKalmanFilter kfilter, zStatespace model) nogil
+cdef np.complex128_t zinverse_information(zKalmanFilter kfilter, zStatespace model, np.complex128_t determinant) nogil
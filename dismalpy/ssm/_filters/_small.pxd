@@ -0,0 +1,85 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Unrolled Conventional Kalman Filter declarations
+
+Author: Chad Fulton  
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from dismalpy.ssm._statespace cimport (
+    sStatespace, dStatespace, cStatespace, zStatespace
+)
+from dismalpy.ssm._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter, cKalmanFilter, zKalmanFilter
+)
+
+# Single precision
+cdef int sforecast_conventional_1(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_conventional_1(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_conventional_1(sKalmanFilter kfilter, sStatespace model) nogil
+
+cdef int sforecast_conventional_2(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_conventional_2(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_conventional_2(sKalmanFilter kfilter, sStatespace model) nogil
+
+cdef int sforecast_conventional_3(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_conventional_3(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_conventional_3(sKalmanFilter kfilter, sStatespace model) nogil
+
+cdef int sforecast_conventional_4(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int supdating_conventional_4(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_conventional_4(sKalmanFilter kfilter, sStatespace model) nogil
+
+# Double precision
+cdef int dforecast_conventional_1(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_conventional_1(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_conventional_1(dKalmanFilter kfilter, dStatespace model) nogil
+
+cdef int dforecast_conventional_2(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_conventional_2(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_conventional_2(dKalmanFilter kfilter, dStatespace model) nogil
+
+cdef int dforecast_conventional_3(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_conventional_3(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_conventional_3(dKalmanFilter kfilter, dStatespace model) nogil
+
+cdef int dforecast_conventional_4(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dupdating_conventional_4(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_conventional_4(dKalmanFilter kfilter, dStatespace model) nogil
+
+# Single precision complex
+cdef int cforecast_conventional_1(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_conventional_1(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_conventional_1(cKalmanFilter kfilter, cStatespace model) nogil
+
+cdef int cforecast_conventional_2(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_conventional_2(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_conventional_2(cKalmanFilter kfilter, cStatespace model) nogil
+
+cdef int cforecast_conventional_3(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_conventional_3(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_conventional_3(cKalmanFilter kfilter, cStatespace model) nogil
+
+cdef int cforecast_conventional_4(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cupdating_conventional_4(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_conventional_4(cKalmanFilter kfilter, cStatespace model) nogil
+
+# Double precision complex
+cdef int zforecast_conventional_1(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_conventional_1(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_conventional_1(zKalmanFilter kfilter, zStatespace model) nogil
+
+cdef int zforecast_conventional_2(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_conventional_2(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_conventional_2(zKalmanFilter kfilter, zStatespace model) nogil
+
+cdef int zforecast_conventional_3(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_conventional_3(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_conventional_3(zKalmanFilter kfilter, zStatespace model) nogil
+
+cdef int zforecast_conventional_4(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zupdating_conventional_4(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_conventional_4(zKalmanFilter kfilter, zStatespace model) nogil
@@ -0,0 +1,41 @@
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: cdivision=False
+"""
+State Space Models - Square-Root Kalman Filter declarations
+
+Author: Chad Fulton  
+License: Simplified-BSD
+"""
+
+cimport numpy as np
+from dismalpy.ssm._statespace cimport (
+    sStatespace, dStatespace, cStatespace, zStatespace
+)
+from dismalpy.ssm._kalman_filter cimport (
+    sKalmanFilter, dKalmanFilter, cKalmanFilter, zKalmanFilter
+)
+
+# Single precision
+cdef int sfactorize_square_root(int n, np.float32_t * a, int lda, np.float32_t * factor, int ldf) nogil
+cdef int ssquare_root_update(sKalmanFilter kfilter, sStatespace model, int k_endog) nogil
+cdef int sforecast_square_root(sKalmanFilter kfilter, sStatespace model) nogil
+cdef int sprediction_square_root(sKalmanFilter kfilter, sStatespace model) nogil
+
+# Double precision
+cdef int dfactorize_square_root(int n, np.float64_t * a, int lda, np.float64_t * factor, int ldf) nogil
+cdef int dsquare_root_update(dKalmanFilter kfilter, dStatespace model, int k_endog) nogil
+cdef int dforecast_square_root(dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dprediction_square_root(dKalmanFilter kfilter, dStatespace model) nogil
+
+# Single precision complex
+cdef int cfactorize_square_root(int n, np.complex64_t * a, int lda, np.complex64_t * factor, int ldf) nogil
+cdef int csquare_root_update(cKalmanFilter kfilter, cStatespace model, int k_endog) nogil
+cdef int cforecast_square_root(cKalmanFilter kfilter, cStatespace model) nogil
+cdef int cprediction_square_root(cKalmanFilter kfilter, cStatespace model) nogil
+
+# Double precision complex
+cdef int zfactorize_square_root(int n, np.complex128_t * a, int lda, np.complex128_t * factor, int ldf) nogil
+cdef int zsquare_root_update(zKalmanFilter kfilter, zStatespace model, int k_endog) nogil
+cdef int zforecast_square_root(zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zprediction_square_root(zKalmanFilter kfilter, zStatespace model) nogil
@@ -12,6 +12,24 @@ def configuration(parent_package='', top_path=None):
     config.add_extension('_univariate',
                          include_dirs=['dismalpy/src'],
                          sources=['_univariate.c'], extra_info=info)
+    config.add_extension('_chandrasekhar',
+                         include_dirs=['dismalpy/src'],
+                         sources=['_chandrasekhar.c'], extra_info=info)
+    config.add_extension('_square_root',
+                         include_dirs=['dismalpy/src'],
+                         sources=['_square_root.c'], extra_info=info)
+    config.add_extension('_diffuse',
+                         include_dirs=['dismalpy/src'],
+                         sources=['_diffuse.c'], extra_info=info)
+    config.add_extension('_information',
+                         include_dirs=['dismalpy/src'],
+                         sources=['_information.c'], extra_info=info)
+    config.add_extension('_block',
+                         include_dirs=['dismalpy/src'],
+                         sources=['_block.c'], extra_info=info)
+    config.add_extension('_small',
+                         include_dirs=['dismalpy/src'],
+                         sources=['_small.c'], extra_info=info)
     config.add_extension('_inversions',
                          include_dirs=['dismalpy/src'],
                          sources=['_inversions.c'], extra_info=info)
@@ -19,6 +19,10 @@ cdef int FILTER_UNIVARIATE       # ibid., Chapter 6.4
 cdef int FILTER_COLLAPSED        # ibid., Chapter 6.5
 cdef int FILTER_EXTENDED         # ibid., Chapter 10.2
 cdef int FILTER_UNSCENTED        # ibid., Chapter 10.3
+cdef int FILTER_STEADY_STATE     # ibid., Chapter 4.3.4
+cdef int FILTER_CHANDRASEKHAR    # Herbst (2015)
+cdef int FILTER_INFORMATION      # Anderson and Moore (1979), Chapter 6.3
+cdef int FILTER_BLOCK_SEQUENTIAL # cf. Durbin and Koopman (2012), Chapter 6.4
 
 # ### Inversion methods
 # Methods by which the terms using the inverse of the forecast error
@@ -41,12 +45,21 @@ cdef int MEMORY_NO_FILTERED
 cdef int MEMORY_NO_LIKELIHOOD
 cdef int MEMORY_NO_GAIN
 cdef int MEMORY_NO_SMOOTHING
+cdef int MEMORY_PACK_COV
 cdef int MEMORY_CONSERVE
 
 # ### Timing options
 cdef int TIMING_INIT_FILTERED
 cdef int TIMING_INIT_PREDICTED
 
+# ### Error codes
+cdef int ERROR_FORECAST_ERROR_COV_INVALID
+cdef int ERROR_FORECAST_ERROR_COV_NOT_PD
+cdef int ERROR_FORECAST_ERROR_COV_SINGULAR
+cdef int ERROR_INVALID_FILTER_METHOD
+cdef int ERROR_INVALID_INVERSION_METHOD
+cdef int ERROR_FORECAST_ERROR_DIFFUSE_COV_SINGULAR
+
 # Typical imports
 cimport numpy as np
 
@@ -65,6 +78,7 @@ cdef class sKalmanFilter(object):
     cdef readonly int converged
     cdef readonly int period_converged
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
     cdef readonly int filter_method
     cdef public int inversion_method
     cdef public int stability_method
@@ -73,9 +87,10 @@ cdef class sKalmanFilter(object):
     cdef readonly int loglikelihood_burn
 
     # ### Kalman filter properties
-    cdef readonly np.float32_t [:] loglikelihood
+    cdef readonly np.float64_t [:] loglikelihood
     cdef readonly np.float32_t [::1,:] filtered_state, predicted_state, forecast, forecast_error
     cdef readonly np.float32_t [::1,:,:] filtered_state_cov, predicted_state_cov, forecast_error_cov
+    cdef readonly np.float32_t [::1,:] filtered_state_cov_packed, predicted_state_cov_packed, forecast_error_cov_packed
     cdef readonly np.float32_t [::1,:,:] kalman_gain
 
     # ### Steady State Values
@@ -83,7 +98,11 @@ cdef class sKalmanFilter(object):
     cdef readonly np.float32_t [::1,:] converged_filtered_state_cov
     cdef readonly np.float32_t [::1,:] converged_predicted_state_cov
     cdef readonly np.float32_t [::1,:] converged_kalman_gain
-    cdef readonly np.float32_t converged_determinant
+    cdef readonly np.float64_t converged_determinant
+    cdef readonly np.float32_t [::1,:] converged_forecast_error_fac
+    cdef readonly int [:] converged_forecast_error_ipiv
+    cdef readonly np.float32_t [::1,:] steady_state_cov
+    cdef public int steady_state_start
 
     # ### Temporary arrays
     cdef readonly np.float32_t [:] selected_obs
@@ -96,7 +115,48 @@ cdef class sKalmanFilter(object):
     cdef readonly np.float32_t [::1,:] tmp2
     cdef readonly np.float32_t [::1,:,:] tmp1, tmp3, tmp4
 
-    cdef readonly np.float32_t determinant
+    cdef readonly np.float64_t determinant
+
+    # ### Panel mode arrays (see `initialize_panel`)
+    cdef readonly int n_series
+    cdef readonly np.float64_t [::1,:] panel_loglikelihood
+    cdef readonly np.float32_t [::1,:,:] panel_forecast_error, panel_filtered_state, panel_predicted_state
+    cdef readonly np.float32_t [::1,:] panel_forecast_error_fac, panel_tmp
+
+    # ### Chandrasekhar recursions arrays (see `initialize_chandrasekhar`)
+    cdef readonly int chandrasekhar_rank
+    cdef readonly np.float32_t [::1,:] chandrasekhar_W, chandrasekhar_M
+    cdef readonly np.float32_t [::1,:] chandrasekhar_tmp0, chandrasekhar_tmp1, chandrasekhar_tmp2, chandrasekhar_tmp3
+
+    # ### Square-root filter arrays (see `initialize_square_root`)
+    cdef readonly np.float32_t [::1,:] predicted_state_cov_factor
+    cdef readonly np.float32_t [::1,:] square_root_prearray, square_root_factor, square_root_tmp
+    cdef readonly np.float32_t [:] square_root_tau, square_root_work
+
+    # ### Information filter arrays (see `initialize_information`)
+    cdef readonly np.float32_t [::1,:] information_fac, information_tmp, information_work
+    cdef readonly int [:] information_ipiv
+
+    # ### Block-sequential filter arrays (see `initialize_block_sequential`)
+    cdef readonly np.float32_t [::1,:] block_design, block_cov, block_gain, block_tmp
+
+    # ### Exact diffuse initialization arrays (see `initialize_exact_initial`)
+    cdef public np.float64_t tolerance_diffuse
+    cdef readonly int diffuse, diffuse_case, nobs_diffuse
+    cdef readonly np.float32_t [::1,:,:] predicted_diffuse_state_cov, forecast_error_diffuse_cov
+    cdef readonly np.float32_t [::1,:] diffuse_tmp0, diffuse_tmp1, diffuse_tmp2, diffuse_tmp3
+    cdef np.float64_t diffuse_loglikelihood
+
+    # ### Unrolled kernels (see `_filters._small`)
+    cdef public int small_kernels
+
+    # ### Recovery from missing observations (see `initialize_recovery`)
+    cdef public int recovery_cache
+    cdef readonly int [:] recovery_start, recovery_length
+    cdef readonly np.float32_t [::1,:,:] recovery_forecast_error_cov, recovery_filtered_state_cov, recovery_predicted_state_cov, recovery_kalman_gain, recovery_forecast_error_fac
+    cdef readonly int [::1,:] recovery_forecast_error_ipiv
+    cdef readonly np.float64_t [:] recovery_determinant
+    cdef int _recovery_enabled, _recovery, _recovery_pattern, _recovery_step, _recovery_used
 
     # ### Pointers to current-iteration arrays
     # cdef np.float32_t * _obs
@@ -123,7 +183,7 @@ cdef class sKalmanFilter(object):
     cdef np.float32_t * _predicted_state_cov
 
     cdef np.float32_t * _kalman_gain
-    cdef np.float32_t * _loglikelihood
+    cdef np.float64_t * _loglikelihood
 
     cdef np.float32_t * _converged_forecast_error_cov
     cdef np.float32_t * _converged_filtered_state_cov
@@ -141,22 +201,33 @@ cdef class sKalmanFilter(object):
     cdef np.float32_t * _tmp3
     cdef np.float32_t * _tmp4
 
+    cdef np.float32_t * _input_diffuse_state_cov
+    cdef np.float32_t * _predicted_diffuse_state_cov
+    cdef np.float32_t * _forecast_error_diffuse_cov
+
     # ### Pointers to current-iteration Kalman filtering functions
     cdef int (*forecasting)(
         sKalmanFilter, sStatespace
-    )
-    cdef np.float32_t (*inversion)(
-        sKalmanFilter, sStatespace, np.float32_t
-    ) except *
+    ) nogil
+    cdef np.float64_t (*inversion)(
+        sKalmanFilter, sStatespace, np.float64_t
+    ) nogil
     cdef int (*updating)(
         sKalmanFilter, sStatespace
-    )
-    cdef np.float32_t (*calculate_loglikelihood)(
-        sKalmanFilter, sStatespace, np.float32_t
-    )
+    ) nogil
+    cdef np.float64_t (*calculate_loglikelihood)(
+        sKalmanFilter, sStatespace, np.float64_t
+    ) nogil
     cdef int (*prediction)(
         sKalmanFilter, sStatespace
-    )
+    ) nogil
+
+    # Number of missing observations for which the function pointers were
+    # last resolved (-1 if they must be resolved in the next iteration)
+    cdef int _function_pointers_nmissing
+
+    # Error recorded while the GIL was released (see `check_error`)
+    cdef int _error
 
     # ### Define some constants
     cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
@@ -166,19 +237,46 @@ cdef class sKalmanFilter(object):
     cdef void set_dimensions(self)
     cpdef set_filter_method(self, int filter_method, int force_reset=*)
     cpdef seek(self, unsigned int t, int reset_convergence=*)
-
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_function_pointers(self) except *
-    cdef void post_convergence(self)
-    cdef void numerical_stability(self)
-    cdef void check_convergence(self)
-    cdef void migrate_storage(self)
+    cdef void _seek(self, unsigned int t, int reset_convergence) nogil
+    cdef int check_error(self) except -1
+    cdef void initialize_pass(self) except *
+    cdef void filter_loop(self) except *
+    cdef int iterate(self) nogil
+    cdef void initialize_panel(self) except *
+    cdef void initialize_steady_state(self) except *
+    cdef void initialize_chandrasekhar(self) except *
+    cdef void initialize_square_root(self) except *
+    cdef void initialize_information(self) except *
+    cdef void initialize_block_sequential(self) except *
+    cdef void initialize_exact_initial(self) except *
+
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef int initialize_function_pointers(self) nogil
+    cdef void post_convergence(self) nogil
+    cdef void numerical_stability(self) nogil
+    cdef void check_convergence(self) nogil
+    cdef void check_diffuse(self) nogil
+    cdef void initialize_recovery(self) except *
+    cdef void reset_recovery(self) nogil
+    cdef void begin_recovery(self) nogil
+    cdef int check_recovery(self) nogil
+    cdef int within_tolerance(self, np.float32_t * state_cov) nogil
+    cdef void end_recovery(self) nogil
+    cdef int forecast_index(self, int t) nogil
+    cdef int filtered_index(self, int t) nogil
+    cdef int predicted_index(self, int t) nogil
+    cdef int forecast_cov_index(self, int t) nogil
+    cdef int filtered_cov_index(self, int t) nogil
+    cdef int predicted_cov_index(self, int t) nogil
+    cdef void pack_covariances(self) nogil
+    cdef void finalize_storage(self) nogil
+    cdef void copy_predicted(self, int i, int j) nogil
 
     cdef void _forecasting(self)
-    cdef np.float32_t _inversion(self)
+    cdef np.float64_t _inversion(self)
     cdef void _updating(self)
-    cdef np.float32_t _calculate_loglikelihood(self)
+    cdef np.float64_t _calculate_loglikelihood(self)
     cdef void _prediction(self)
 
 # Double precision
@@ -192,6 +290,7 @@ cdef class dKalmanFilter(object):
     cdef readonly int converged
     cdef readonly int period_converged
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
     cdef readonly int filter_method
     cdef public int inversion_method
     cdef public int stability_method
@@ -203,6 +302,7 @@ cdef class dKalmanFilter(object):
     cdef readonly np.float64_t [:] loglikelihood
     cdef readonly np.float64_t [::1,:] filtered_state, predicted_state, forecast, forecast_error
     cdef readonly np.float64_t [::1,:,:] filtered_state_cov, predicted_state_cov, forecast_error_cov
+    cdef readonly np.float64_t [::1,:] filtered_state_cov_packed, predicted_state_cov_packed, forecast_error_cov_packed
     cdef readonly np.float64_t [::1,:,:] kalman_gain
 
     # ### Steady State Values
@@ -211,6 +311,10 @@ cdef class dKalmanFilter(object):
     cdef readonly np.float64_t [::1,:] converged_predicted_state_cov
     cdef readonly np.float64_t [::1,:] converged_kalman_gain
     cdef readonly np.float64_t converged_determinant
+    cdef readonly np.float64_t [::1,:] converged_forecast_error_fac
+    cdef readonly int [:] converged_forecast_error_ipiv
+    cdef readonly np.float64_t [::1,:] steady_state_cov
+    cdef public int steady_state_start
 
     # ### Temporary arrays
     cdef readonly np.float64_t [:] selected_obs
@@ -225,6 +329,47 @@ cdef class dKalmanFilter(object):
 
     cdef readonly np.float64_t determinant
 
+    # ### Panel mode arrays (see `initialize_panel`)
+    cdef readonly int n_series
+    cdef readonly np.float64_t [::1,:] panel_loglikelihood
+    cdef readonly np.float64_t [::1,:,:] panel_forecast_error, panel_filtered_state, panel_predicted_state
+    cdef readonly np.float64_t [::1,:] panel_forecast_error_fac, panel_tmp
+
+    # ### Chandrasekhar recursions arrays (see `initialize_chandrasekhar`)
+    cdef readonly int chandrasekhar_rank
+    cdef readonly np.float64_t [::1,:] chandrasekhar_W, chandrasekhar_M
+    cdef readonly np.float64_t [::1,:] chandrasekhar_tmp0, chandrasekhar_tmp1, chandrasekhar_tmp2, chandrasekhar_tmp3
+
+    # ### Square-root filter arrays (see `initialize_square_root`)
+    cdef readonly np.float64_t [::1,:] predicted_state_cov_factor
+    cdef readonly np.float64_t [::1,:] square_root_prearray, square_root_factor, square_root_tmp
+    cdef readonly np.float64_t [:] square_root_tau, square_root_work
+
+    # ### Information filter arrays (see `initialize_information`)
+    cdef readonly np.float64_t [::1,:] information_fac, information_tmp, information_work
+    cdef readonly int [:] information_ipiv
+
+    # ### Block-sequential filter arrays (see `initialize_block_sequential`)
+    cdef readonly np.float64_t [::1,:] block_design, block_cov, block_gain, block_tmp
+
+    # ### Exact diffuse initialization arrays (see `initialize_exact_initial`)
+    cdef public np.float64_t tolerance_diffuse
+    cdef readonly int diffuse, diffuse_case, nobs_diffuse
+    cdef readonly np.float64_t [::1,:,:] predicted_diffuse_state_cov, forecast_error_diffuse_cov
+    cdef readonly np.float64_t [::1,:] diffuse_tmp0, diffuse_tmp1, diffuse_tmp2, diffuse_tmp3
+    cdef np.float64_t diffuse_loglikelihood
+
+    # ### Unrolled kernels (see `_filters._small`)
+    cdef public int small_kernels
+
+    # ### Recovery from missing observations (see `initialize_recovery`)
+    cdef public int recovery_cache
+    cdef readonly int [:] recovery_start, recovery_length
+    cdef readonly np.float64_t [::1,:,:] recovery_forecast_error_cov, recovery_filtered_state_cov, recovery_predicted_state_cov, recovery_kalman_gain, recovery_forecast_error_fac
+    cdef readonly int [::1,:] recovery_forecast_error_ipiv
+    cdef readonly np.float64_t [:] recovery_determinant
+    cdef int _recovery_enabled, _recovery, _recovery_pattern, _recovery_step, _recovery_used
+
     # ### Pointers to current-iteration arrays
     # cdef np.float64_t * _obs
     # cdef np.float64_t * _design
@@ -268,22 +413,33 @@ cdef class dKalmanFilter(object):
     cdef np.float64_t * _tmp3
     cdef np.float64_t * _tmp4
 
+    cdef np.float64_t * _input_diffuse_state_cov
+    cdef np.float64_t * _predicted_diffuse_state_cov
+    cdef np.float64_t * _forecast_error_diffuse_cov
+
     # ### Pointers to current-iteration Kalman filtering functions
     cdef int (*forecasting)(
         dKalmanFilter, dStatespace
-    )
+    ) nogil
     cdef np.float64_t (*inversion)(
         dKalmanFilter, dStatespace, np.float64_t
-    ) except *
+    ) nogil
     cdef int (*updating)(
         dKalmanFilter, dStatespace
-    )
+    ) nogil
     cdef np.float64_t (*calculate_loglikelihood)(
         dKalmanFilter, dStatespace, np.float64_t
-    )
+    ) nogil
     cdef int (*prediction)(
         dKalmanFilter, dStatespace
-    )
+    ) nogil
+
+    # Number of missing observations for which the function pointers were
+    # last resolved (-1 if they must be resolved in the next iteration)
+    cdef int _function_pointers_nmissing
+
+    # Error recorded while the GIL was released (see `check_error`)
+    cdef int _error
 
     # ### Define some constants
     cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
@@ -293,14 +449,41 @@ cdef class dKalmanFilter(object):
     cdef void set_dimensions(self)
     cpdef set_filter_method(self, int filter_method, int force_reset=*)
     cpdef seek(self, unsigned int t, int reset_convergence=*)
-
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_function_pointers(self) except *
-    cdef void post_convergence(self)
-    cdef void numerical_stability(self)
-    cdef void check_convergence(self)
-    cdef void migrate_storage(self)
+    cdef void _seek(self, unsigned int t, int reset_convergence) nogil
+    cdef int check_error(self) except -1
+    cdef void initialize_pass(self) except *
+    cdef void filter_loop(self) except *
+    cdef int iterate(self) nogil
+    cdef void initialize_panel(self) except *
+    cdef void initialize_steady_state(self) except *
+    cdef void initialize_chandrasekhar(self) except *
+    cdef void initialize_square_root(self) except *
+    cdef void initialize_information(self) except *
+    cdef void initialize_block_sequential(self) except *
+    cdef void initialize_exact_initial(self) except *
+
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef int initialize_function_pointers(self) nogil
+    cdef void post_convergence(self) nogil
+    cdef void numerical_stability(self) nogil
+    cdef void check_convergence(self) nogil
+    cdef void check_diffuse(self) nogil
+    cdef void initialize_recovery(self) except *
+    cdef void reset_recovery(self) nogil
+    cdef void begin_recovery(self) nogil
+    cdef int check_recovery(self) nogil
+    cdef int within_tolerance(self, np.float64_t * state_cov) nogil
+    cdef void end_recovery(self) nogil
+    cdef int forecast_index(self, int t) nogil
+    cdef int filtered_index(self, int t) nogil
+    cdef int predicted_index(self, int t) nogil
+    cdef int forecast_cov_index(self, int t) nogil
+    cdef int filtered_cov_index(self, int t) nogil
+    cdef int predicted_cov_index(self, int t) nogil
+    cdef void pack_covariances(self) nogil
+    cdef void finalize_storage(self) nogil
+    cdef void copy_predicted(self, int i, int j) nogil
 
     cdef void _forecasting(self)
     cdef np.float64_t _inversion(self)
@@ -319,6 +502,7 @@ cdef class cKalmanFilter(object):
     cdef readonly int converged
     cdef readonly int period_converged
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
     cdef readonly int filter_method
     cdef public int inversion_method
     cdef public int stability_method
@@ -327,9 +511,10 @@ cdef class cKalmanFilter(object):
     cdef readonly int loglikelihood_burn
 
     # ### Kalman filter properties
-    cdef readonly np.complex64_t [:] loglikelihood
+    cdef readonly np.complex128_t [:] loglikelihood
     cdef readonly np.complex64_t [::1,:] filtered_state, predicted_state, forecast, forecast_error
     cdef readonly np.complex64_t [::1,:,:] filtered_state_cov, predicted_state_cov, forecast_error_cov
+    cdef readonly np.complex64_t [::1,:] filtered_state_cov_packed, predicted_state_cov_packed, forecast_error_cov_packed
     cdef readonly np.complex64_t [::1,:,:] kalman_gain
 
     # ### Steady State Values
@@ -337,7 +522,11 @@ cdef class cKalmanFilter(object):
     cdef readonly np.complex64_t [::1,:] converged_filtered_state_cov
     cdef readonly np.complex64_t [::1,:] converged_predicted_state_cov
     cdef readonly np.complex64_t [::1,:] converged_kalman_gain
-    cdef readonly np.complex64_t converged_determinant
+    cdef readonly np.complex128_t converged_determinant
+    cdef readonly np.complex64_t [::1,:] converged_forecast_error_fac
+    cdef readonly int [:] converged_forecast_error_ipiv
+    cdef readonly np.complex64_t [::1,:] steady_state_cov
+    cdef public int steady_state_start
 
     # ### Temporary arrays
     cdef readonly np.complex64_t [:] selected_obs
@@ -350,7 +539,48 @@ cdef class cKalmanFilter(object):
     cdef readonly np.complex64_t [::1,:] tmp2
     cdef readonly np.complex64_t [::1,:,:] tmp1, tmp3, tmp4
 
-    cdef readonly np.complex64_t determinant
+    cdef readonly np.complex128_t determinant
+
+    # ### Panel mode arrays (see `initialize_panel`)
+    cdef readonly int n_series
+    cdef readonly np.complex128_t [::1,:] panel_loglikelihood
+    cdef readonly np.complex64_t [::1,:,:] panel_forecast_error, panel_filtered_state, panel_predicted_state
+    cdef readonly np.complex64_t [::1,:] panel_forecast_error_fac, panel_tmp
+
+    # ### Chandrasekhar recursions arrays (see `initialize_chandrasekhar`)
+    cdef readonly int chandrasekhar_rank
+    cdef readonly np.complex64_t [::1,:] chandrasekhar_W, chandrasekhar_M
+    cdef readonly np.complex64_t [::1,:] chandrasekhar_tmp0, chandrasekhar_tmp1, chandrasekhar_tmp2, chandrasekhar_tmp3
+
+    # ### Square-root filter arrays (see `initialize_square_root`)
+    cdef readonly np.complex64_t [::1,:] predicted_state_cov_factor
+    cdef readonly np.complex64_t [::1,:] square_root_prearray, square_root_factor, square_root_tmp
+    cdef readonly np.complex64_t [:] square_root_tau, square_root_work
+
+    # ### Information filter arrays (see `initialize_information`)
+    cdef readonly np.complex64_t [::1,:] information_fac, information_tmp, information_work
+    cdef readonly int [:] information_ipiv
+
+    # ### Block-sequential filter arrays (see `initialize_block_sequential`)
+    cdef readonly np.complex64_t [::1,:] block_design, block_cov, block_gain, block_tmp
+
+    # ### Exact diffuse initialization arrays (see `initialize_exact_initial`)
+    cdef public np.float64_t tolerance_diffuse
+    cdef readonly int diffuse, diffuse_case, nobs_diffuse
+    cdef readonly np.complex64_t [::1,:,:] predicted_diffuse_state_cov, forecast_error_diffuse_cov
+    cdef readonly np.complex64_t [::1,:] diffuse_tmp0, diffuse_tmp1, diffuse_tmp2, diffuse_tmp3
+    cdef np.complex128_t diffuse_loglikelihood
+
+    # ### Unrolled kernels (see `_filters._small`)
+    cdef public int small_kernels
+
+    # ### Recovery from missing observations (see `initialize_recovery`)
+    cdef public int recovery_cache
+    cdef readonly int [:] recovery_start, recovery_length
+    cdef readonly np.complex64_t [::1,:,:] recovery_forecast_error_cov, recovery_filtered_state_cov, recovery_predicted_state_cov, recovery_kalman_gain, recovery_forecast_error_fac
+    cdef readonly int [::1,:] recovery_forecast_error_ipiv
+    cdef readonly np.complex128_t [:] recovery_determinant
+    cdef int _recovery_enabled, _recovery, _recovery_pattern, _recovery_step, _recovery_used
 
     # ### Pointers to current-iteration arrays
     # cdef np.complex64_t * _obs
@@ -377,7 +607,7 @@ cdef class cKalmanFilter(object):
     cdef np.complex64_t * _predicted_state_cov
 
     cdef np.complex64_t * _kalman_gain
-    cdef np.complex64_t * _loglikelihood
+    cdef np.complex128_t * _loglikelihood
 
     cdef np.complex64_t * _converged_forecast_error_cov
     cdef np.complex64_t * _converged_filtered_state_cov
@@ -395,22 +625,33 @@ cdef class cKalmanFilter(object):
     cdef np.complex64_t * _tmp3
     cdef np.complex64_t * _tmp4
 
+    cdef np.complex64_t * _input_diffuse_state_cov
+    cdef np.complex64_t * _predicted_diffuse_state_cov
+    cdef np.complex64_t * _forecast_error_diffuse_cov
+
     # ### Pointers to current-iteration Kalman filtering functions
     cdef int (*forecasting)(
         cKalmanFilter, cStatespace
-    )
-    cdef np.complex64_t (*inversion)(
-        cKalmanFilter, cStatespace, np.complex64_t
-    ) except *
+    ) nogil
+    cdef np.complex128_t (*inversion)(
+        cKalmanFilter, cStatespace, np.complex128_t
+    ) nogil
     cdef int (*updating)(
         cKalmanFilter, cStatespace
-    )
-    cdef np.complex64_t (*calculate_loglikelihood)(
-        cKalmanFilter, cStatespace, np.complex64_t
-    )
+    ) nogil
+    cdef np.complex128_t (*calculate_loglikelihood)(
+        cKalmanFilter, cStatespace, np.complex128_t
+    ) nogil
     cdef int (*prediction)(
         cKalmanFilter, cStatespace
-    )
+    ) nogil
+
+    # Number of missing observations for which the function pointers were
+    # last resolved (-1 if they must be resolved in the next iteration)
+    cdef int _function_pointers_nmissing
+
+    # Error recorded while the GIL was released (see `check_error`)
+    cdef int _error
 
     # ### Define some constants
     cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
@@ -420,19 +661,46 @@ cdef class cKalmanFilter(object):
     cdef void set_dimensions(self)
     cpdef set_filter_method(self, int filter_method, int force_reset=*)
     cpdef seek(self, unsigned int t, int reset_convergence=*)
-
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_function_pointers(self) except *
-    cdef void post_convergence(self)
-    cdef void numerical_stability(self)
-    cdef void check_convergence(self)
-    cdef void migrate_storage(self)
+    cdef void _seek(self, unsigned int t, int reset_convergence) nogil
+    cdef int check_error(self) except -1
+    cdef void initialize_pass(self) except *
+    cdef void filter_loop(self) except *
+    cdef int iterate(self) nogil
+    cdef void initialize_panel(self) except *
+    cdef void initialize_steady_state(self) except *
+    cdef void initialize_chandrasekhar(self) except *
+    cdef void initialize_square_root(self) except *
+    cdef void initialize_information(self) except *
+    cdef void initialize_block_sequential(self) except *
+    cdef void initialize_exact_initial(self) except *
+
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef int initialize_function_pointers(self) nogil
+    cdef void post_convergence(self) nogil
+    cdef void numerical_stability(self) nogil
+    cdef void check_convergence(self) nogil
+    cdef void check_diffuse(self) nogil
+    cdef void initialize_recovery(self) except *
+    cdef void reset_recovery(self) nogil
+    cdef void begin_recovery(self) nogil
+    cdef int check_recovery(self) nogil
+    cdef int within_tolerance(self, np.complex64_t * state_cov) nogil
+    cdef void end_recovery(self) nogil
+    cdef int forecast_index(self, int t) nogil
+    cdef int filtered_index(self, int t) nogil
+    cdef int predicted_index(self, int t) nogil
+    cdef int forecast_cov_index(self, int t) nogil
+    cdef int filtered_cov_index(self, int t) nogil
+    cdef int predicted_cov_index(self, int t) nogil
+    cdef void pack_covariances(self) nogil
+    cdef void finalize_storage(self) nogil
+    cdef void copy_predicted(self, int i, int j) nogil
 
     cdef void _forecasting(self)
-    cdef np.complex64_t _inversion(self)
+    cdef np.complex128_t _inversion(self)
     cdef void _updating(self)
-    cdef np.complex64_t _calculate_loglikelihood(self)
+    cdef np.complex128_t _calculate_loglikelihood(self)
     cdef void _prediction(self)
 
 # Double precision complex
@@ -446,6 +714,7 @@ cdef class zKalmanFilter(object):
     cdef readonly int converged
     cdef readonly int period_converged
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
     cdef readonly int filter_method
     cdef public int inversion_method
     cdef public int stability_method
@@ -457,6 +726,7 @@ cdef class zKalmanFilter(object):
     cdef readonly np.complex128_t [:] loglikelihood
     cdef readonly np.complex128_t [::1,:] filtered_state, predicted_state, forecast, forecast_error
     cdef readonly np.complex128_t [::1,:,:] filtered_state_cov, predicted_state_cov, forecast_error_cov
+    cdef readonly np.complex128_t [::1,:] filtered_state_cov_packed, predicted_state_cov_packed, forecast_error_cov_packed
     cdef readonly np.complex128_t [::1,:,:] kalman_gain
 
     # ### Steady State Values
@@ -465,6 +735,10 @@ cdef class zKalmanFilter(object):
     cdef readonly np.complex128_t [::1,:] converged_predicted_state_cov
     cdef readonly np.complex128_t [::1,:] converged_kalman_gain
     cdef readonly np.complex128_t converged_determinant
+    cdef readonly np.complex128_t [::1,:] converged_forecast_error_fac
+    cdef readonly int [:] converged_forecast_error_ipiv
+    cdef readonly np.complex128_t [::1,:] steady_state_cov
+    cdef public int steady_state_start
 
     # ### Temporary arrays
     cdef readonly np.complex128_t [:] selected_obs
@@ -479,6 +753,47 @@ cdef class zKalmanFilter(object):
 
     cdef readonly np.complex128_t determinant
 
+    # ### Panel mode arrays (see `initialize_panel`)
+    cdef readonly int n_series
+    cdef readonly np.complex128_t [::1,:] panel_loglikelihood
+    cdef readonly np.complex128_t [::1,:,:] panel_forecast_error, panel_filtered_state, panel_predicted_state
+    cdef readonly np.complex128_t [::1,:] panel_forecast_error_fac, panel_tmp
+
+    # ### Chandrasekhar recursions arrays (see `initialize_chandrasekhar`)
+    cdef readonly int chandrasekhar_rank
+    cdef readonly np.complex128_t [::1,:] chandrasekhar_W, chandrasekhar_M
+    cdef readonly np.complex128_t [::1,:] chandrasekhar_tmp0, chandrasekhar_tmp1, chandrasekhar_tmp2, chandrasekhar_tmp3
+
+    # ### Square-root filter arrays (see `initialize_square_root`)
+    cdef readonly np.complex128_t [::1,:] predicted_state_cov_factor
+    cdef readonly np.complex128_t [::1,:] square_root_prearray, square_root_factor, square_root_tmp
+    cdef readonly np.complex128_t [:] square_root_tau, square_root_work
+
+    # ### Information filter arrays (see `initialize_information`)
+    cdef readonly np.complex128_t [::1,:] information_fac, information_tmp, information_work
+    cdef readonly int [:] information_ipiv
+
+    # ### Block-sequential filter arrays (see `initialize_block_sequential`)
+    cdef readonly np.complex128_t [::1,:] block_design, block_cov, block_gain, block_tmp
+
+    # ### Exact diffuse initialization arrays (see `initialize_exact_initial`)
+    cdef public np.float64_t tolerance_diffuse
+    cdef readonly int diffuse, diffuse_case, nobs_diffuse
+    cdef readonly np.complex128_t [::1,:,:] predicted_diffuse_state_cov, forecast_error_diffuse_cov
+    cdef readonly np.complex128_t [::1,:] diffuse_tmp0, diffuse_tmp1, diffuse_tmp2, diffuse_tmp3
+    cdef np.complex128_t diffuse_loglikelihood
+
+    # ### Unrolled kernels (see `_filters._small`)
+    cdef public int small_kernels
+
+    # ### Recovery from missing observations (see `initialize_recovery`)
+    cdef public int recovery_cache
+    cdef readonly int [:] recovery_start, recovery_length
+    cdef readonly np.complex128_t [::1,:,:] recovery_forecast_error_cov, recovery_filtered_state_cov, recovery_predicted_state_cov, recovery_kalman_gain, recovery_forecast_error_fac
+    cdef readonly int [::1,:] recovery_forecast_error_ipiv
+    cdef readonly np.complex128_t [:] recovery_determinant
+    cdef int _recovery_enabled, _recovery, _recovery_pattern, _recovery_step, _recovery_used
+
     # ### Pointers to current-iteration arrays
     # cdef np.complex128_t * _obs
     # cdef np.complex128_t * _design
@@ -522,22 +837,33 @@ cdef class zKalmanFilter(object):
     cdef np.complex128_t * _tmp3
     cdef np.complex128_t * _tmp4
 
+    cdef np.complex128_t * _input_diffuse_state_cov
+    cdef np.complex128_t * _predicted_diffuse_state_cov
+    cdef np.complex128_t * _forecast_error_diffuse_cov
+
     # ### Pointers to current-iteration Kalman filtering functions
     cdef int (*forecasting)(
         zKalmanFilter, zStatespace
-    )
+    ) nogil
     cdef np.complex128_t (*inversion)(
         zKalmanFilter, zStatespace, np.complex128_t
-    ) except *
+    ) nogil
     cdef int (*updating)(
         zKalmanFilter, zStatespace
-    )
+    ) nogil
     cdef np.complex128_t (*calculate_loglikelihood)(
         zKalmanFilter, zStatespace, np.complex128_t
-    )
+    ) nogil
     cdef int (*prediction)(
         zKalmanFilter, zStatespace
-    )
+    ) nogil
+
+    # Number of missing observations for which the function pointers were
+    # last resolved (-1 if they must be resolved in the next iteration)
+    cdef int _function_pointers_nmissing
+
+    # Error recorded while the GIL was released (see `check_error`)
+    cdef int _error
 
     # ### Define some constants
     cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
@@ -547,14 +873,41 @@ cdef class zKalmanFilter(object):
     cdef void set_dimensions(self)
     cpdef set_filter_method(self, int filter_method, int force_reset=*)
     cpdef seek(self, unsigned int t, int reset_convergence=*)
-
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_function_pointers(self) except *
-    cdef void post_convergence(self)
-    cdef void numerical_stability(self)
-    cdef void check_convergence(self)
-    cdef void migrate_storage(self)
+    cdef void _seek(self, unsigned int t, int reset_convergence) nogil
+    cdef int check_error(self) except -1
+    cdef void initialize_pass(self) except *
+    cdef void filter_loop(self) except *
+    cdef int iterate(self) nogil
+    cdef void initialize_panel(self) except *
+    cdef void initialize_steady_state(self) except *
+    cdef void initialize_chandrasekhar(self) except *
+    cdef void initialize_square_root(self) except *
+    cdef void initialize_information(self) except *
+    cdef void initialize_block_sequential(self) except *
+    cdef void initialize_exact_initial(self) except *
+
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef int initialize_function_pointers(self) nogil
+    cdef void post_convergence(self) nogil
+    cdef void numerical_stability(self) nogil
+    cdef void check_convergence(self) nogil
+    cdef void check_diffuse(self) nogil
+    cdef void initialize_recovery(self) except *
+    cdef void reset_recovery(self) nogil
+    cdef void begin_recovery(self) nogil
+    cdef int check_recovery(self) nogil
+    cdef int within_tolerance(self, np.complex128_t * state_cov) nogil
+    cdef void end_recovery(self) nogil
+    cdef int forecast_index(self, int t) nogil
+    cdef int filtered_index(self, int t) nogil
+    cdef int predicted_index(self, int t) nogil
+    cdef int forecast_cov_index(self, int t) nogil
+    cdef int filtered_cov_index(self, int t) nogil
+    cdef int predicted_cov_index(self, int t) nogil
+    cdef void pack_covariances(self) nogil
+    cdef void finalize_storage(self) nogil
+    cdef void copy_predicted(self, int i, int j) nogil
 
     cdef void _forecasting(self)
     cdef np.complex128_t _inversion(self)
@@ -90,13 +90,13 @@ cdef class sKalmanSmoother(object):
     # Functions
     cdef int (*smooth_estimators)(
         sKalmanSmoother, sKalmanFilter, sStatespace
-    )
+    ) nogil
     cdef int (*smooth_state)(
         sKalmanSmoother, sKalmanFilter, sStatespace
-    )
+    ) nogil
     cdef int (*smooth_disturbances)(
         sKalmanSmoother, sKalmanFilter, sStatespace
-    )
+    ) nogil
 
     # cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
 
@@ -106,10 +106,13 @@ cdef class sKalmanSmoother(object):
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_smoother_object_pointers(self) except *
-    cdef void initialize_function_pointers(self) except *
+    cdef void smoother_loop(self) except *
+    cdef int check_filter_method_implemented(self) except -1
+    cdef int iterate(self) nogil
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef void initialize_smoother_object_pointers(self) nogil
+    cdef void initialize_function_pointers(self) nogil
 
 # Double precision
 cdef class dKalmanSmoother(object):
@@ -177,13 +180,13 @@ cdef class dKalmanSmoother(object):
     # Functions
     cdef int (*smooth_estimators)(
         dKalmanSmoother, dKalmanFilter, dStatespace
-    )
+    ) nogil
     cdef int (*smooth_state)(
         dKalmanSmoother, dKalmanFilter, dStatespace
-    )
+    ) nogil
     cdef int (*smooth_disturbances)(
         dKalmanSmoother, dKalmanFilter, dStatespace
-    )
+    ) nogil
 
     # cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
 
@@ -193,10 +196,13 @@ cdef class dKalmanSmoother(object):
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_smoother_object_pointers(self) except *
-    cdef void initialize_function_pointers(self) except *
+    cdef void smoother_loop(self) except *
+    cdef int check_filter_method_implemented(self) except -1
+    cdef int iterate(self) nogil
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef void initialize_smoother_object_pointers(self) nogil
+    cdef void initialize_function_pointers(self) nogil
 
 # Single precision complex
 cdef class cKalmanSmoother(object):
@@ -264,13 +270,13 @@ cdef class cKalmanSmoother(object):
     # Functions
     cdef int (*smooth_estimators)(
         cKalmanSmoother, cKalmanFilter, cStatespace
-    )
+    ) nogil
     cdef int (*smooth_state)(
         cKalmanSmoother, cKalmanFilter, cStatespace
-    )
+    ) nogil
     cdef int (*smooth_disturbances)(
         cKalmanSmoother, cKalmanFilter, cStatespace
-    )
+    ) nogil
 
     # cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
 
@@ -280,10 +286,13 @@ cdef class cKalmanSmoother(object):
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_smoother_object_pointers(self) except *
-    cdef void initialize_function_pointers(self) except *
+    cdef void smoother_loop(self) except *
+    cdef int check_filter_method_implemented(self) except -1
+    cdef int iterate(self) nogil
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef void initialize_smoother_object_pointers(self) nogil
+    cdef void initialize_function_pointers(self) nogil
 
 # Double precision complex
 cdef class zKalmanSmoother(object):
@@ -351,13 +360,13 @@ cdef class zKalmanSmoother(object):
     # Functions
     cdef int (*smooth_estimators)(
         zKalmanSmoother, zKalmanFilter, zStatespace
-    )
+    ) nogil
     cdef int (*smooth_state)(
         zKalmanSmoother, zKalmanFilter, zStatespace
-    )
+    ) nogil
     cdef int (*smooth_disturbances)(
         zKalmanSmoother, zKalmanFilter, zStatespace
-    )
+    ) nogil
 
     # cdef readonly int k_endog, k_states, k_posdef, k_endog2, k_states2, k_posdef2, k_endogstates, k_statesposdef
     
@@ -367,7 +376,10 @@ cdef class zKalmanSmoother(object):
     cpdef set_smoother_output(self, int smoother_output, int force_reset=*)
     cpdef reset(self, int force_reset=*)
     cpdef seek(self, unsigned int t)
-    cdef void initialize_statespace_object_pointers(self) except *
-    cdef void initialize_filter_object_pointers(self)
-    cdef void initialize_smoother_object_pointers(self) except *
-    cdef void initialize_function_pointers(self) except *
+    cdef void smoother_loop(self) except *
+    cdef int check_filter_method_implemented(self) except -1
+    cdef int iterate(self) nogil
+    cdef int initialize_statespace_object_pointers(self) nogil
+    cdef void initialize_filter_object_pointers(self) nogil
+    cdef void initialize_smoother_object_pointers(self) nogil
+    cdef void initialize_function_pointers(self) nogil
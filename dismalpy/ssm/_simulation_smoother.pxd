@@ -87,10 +87,10 @@ cdef class sSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.float32_t [:] variates)
     cpdef simulate(self, int simulation_output=*)
 
-    cdef np.float32_t generate_obs(self, int t, np.float32_t * obs, np.float32_t * state, np.float32_t * variates)
-    cdef np.float32_t generate_state(self, int t, np.float32_t * state, np.float32_t * input_state, np.float32_t * variates)
-    cdef void cholesky(self, np.float32_t * source, np.float32_t * destination, int n)
-    cdef void transform_variates(self, np.float32_t * variates, np.float32_t * cholesky_factor, int n)
+    cdef np.float32_t generate_obs(self, int t, np.float32_t * obs, np.float32_t * state, np.float32_t * variates) nogil
+    cdef np.float32_t generate_state(self, int t, np.float32_t * state, np.float32_t * input_state, np.float32_t * variates) nogil
+    cdef void cholesky(self, np.float32_t * source, np.float32_t * destination, int n) nogil
+    cdef void transform_variates(self, np.float32_t * variates, np.float32_t * cholesky_factor, int n) nogil
 
 # Double precision
 cdef class dSimulationSmoother(object):
@@ -152,10 +152,10 @@ cdef class dSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.float64_t [:] variates)
     cpdef simulate(self, int simulation_output=*)
 
-    cdef np.float64_t generate_obs(self, int t, np.float64_t * obs, np.float64_t * state, np.float64_t * variates)
-    cdef np.float64_t generate_state(self, int t, np.float64_t * state, np.float64_t * input_state, np.float64_t * variates)
-    cdef void cholesky(self, np.float64_t * source, np.float64_t * destination, int n)
-    cdef void transform_variates(self, np.float64_t * variates, np.float64_t * cholesky_factor, int n)
+    cdef np.float64_t generate_obs(self, int t, np.float64_t * obs, np.float64_t * state, np.float64_t * variates) nogil
+    cdef np.float64_t generate_state(self, int t, np.float64_t * state, np.float64_t * input_state, np.float64_t * variates) nogil
+    cdef void cholesky(self, np.float64_t * source, np.float64_t * destination, int n) nogil
+    cdef void transform_variates(self, np.float64_t * variates, np.float64_t * cholesky_factor, int n) nogil
 
 # Single precision complex
 cdef class cSimulationSmoother(object):
@@ -217,10 +217,10 @@ cdef class cSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.complex64_t [:] variates)
     cpdef simulate(self, int simulation_output=*)
 
-    cdef np.complex64_t generate_obs(self, int t, np.complex64_t * obs, np.complex64_t * state, np.complex64_t * variates)
-    cdef np.complex64_t generate_state(self, int t, np.complex64_t * state, np.complex64_t * input_state, np.complex64_t * variates)
-    cdef void cholesky(self, np.complex64_t * source, np.complex64_t * destination, int n)
-    cdef void transform_variates(self, np.complex64_t * variates, np.complex64_t * cholesky_factor, int n)
+    cdef np.complex64_t generate_obs(self, int t, np.complex64_t * obs, np.complex64_t * state, np.complex64_t * variates) nogil
+    cdef np.complex64_t generate_state(self, int t, np.complex64_t * state, np.complex64_t * input_state, np.complex64_t * variates) nogil
+    cdef void cholesky(self, np.complex64_t * source, np.complex64_t * destination, int n) nogil
+    cdef void transform_variates(self, np.complex64_t * variates, np.complex64_t * cholesky_factor, int n) nogil
 
 # Double precision complex
 cdef class zSimulationSmoother(object):
@@ -282,7 +282,7 @@ cdef class zSimulationSmoother(object):
     cpdef set_initial_state_variates(self, np.complex128_t [:] variates)
     cpdef simulate(self, int simulation_output=*)
 
-    cdef np.complex128_t generate_obs(self, int t, np.complex128_t * obs, np.complex128_t * state, np.complex128_t * variates)
-    cdef np.complex128_t generate_state(self, int t, np.complex128_t * state, np.complex128_t * input_state, np.complex128_t * variates)
-    cdef void cholesky(self, np.complex128_t * source, np.complex128_t * destination, int n)
-    cdef void transform_variates(self, np.complex128_t * variates, np.complex128_t * cholesky_factor, int n)
\ No newline at end of file
+    cdef np.complex128_t generate_obs(self, int t, np.complex128_t * obs, np.complex128_t * state, np.complex128_t * variates) nogil
+    cdef np.complex128_t generate_state(self, int t, np.complex128_t * state, np.complex128_t * input_state, np.complex128_t * variates) nogil
+    cdef void cholesky(self, np.complex128_t * source, np.complex128_t * destination, int n) nogil
+    cdef void transform_variates(self, np.complex128_t * variates, np.complex128_t * cholesky_factor, int n) nogil
\ No newline at end of file
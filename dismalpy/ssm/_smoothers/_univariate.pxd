@@ -20,17 +20,17 @@ from dismalpy.ssm._kalman_smoother cimport (
 )
 
 # Single precision
-cdef int ssmoothed_estimators_univariate(sKalmanSmoother smoother, sKalmanFilter kfilter, sStatespace model)
-cdef int ssmoothed_disturbances_univariate(sKalmanSmoother smoother, sKalmanFilter kfilter, sStatespace model)
+cdef int ssmoothed_estimators_univariate(sKalmanSmoother smoother, sKalmanFilter kfilter, sStatespace model) nogil
+cdef int ssmoothed_disturbances_univariate(sKalmanSmoother smoother, sKalmanFilter kfilter, sStatespace model) nogil
 
 # Double precision
-cdef int dsmoothed_estimators_univariate(dKalmanSmoother smoother, dKalmanFilter kfilter, dStatespace model)
-cdef int dsmoothed_disturbances_univariate(dKalmanSmoother smoother, dKalmanFilter kfilter, dStatespace model)
+cdef int dsmoothed_estimators_univariate(dKalmanSmoother smoother, dKalmanFilter kfilter, dStatespace model) nogil
+cdef int dsmoothed_disturbances_univariate(dKalmanSmoother smoother, dKalmanFilter kfilter, dStatespace model) nogil
 
 # Single precision complex
-cdef int csmoothed_estimators_univariate(cKalmanSmoother smoother, cKalmanFilter kfilter, cStatespace model)
-cdef int csmoothed_disturbances_univariate(cKalmanSmoother smoother, cKalmanFilter kfilter, cStatespace model)
+cdef int csmoothed_estimators_univariate(cKalmanSmoother smoother, cKalmanFilter kfilter, cStatespace model) nogil
+cdef int csmoothed_disturbances_univariate(cKalmanSmoother smoother, cKalmanFilter kfilter, cStatespace model) nogil
 
 # Double precision complex
-cdef int zsmoothed_estimators_univariate(zKalmanSmoother smoother, zKalmanFilter kfilter, zStatespace model)
-cdef int zsmoothed_disturbances_univariate(zKalmanSmoother smoother, zKalmanFilter kfilter, zStatespace model)
+cdef int zsmoothed_estimators_univariate(zKalmanSmoother smoother, zKalmanFilter kfilter, zStatespace model) nogil
+cdef int zsmoothed_disturbances_univariate(zKalmanSmoother smoother, zKalmanFilter kfilter, zStatespace model) nogil
@@ -10,6 +10,27 @@ License: Simplified-BSD
 
 cimport numpy as np
 
+# Error codes
+cdef int ERROR_NONE
+cdef int ERROR_NOT_INITIALIZED
+cdef int ERROR_OBS_COV_INVALID
+cdef int ERROR_OBS_COV_NOT_PD
+cdef int ERROR_OBS_COV_FAC_SINGULAR
+cdef int ERROR_OBS_COV_FAC_INVALID
+cdef int ERROR_COLLAPSE_DIMENSION
+cdef int ERROR_COLLAPSE_OBS_INTERCEPT
+cdef int ERROR_COLLAPSE_DESIGN_INVALID
+cdef int ERROR_COLLAPSE_ZHZ_NOT_PD
+cdef int ERROR_COLLAPSE_ZHZ_INVALID
+
+# Transition matrix structures
+cdef int TRANSITION_DENSE
+cdef int TRANSITION_IDENTITY
+cdef int TRANSITION_DIAGONAL
+cdef int TRANSITION_BLOCK_DIAGONAL
+cdef int TRANSITION_COMPANION
+cdef int TRANSITION_TRANSPOSED_COMPANION
+
 cdef class sStatespace(object):
     # Statespace dimensions
     cdef readonly int nobs, k_endog, k_states, k_posdef
@@ -18,32 +39,46 @@ cdef class sStatespace(object):
     cdef readonly np.float32_t [::1,:] obs, obs_intercept, state_intercept
     cdef readonly np.float32_t [:] initial_state
     cdef readonly np.float32_t [::1,:] initial_state_cov
+    cdef readonly np.float32_t [::1,:] initial_diffuse_state_cov
     cdef readonly np.float32_t [::1,:,:] design, obs_cov, transition, selection, state_cov, selected_state_cov
 
     cdef readonly int [::1,:] missing
     cdef readonly int [:] nmissing
     cdef readonly int has_missing
 
+    # Missing data patterns
+    cdef readonly int n_missing_patterns
+    cdef readonly int [::1,:] missing_patterns
+    cdef readonly int [:] missing_pattern
+
+    # Panel of observations
+    cdef readonly np.float32_t [::1,:,:] panel_obs
+    cdef readonly int n_series
+
     # Flags
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
+    cdef readonly int covariance_piecewise
     cdef readonly int initialized
     cdef public int diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition
+    cdef public int structured_transition
 
     # Temporary arrays
     cdef np.float32_t [::1,:] tmp
 
     # Temporary selection arrays
     cdef readonly np.float32_t [:] selected_obs
-    cdef readonly np.float32_t [:] selected_design
-    cdef readonly np.float32_t [:] selected_obs_cov
+    cdef readonly np.float32_t [::1,:] selected_obs_intercept
+    cdef readonly np.float32_t [::1,:] selected_design
+    cdef readonly np.float32_t [::1,:] selected_obs_cov
 
     # Temporary transformation arrays
     cdef readonly np.float32_t [::1,:] transform_cholesky
     cdef readonly np.float32_t [::1,:] transform_obs_cov
     cdef readonly np.float32_t [::1,:] transform_design
-    cdef readonly np.float32_t transform_determinant
+    cdef readonly np.float32_t [:] transform_determinant
 
     cdef readonly np.float32_t [:] collapse_obs
     cdef readonly np.float32_t [:] collapse_obs_tmp
@@ -52,6 +87,50 @@ cdef class sStatespace(object):
     cdef readonly np.float32_t [::1,:] collapse_cholesky
     cdef readonly np.float32_t collapse_loglikelihood
 
+    # Information filter arrays (see `initialize_information`)
+    cdef readonly np.float32_t [::1,:] information_cholesky
+    cdef readonly np.float32_t [::1,:] information_obs_precision
+    cdef readonly np.float32_t [::1,:] information_design
+    cdef readonly np.float32_t [::1,:] information_matrix
+    cdef readonly np.float32_t [:] information_determinant
+    cdef readonly int [:] information_diagonal
+
+    # Block-sequential filter arrays (see `initialize_blocks`)
+    cdef readonly int [::1,:] block_index
+    cdef readonly int [::1,:] block_start
+    cdef readonly int [:] n_blocks
+    cdef int [:] block_mark
+
+    # Structure of the transition matrix (see `find_transition_structure`)
+    cdef readonly int [:] transition_structure
+    cdef readonly int [:] transition_n_blocks
+    cdef readonly int [::1,:] transition_block_start
+    cdef readonly int [:] transition_companion_order
+
+    # Selection matrices which select states (see `find_selection_index`)
+    cdef readonly int [:] indexed_selection
+    cdef readonly int [::1,:] selection_index
+
+    # Regimes of piecewise-constant matrices (see `set_regimes`)
+    cdef readonly int [::1,:] regime_index
+    cdef readonly int [:] regime_indexed
+    cdef readonly dict regimes
+
+    # Matrices given by exogenous data (see `set_exog_matrices`)
+    cdef readonly int k_exog
+    cdef readonly int exog_design, exog_obs_intercept, exog_state_intercept
+    cdef readonly np.float32_t [::1,:] exog_data
+    cdef readonly np.float32_t [::1,:] design_coefficients, obs_intercept_coefficients, state_intercept_coefficients
+    cdef readonly np.float32_t [::1,:] design_buffer
+    cdef readonly np.float32_t [:] obs_intercept_buffer, state_intercept_buffer
+
+    # Cache status of the selected and transformed arrays
+    cdef readonly int [::1,:] pattern_cache_t
+
+    # Matrices changed since the last pass (see `set_changed`)
+    cdef readonly int [:] matrix_changed
+    cdef int _matrix_changed_set
+
     # Pointers
     cdef np.float32_t * _obs
     cdef np.float32_t * _design
@@ -64,23 +143,52 @@ cdef class sStatespace(object):
     cdef np.float32_t * _selected_state_cov
     cdef np.float32_t * _initial_state
     cdef np.float32_t * _initial_state_cov
+    cdef np.float32_t * _panel_obs
+    cdef np.float32_t * _information_cholesky
+    cdef np.float32_t * _information_obs_precision
+    cdef np.float32_t * _information_design
+    cdef np.float32_t * _information_matrix
+    cdef int * _block_index
+    cdef int * _block_start
+    cdef int * _transition_block_start
+    cdef int * _selection_index
 
     # Current location
     cdef int t
     cdef int _k_endog, _k_states, _k_posdef, _k_endog2, _k_states2, _k_posdef2, _k_endogstates, _k_statesposdef
     cdef int _nmissing
+    cdef int _pattern, _design_t, _obs_intercept_t, _obs_cov_t
+    cdef int _n_blocks
+    cdef int _transition_structure, _transition_n_blocks, _transition_companion_order
+    cdef int _selection_t, _indexed_selection
+    cdef int _transition_t, _state_cov_t, _covariance_regime_change
+
+    # Errors recorded while the GIL was released
+    cdef int _error, _error_t
 
     # Functions
+    cpdef set_panel_obs(self, panel_obs)
     cpdef seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse)
-
-    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef)
-    cdef void select_state_cov(self, unsigned int t)
-    cdef int select_missing(self, unsigned int t)
-    cdef void _select_missing_entire_obs(self, unsigned int t)
-    cdef void _select_missing_partial_obs(self, unsigned int t)
-    cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) except *
-    cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t) except *
-    cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t) except *
+    cdef int check_error(self) except -1
+    cdef int set_error(self, int error, unsigned int t) nogil
+    cdef int _seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+
+    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef) nogil
+    cdef void update_flags(self)
+    cdef void evaluate_exog_matrices(self, unsigned int t) nogil
+    cdef void select_state_cov(self, unsigned int t) nogil
+    cdef int select_missing(self, unsigned int t) nogil
+    cdef void _select_missing_entire_obs(self, unsigned int t) nogil
+    cdef void _select_missing_partial_obs(self, unsigned int t) nogil
+    cdef int transform(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+    cdef int transform_diagonalize(self, unsigned int t) nogil
+    cdef int transform_generalized_collapse(self, unsigned int t) nogil
+    cpdef initialize_information(self)
+    cdef int transform_information(self, unsigned int t) nogil
+    cpdef initialize_blocks(self)
+    cdef int transform_blocks(self, unsigned int t) nogil
+    cdef void find_transition_structure(self, int transition_t) nogil
+    cdef void find_selection_index(self, int selection_t) nogil
 
 cdef class dStatespace(object):
     # Statespace dimensions
@@ -90,32 +198,46 @@ cdef class dStatespace(object):
     cdef readonly np.float64_t [::1,:] obs, obs_intercept, state_intercept
     cdef readonly np.float64_t [:] initial_state
     cdef readonly np.float64_t [::1,:] initial_state_cov
+    cdef readonly np.float64_t [::1,:] initial_diffuse_state_cov
     cdef readonly np.float64_t [::1,:,:] design, obs_cov, transition, selection, state_cov, selected_state_cov
 
     cdef readonly int [::1,:] missing
     cdef readonly int [:] nmissing
     cdef readonly int has_missing
 
+    # Missing data patterns
+    cdef readonly int n_missing_patterns
+    cdef readonly int [::1,:] missing_patterns
+    cdef readonly int [:] missing_pattern
+
+    # Panel of observations
+    cdef readonly np.float64_t [::1,:,:] panel_obs
+    cdef readonly int n_series
+
     # Flags
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
+    cdef readonly int covariance_piecewise
     cdef readonly int initialized
     cdef public int diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition
+    cdef public int structured_transition
 
     # Temporary arrays
     cdef np.float64_t [::1,:] tmp
 
     # Temporary selection arrays
     cdef readonly np.float64_t [:] selected_obs
-    cdef readonly np.float64_t [:] selected_design
-    cdef readonly np.float64_t [:] selected_obs_cov
+    cdef readonly np.float64_t [::1,:] selected_obs_intercept
+    cdef readonly np.float64_t [::1,:] selected_design
+    cdef readonly np.float64_t [::1,:] selected_obs_cov
 
     # Temporary transformation arrays
     cdef readonly np.float64_t [::1,:] transform_cholesky
     cdef readonly np.float64_t [::1,:] transform_obs_cov
     cdef readonly np.float64_t [::1,:] transform_design
-    cdef readonly np.float64_t transform_determinant
+    cdef readonly np.float64_t [:] transform_determinant
 
     cdef readonly np.float64_t [:] collapse_obs
     cdef readonly np.float64_t [:] collapse_obs_tmp
@@ -124,6 +246,50 @@ cdef class dStatespace(object):
     cdef readonly np.float64_t [::1,:] collapse_cholesky
     cdef readonly np.float64_t collapse_loglikelihood
 
+    # Information filter arrays (see `initialize_information`)
+    cdef readonly np.float64_t [::1,:] information_cholesky
+    cdef readonly np.float64_t [::1,:] information_obs_precision
+    cdef readonly np.float64_t [::1,:] information_design
+    cdef readonly np.float64_t [::1,:] information_matrix
+    cdef readonly np.float64_t [:] information_determinant
+    cdef readonly int [:] information_diagonal
+
+    # Block-sequential filter arrays (see `initialize_blocks`)
+    cdef readonly int [::1,:] block_index
+    cdef readonly int [::1,:] block_start
+    cdef readonly int [:] n_blocks
+    cdef int [:] block_mark
+
+    # Structure of the transition matrix (see `find_transition_structure`)
+    cdef readonly int [:] transition_structure
+    cdef readonly int [:] transition_n_blocks
+    cdef readonly int [::1,:] transition_block_start
+    cdef readonly int [:] transition_companion_order
+
+    # Selection matrices which select states (see `find_selection_index`)
+    cdef readonly int [:] indexed_selection
+    cdef readonly int [::1,:] selection_index
+
+    # Regimes of piecewise-constant matrices (see `set_regimes`)
+    cdef readonly int [::1,:] regime_index
+    cdef readonly int [:] regime_indexed
+    cdef readonly dict regimes
+
+    # Matrices given by exogenous data (see `set_exog_matrices`)
+    cdef readonly int k_exog
+    cdef readonly int exog_design, exog_obs_intercept, exog_state_intercept
+    cdef readonly np.float64_t [::1,:] exog_data
+    cdef readonly np.float64_t [::1,:] design_coefficients, obs_intercept_coefficients, state_intercept_coefficients
+    cdef readonly np.float64_t [::1,:] design_buffer
+    cdef readonly np.float64_t [:] obs_intercept_buffer, state_intercept_buffer
+
+    # Cache status of the selected and transformed arrays
+    cdef readonly int [::1,:] pattern_cache_t
+
+    # Matrices changed since the last pass (see `set_changed`)
+    cdef readonly int [:] matrix_changed
+    cdef int _matrix_changed_set
+
     # Pointers
     cdef np.float64_t * _obs
     cdef np.float64_t * _design
@@ -136,23 +302,52 @@ cdef class dStatespace(object):
     cdef np.float64_t * _selected_state_cov
     cdef np.float64_t * _initial_state
     cdef np.float64_t * _initial_state_cov
+    cdef np.float64_t * _panel_obs
+    cdef np.float64_t * _information_cholesky
+    cdef np.float64_t * _information_obs_precision
+    cdef np.float64_t * _information_design
+    cdef np.float64_t * _information_matrix
+    cdef int * _block_index
+    cdef int * _block_start
+    cdef int * _transition_block_start
+    cdef int * _selection_index
 
     # Current location
     cdef int t
     cdef int _k_endog, _k_states, _k_posdef, _k_endog2, _k_states2, _k_posdef2, _k_endogstates, _k_statesposdef
     cdef int _nmissing
+    cdef int _pattern, _design_t, _obs_intercept_t, _obs_cov_t
+    cdef int _n_blocks
+    cdef int _transition_structure, _transition_n_blocks, _transition_companion_order
+    cdef int _selection_t, _indexed_selection
+    cdef int _transition_t, _state_cov_t, _covariance_regime_change
+
+    # Errors recorded while the GIL was released
+    cdef int _error, _error_t
 
     # Functions
+    cpdef set_panel_obs(self, panel_obs)
     cpdef seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse)
-
-    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef)
-    cdef void select_state_cov(self, unsigned int t)
-    cdef int select_missing(self, unsigned int t)
-    cdef void _select_missing_entire_obs(self, unsigned int t)
-    cdef void _select_missing_partial_obs(self, unsigned int t)
-    cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) except *
-    cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t) except *
-    cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t) except *
+    cdef int check_error(self) except -1
+    cdef int set_error(self, int error, unsigned int t) nogil
+    cdef int _seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+
+    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef) nogil
+    cdef void update_flags(self)
+    cdef void evaluate_exog_matrices(self, unsigned int t) nogil
+    cdef void select_state_cov(self, unsigned int t) nogil
+    cdef int select_missing(self, unsigned int t) nogil
+    cdef void _select_missing_entire_obs(self, unsigned int t) nogil
+    cdef void _select_missing_partial_obs(self, unsigned int t) nogil
+    cdef int transform(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+    cdef int transform_diagonalize(self, unsigned int t) nogil
+    cdef int transform_generalized_collapse(self, unsigned int t) nogil
+    cpdef initialize_information(self)
+    cdef int transform_information(self, unsigned int t) nogil
+    cpdef initialize_blocks(self)
+    cdef int transform_blocks(self, unsigned int t) nogil
+    cdef void find_transition_structure(self, int transition_t) nogil
+    cdef void find_selection_index(self, int selection_t) nogil
 
 cdef class cStatespace(object):
     # Statespace dimensions
@@ -162,32 +357,46 @@ cdef class cStatespace(object):
     cdef readonly np.complex64_t [::1,:] obs, obs_intercept, state_intercept
     cdef readonly np.complex64_t [:] initial_state
     cdef readonly np.complex64_t [::1,:] initial_state_cov
+    cdef readonly np.complex64_t [::1,:] initial_diffuse_state_cov
     cdef readonly np.complex64_t [::1,:,:] design, obs_cov, transition, selection, state_cov, selected_state_cov
 
     cdef readonly int [::1,:] missing
     cdef readonly int [:] nmissing
     cdef readonly int has_missing
 
+    # Missing data patterns
+    cdef readonly int n_missing_patterns
+    cdef readonly int [::1,:] missing_patterns
+    cdef readonly int [:] missing_pattern
+
+    # Panel of observations
+    cdef readonly np.complex64_t [::1,:,:] panel_obs
+    cdef readonly int n_series
+
     # Flags
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
+    cdef readonly int covariance_piecewise
     cdef readonly int initialized
     cdef public int diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition
+    cdef public int structured_transition
 
     # Temporary arrays
     cdef np.complex64_t [::1,:] tmp
 
     # Temporary selection arrays
     cdef readonly np.complex64_t [:] selected_obs
-    cdef readonly np.complex64_t [:] selected_design
-    cdef readonly np.complex64_t [:] selected_obs_cov
+    cdef readonly np.complex64_t [::1,:] selected_obs_intercept
+    cdef readonly np.complex64_t [::1,:] selected_design
+    cdef readonly np.complex64_t [::1,:] selected_obs_cov
 
     # Temporary transformation arrays
     cdef readonly np.complex64_t [::1,:] transform_cholesky
     cdef readonly np.complex64_t [::1,:] transform_obs_cov
     cdef readonly np.complex64_t [::1,:] transform_design
-    cdef readonly np.complex64_t transform_determinant
+    cdef readonly np.complex64_t [:] transform_determinant
 
     cdef readonly np.complex64_t [:] collapse_obs
     cdef readonly np.complex64_t [:] collapse_obs_tmp
@@ -196,6 +405,50 @@ cdef class cStatespace(object):
     cdef readonly np.complex64_t [::1,:] collapse_cholesky
     cdef readonly np.complex64_t collapse_loglikelihood
 
+    # Information filter arrays (see `initialize_information`)
+    cdef readonly np.complex64_t [::1,:] information_cholesky
+    cdef readonly np.complex64_t [::1,:] information_obs_precision
+    cdef readonly np.complex64_t [::1,:] information_design
+    cdef readonly np.complex64_t [::1,:] information_matrix
+    cdef readonly np.complex64_t [:] information_determinant
+    cdef readonly int [:] information_diagonal
+
+    # Block-sequential filter arrays (see `initialize_blocks`)
+    cdef readonly int [::1,:] block_index
+    cdef readonly int [::1,:] block_start
+    cdef readonly int [:] n_blocks
+    cdef int [:] block_mark
+
+    # Structure of the transition matrix (see `find_transition_structure`)
+    cdef readonly int [:] transition_structure
+    cdef readonly int [:] transition_n_blocks
+    cdef readonly int [::1,:] transition_block_start
+    cdef readonly int [:] transition_companion_order
+
+    # Selection matrices which select states (see `find_selection_index`)
+    cdef readonly int [:] indexed_selection
+    cdef readonly int [::1,:] selection_index
+
+    # Regimes of piecewise-constant matrices (see `set_regimes`)
+    cdef readonly int [::1,:] regime_index
+    cdef readonly int [:] regime_indexed
+    cdef readonly dict regimes
+
+    # Matrices given by exogenous data (see `set_exog_matrices`)
+    cdef readonly int k_exog
+    cdef readonly int exog_design, exog_obs_intercept, exog_state_intercept
+    cdef readonly np.complex64_t [::1,:] exog_data
+    cdef readonly np.complex64_t [::1,:] design_coefficients, obs_intercept_coefficients, state_intercept_coefficients
+    cdef readonly np.complex64_t [::1,:] design_buffer
+    cdef readonly np.complex64_t [:] obs_intercept_buffer, state_intercept_buffer
+
+    # Cache status of the selected and transformed arrays
+    cdef readonly int [::1,:] pattern_cache_t
+
+    # Matrices changed since the last pass (see `set_changed`)
+    cdef readonly int [:] matrix_changed
+    cdef int _matrix_changed_set
+
     # Pointers
     cdef np.complex64_t * _obs
     cdef np.complex64_t * _design
@@ -208,23 +461,52 @@ cdef class cStatespace(object):
     cdef np.complex64_t * _selected_state_cov
     cdef np.complex64_t * _initial_state
     cdef np.complex64_t * _initial_state_cov
+    cdef np.complex64_t * _panel_obs
+    cdef np.complex64_t * _information_cholesky
+    cdef np.complex64_t * _information_obs_precision
+    cdef np.complex64_t * _information_design
+    cdef np.complex64_t * _information_matrix
+    cdef int * _block_index
+    cdef int * _block_start
+    cdef int * _transition_block_start
+    cdef int * _selection_index
 
     # Current location
     cdef int t
     cdef int _k_endog, _k_states, _k_posdef, _k_endog2, _k_states2, _k_posdef2, _k_endogstates, _k_statesposdef
     cdef int _nmissing
+    cdef int _pattern, _design_t, _obs_intercept_t, _obs_cov_t
+    cdef int _n_blocks
+    cdef int _transition_structure, _transition_n_blocks, _transition_companion_order
+    cdef int _selection_t, _indexed_selection
+    cdef int _transition_t, _state_cov_t, _covariance_regime_change
+
+    # Errors recorded while the GIL was released
+    cdef int _error, _error_t
 
     # Functions
+    cpdef set_panel_obs(self, panel_obs)
     cpdef seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse)
-
-    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef)
-    cdef void select_state_cov(self, unsigned int t)
-    cdef int select_missing(self, unsigned int t)
-    cdef void _select_missing_entire_obs(self, unsigned int t)
-    cdef void _select_missing_partial_obs(self, unsigned int t)
-    cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) except *
-    cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t) except *
-    cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t) except *
+    cdef int check_error(self) except -1
+    cdef int set_error(self, int error, unsigned int t) nogil
+    cdef int _seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+
+    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef) nogil
+    cdef void update_flags(self)
+    cdef void evaluate_exog_matrices(self, unsigned int t) nogil
+    cdef void select_state_cov(self, unsigned int t) nogil
+    cdef int select_missing(self, unsigned int t) nogil
+    cdef void _select_missing_entire_obs(self, unsigned int t) nogil
+    cdef void _select_missing_partial_obs(self, unsigned int t) nogil
+    cdef int transform(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+    cdef int transform_diagonalize(self, unsigned int t) nogil
+    cdef int transform_generalized_collapse(self, unsigned int t) nogil
+    cpdef initialize_information(self)
+    cdef int transform_information(self, unsigned int t) nogil
+    cpdef initialize_blocks(self)
+    cdef int transform_blocks(self, unsigned int t) nogil
+    cdef void find_transition_structure(self, int transition_t) nogil
+    cdef void find_selection_index(self, int selection_t) nogil
 
 cdef class zStatespace(object):
     # Statespace dimensions
@@ -234,32 +516,46 @@ cdef class zStatespace(object):
     cdef readonly np.complex128_t [::1,:] obs, obs_intercept, state_intercept
     cdef readonly np.complex128_t [:] initial_state
     cdef readonly np.complex128_t [::1,:] initial_state_cov
+    cdef readonly np.complex128_t [::1,:] initial_diffuse_state_cov
     cdef readonly np.complex128_t [::1,:,:] design, obs_cov, transition, selection, state_cov, selected_state_cov
 
     cdef readonly int [::1,:] missing
     cdef readonly int [:] nmissing
     cdef readonly int has_missing
 
+    # Missing data patterns
+    cdef readonly int n_missing_patterns
+    cdef readonly int [::1,:] missing_patterns
+    cdef readonly int [:] missing_pattern
+
+    # Panel of observations
+    cdef readonly np.complex128_t [::1,:,:] panel_obs
+    cdef readonly int n_series
+
     # Flags
     cdef readonly int time_invariant
+    cdef readonly int covariance_invariant
+    cdef readonly int covariance_piecewise
     cdef readonly int initialized
     cdef public int diagonal_obs_cov
     cdef public int subset_design
     cdef public int companion_transition
+    cdef public int structured_transition
 
     # Temporary arrays
     cdef np.complex128_t [::1,:] tmp
 
     # Temporary selection arrays
     cdef readonly np.complex128_t [:] selected_obs
-    cdef readonly np.complex128_t [:] selected_design
-    cdef readonly np.complex128_t [:] selected_obs_cov
+    cdef readonly np.complex128_t [::1,:] selected_obs_intercept
+    cdef readonly np.complex128_t [::1,:] selected_design
+    cdef readonly np.complex128_t [::1,:] selected_obs_cov
 
     # Temporary transformation arrays
     cdef readonly np.complex128_t [::1,:] transform_cholesky
     cdef readonly np.complex128_t [::1,:] transform_obs_cov
     cdef readonly np.complex128_t [::1,:] transform_design
-    cdef readonly np.complex128_t transform_determinant
+    cdef readonly np.complex128_t [:] transform_determinant
 
     cdef readonly np.complex128_t [:] collapse_obs
     cdef readonly np.complex128_t [:] collapse_obs_tmp
@@ -268,6 +564,50 @@ cdef class zStatespace(object):
     cdef readonly np.complex128_t [::1,:] collapse_cholesky
     cdef readonly np.complex128_t collapse_loglikelihood
 
+    # Information filter arrays (see `initialize_information`)
+    cdef readonly np.complex128_t [::1,:] information_cholesky
+    cdef readonly np.complex128_t [::1,:] information_obs_precision
+    cdef readonly np.complex128_t [::1,:] information_design
+    cdef readonly np.complex128_t [::1,:] information_matrix
+    cdef readonly np.complex128_t [:] information_determinant
+    cdef readonly int [:] information_diagonal
+
+    # Block-sequential filter arrays (see `initialize_blocks`)
+    cdef readonly int [::1,:] block_index
+    cdef readonly int [::1,:] block_start
+    cdef readonly int [:] n_blocks
+    cdef int [:] block_mark
+
+    # Structure of the transition matrix (see `find_transition_structure`)
+    cdef readonly int [:] transition_structure
+    cdef readonly int [:] transition_n_blocks
+    cdef readonly int [::1,:] transition_block_start
+    cdef readonly int [:] transition_companion_order
+
+    # Selection matrices which select states (see `find_selection_index`)
+    cdef readonly int [:] indexed_selection
+    cdef readonly int [::1,:] selection_index
+
+    # Regimes of piecewise-constant matrices (see `set_regimes`)
+    cdef readonly int [::1,:] regime_index
+    cdef readonly int [:] regime_indexed
+    cdef readonly dict regimes
+
+    # Matrices given by exogenous data (see `set_exog_matrices`)
+    cdef readonly int k_exog
+    cdef readonly int exog_design, exog_obs_intercept, exog_state_intercept
+    cdef readonly np.complex128_t [::1,:] exog_data
+    cdef readonly np.complex128_t [::1,:] design_coefficients, obs_intercept_coefficients, state_intercept_coefficients
+    cdef readonly np.complex128_t [::1,:] design_buffer
+    cdef readonly np.complex128_t [:] obs_intercept_buffer, state_intercept_buffer
+
+    # Cache status of the selected and transformed arrays
+    cdef readonly int [::1,:] pattern_cache_t
+
+    # Matrices changed since the last pass (see `set_changed`)
+    cdef readonly int [:] matrix_changed
+    cdef int _matrix_changed_set
+
     # Pointers
     cdef np.complex128_t * _obs
     cdef np.complex128_t * _design
@@ -280,44 +620,94 @@ cdef class zStatespace(object):
     cdef np.complex128_t * _selected_state_cov
     cdef np.complex128_t * _initial_state
     cdef np.complex128_t * _initial_state_cov
+    cdef np.complex128_t * _panel_obs
+    cdef np.complex128_t * _information_cholesky
+    cdef np.complex128_t * _information_obs_precision
+    cdef np.complex128_t * _information_design
+    cdef np.complex128_t * _information_matrix
+    cdef int * _block_index
+    cdef int * _block_start
+    cdef int * _transition_block_start
+    cdef int * _selection_index
 
     # Current location
     cdef int t
     cdef int _k_endog, _k_states, _k_posdef, _k_endog2, _k_states2, _k_posdef2, _k_endogstates, _k_statesposdef
     cdef int _nmissing
+    cdef int _pattern, _design_t, _obs_intercept_t, _obs_cov_t
+    cdef int _n_blocks
+    cdef int _transition_structure, _transition_n_blocks, _transition_companion_order
+    cdef int _selection_t, _indexed_selection
+    cdef int _transition_t, _state_cov_t, _covariance_regime_change
+
+    # Errors recorded while the GIL was released
+    cdef int _error, _error_t
 
     # Functions
+    cpdef set_panel_obs(self, panel_obs)
     cpdef seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse)
-
-    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef)
-    cdef void select_state_cov(self, unsigned int t)
-    cdef int select_missing(self, unsigned int t)
-    cdef void _select_missing_entire_obs(self, unsigned int t)
-    cdef void _select_missing_partial_obs(self, unsigned int t)
-    cdef void transform(self, unsigned int t, unsigned int previous_t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) except *
-    cdef void transform_diagonalize(self, unsigned int t, unsigned int previous_t) except *
-    cdef int transform_generalized_collapse(self, unsigned int t, unsigned int previous_t) except *
+    cdef int check_error(self) except -1
+    cdef int set_error(self, int error, unsigned int t) nogil
+    cdef int _seek(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+
+    cdef void set_dimensions(self, unsigned int k_endog, unsigned int k_states, unsigned int k_posdef) nogil
+    cdef void update_flags(self)
+    cdef void evaluate_exog_matrices(self, unsigned int t) nogil
+    cdef void select_state_cov(self, unsigned int t) nogil
+    cdef int select_missing(self, unsigned int t) nogil
+    cdef void _select_missing_entire_obs(self, unsigned int t) nogil
+    cdef void _select_missing_partial_obs(self, unsigned int t) nogil
+    cdef int transform(self, unsigned int t, unsigned int transform_diagonalize, unsigned int transform_generalized_collapse) nogil
+    cdef int transform_diagonalize(self, unsigned int t) nogil
+    cdef int transform_generalized_collapse(self, unsigned int t) nogil
+    cpdef initialize_information(self)
+    cdef int transform_information(self, unsigned int t) nogil
+    cpdef initialize_blocks(self)
+    cdef int transform_blocks(self, unsigned int t) nogil
+    cdef void find_transition_structure(self, int transition_t) nogil
+    cdef void find_selection_index(self, int selection_t) nogil
 
 cdef int sselect_cov(int k, int k_posdef,
                            np.float32_t * tmp,
                            np.float32_t * selection,
                            np.float32_t * cov,
-                           np.float32_t * selected_cov)
+                           np.float32_t * selected_cov) nogil
+
+cdef int sselect_cov_index(int k, int k_posdef,
+                                 int * index,
+                                 np.float32_t * cov,
+                                 np.float32_t * selected_cov) nogil
 
 cdef int dselect_cov(int k, int k_posdef,
                            np.float64_t * tmp,
                            np.float64_t * selection,
                            np.float64_t * cov,
-                           np.float64_t * selected_cov)
+                           np.float64_t * selected_cov) nogil
+
+cdef int dselect_cov_index(int k, int k_posdef,
+                                 int * index,
+                                 np.float64_t * cov,
+                                 np.float64_t * selected_cov) nogil
 
 cdef int cselect_cov(int k, int k_posdef,
                            np.complex64_t * tmp,
                            np.complex64_t * selection,
                            np.complex64_t * cov,
-                           np.complex64_t * selected_cov)
+                           np.complex64_t * selected_cov) nogil
+
+cdef int cselect_cov_index(int k, int k_posdef,
+                                 int * index,
+                                 np.complex64_t * cov,
+                                 np.complex64_t * selected_cov) nogil
 
 cdef int zselect_cov(int k, int k_posdef,
                            np.complex128_t * tmp,
                            np.complex128_t * selection,
                            np.complex128_t * cov,
-                           np.complex128_t * selected_cov)
+                           np.complex128_t * selected_cov) nogil
+
+cdef int zselect_cov_index(int k, int k_posdef,
+                                 int * index,
+                                 np.complex128_t * cov,
+                                 np.complex128_t * selected_cov) nogil
+
@@ -7,11 +7,17 @@ License: Simplified-BSD
 from __future__ import division, absolute_import, print_function
 
 from warnings import warn
+import threading
 
 import numpy as np
-from .representation import OptionWrapper, Representation, FrozenRepresentation
+from .representation import (
+    OptionWrapper, Representation, FrozenRepresentation, _matrix_at,
+    _expand_matrix
+)
 from .tools import (
-    prefix_kalman_filter_map, validate_vector_shape, validate_matrix_shape
+    prefix_kalman_filter_map, prefix_loglikelihood_batch_map,
+    prefix_score_obs_map, prefix_dtype_map,
+    validate_vector_shape, validate_matrix_shape
 )
 
 # Define constants
@@ -23,6 +29,10 @@ FILTER_UNIVARIATE = 0x10       # ibid., Chapter 6.4
 FILTER_COLLAPSED = 0x20        # ibid., Chapter 6.5
 FILTER_EXTENDED = 0x40         # ibid., Chapter 10.2
 FILTER_UNSCENTED = 0x80        # ibid., Chapter 10.3
+FILTER_STEADY_STATE = 0x100    # ibid., Chapter 4.3.4
+FILTER_CHANDRASEKHAR = 0x200   # Herbst (2015)
+FILTER_INFORMATION = 0x400     # Anderson and Moore (1979), Chapter 6.3
+FILTER_BLOCK_SEQUENTIAL = 0x800 # cf. Durbin and Koopman (2012), Chapter 6.4
 
 INVERT_UNIVARIATE = 0x01
 SOLVE_LU = 0x02
@@ -40,6 +50,7 @@ MEMORY_NO_FILTERED = 0x04
 MEMORY_NO_LIKELIHOOD = 0x08
 MEMORY_NO_GAIN = 0x10
 MEMORY_NO_SMOOTHING = 0x20
+MEMORY_PACK_COV = 0x40
 MEMORY_CONSERVE = (
     MEMORY_NO_FORECAST | MEMORY_NO_PREDICTED | MEMORY_NO_FILTERED |
     MEMORY_NO_LIKELIHOOD | MEMORY_NO_GAIN | MEMORY_NO_SMOOTHING
@@ -48,6 +59,23 @@ MEMORY_CONSERVE = (
 TIMING_INIT_PREDICTED = 0
 TIMING_INIT_FILTERED = 1
 
+# Structures of the transition matrix exploited by the conventional filter
+TRANSITION_DENSE = 0
+TRANSITION_IDENTITY = 1
+TRANSITION_DIAGONAL = 2
+TRANSITION_BLOCK_DIAGONAL = 3
+TRANSITION_COMPANION = 4
+TRANSITION_TRANSPOSED_COMPANION = 5
+
+transition_structures = {
+    TRANSITION_DENSE: 'dense',
+    TRANSITION_IDENTITY: 'identity',
+    TRANSITION_DIAGONAL: 'diagonal',
+    TRANSITION_BLOCK_DIAGONAL: 'block_diagonal',
+    TRANSITION_COMPANION: 'companion',
+    TRANSITION_TRANSPOSED_COMPANION: 'transposed_companion',
+}
+
 class KalmanFilter(Representation):
     r"""
     State space representation of a time series process, with Kalman filter
@@ -69,6 +97,21 @@ class KalmanFilter(Representation):
     tolerance : float, optional
         The tolerance at which the Kalman filter determines convergence to
         steady-state. Default is 1e-19.
+    steady_state_start : int, optional
+        The period in which the steady-state filter (if it is used) switches
+        to the steady-state predicted state covariance matrix. Default is 0.
+    tolerance_diffuse : float, optional
+        The tolerance below which the diffuse part of the predicted state
+        covariance matrix is considered to be zero by the exact diffuse
+        initialization. Default is 1e-12.
+    small_kernels : bool, optional
+        Whether to use the unrolled kernels of the conventional filter for
+        models with a single observed variable and few states. Default is
+        True.
+    recovery_cache : bool, optional
+        Whether to cache (and re-use) the recovery of the filter to the
+        steady-state after periods with missing observations. Default is
+        True.
     results_class : class, optional
         Default results class to use to save filtering output. Default is
         `FilterResults`. If specified, class must extend from `FilterResults`.
@@ -133,7 +176,9 @@ class KalmanFilter(Representation):
     filter_methods = [
         'filter_conventional', 'filter_exact_initial', 'filter_augmented',
         'filter_square_root', 'filter_univariate', 'filter_collapsed',
-        'filter_extended', 'filter_unscented'
+        'filter_extended', 'filter_unscented', 'filter_steady_state',
+        'filter_chandrasekhar', 'filter_information',
+        'filter_block_sequential'
     ]
 
     filter_conventional = OptionWrapper('filter_method', FILTER_CONVENTIONAL)
@@ -142,7 +187,7 @@ class KalmanFilter(Representation):
     """
     filter_exact_initial = OptionWrapper('filter_method', FILTER_EXACT_INITIAL)
     """
-    (bool) Flag for exact initial Kalman filtering. Not implemented.
+    (bool) Flag for exact initial Kalman filtering.
     """
     filter_augmented = OptionWrapper('filter_method', FILTER_AUGMENTED)
     """
@@ -150,7 +195,7 @@ class KalmanFilter(Representation):
     """
     filter_square_root = OptionWrapper('filter_method', FILTER_SQUARE_ROOT)
     """
-    (bool) Flag for square-root Kalman filtering. Not implemented.
+    (bool) Flag for square-root Kalman filtering.
     """
     filter_univariate = OptionWrapper('filter_method', FILTER_UNIVARIATE)
     """
@@ -168,6 +213,26 @@ class KalmanFilter(Representation):
     """
     (bool) Flag for unscented Kalman filtering. Not implemented.
     """
+    filter_steady_state = OptionWrapper('filter_method', FILTER_STEADY_STATE)
+    """
+    (bool) Flag for steady-state Kalman filtering of time-invariant models.
+    """
+    filter_chandrasekhar = OptionWrapper('filter_method', FILTER_CHANDRASEKHAR)
+    """
+    (bool) Flag for Kalman filtering of time-invariant models using the
+    Chandrasekhar recursions.
+    """
+    filter_information = OptionWrapper('filter_method', FILTER_INFORMATION)
+    """
+    (bool) Flag for Kalman filtering with the measurement update computed in
+    information form.
+    """
+    filter_block_sequential = OptionWrapper('filter_method',
+                                            FILTER_BLOCK_SEQUENTIAL)
+    """
+    (bool) Flag for block-sequential filtering of multivariate observation
+    vector with block-diagonal observation covariance matrix.
+    """
 
     inversion_methods = [
         'invert_univariate', 'solve_lu', 'invert_lu', 'solve_cholesky',
@@ -211,7 +276,7 @@ class KalmanFilter(Representation):
     memory_options = [
         'memory_store_all', 'memory_no_forecast', 'memory_no_predicted',
         'memory_no_filtered', 'memory_no_likelihood', 'memory_no_gain',
-        'memory_no_smoothing', 'memory_conserve'
+        'memory_no_smoothing', 'memory_pack_cov', 'memory_conserve'
     ]
 
     memory_store_all = OptionWrapper('conserve_memory', MEMORY_STORE_ALL)
@@ -244,6 +309,10 @@ class KalmanFilter(Representation):
     """
     (bool) Flag to prevent storing temporary values used in smoothing.
     """
+    memory_pack_cov = OptionWrapper('conserve_memory', MEMORY_PACK_COV)
+    """
+    (bool) Flag to store covariance matrices in packed (lower triangular) form.
+    """
     memory_conserve = OptionWrapper('conserve_memory', MEMORY_CONSERVE)
     """
     (bool) Flag to conserve the maximum amount of memory.
@@ -284,7 +353,9 @@ class KalmanFilter(Representation):
     """
 
     def __init__(self, k_endog, k_states, k_posdef=None,
-                 loglikelihood_burn=0, tolerance=1e-19, results_class=None,
+                 loglikelihood_burn=0, tolerance=1e-19, steady_state_start=0,
+                 tolerance_diffuse=1e-12, small_kernels=True,
+                 recovery_cache=True, results_class=None,
                  kalman_filter_classes=None, **kwargs):
         super(KalmanFilter, self).__init__(
             k_endog, k_states, k_posdef, **kwargs
@@ -292,6 +363,12 @@ class KalmanFilter(Representation):
 
         # Setup the underlying Kalman filter storage
         self._kalman_filters = {}
+        # Statespace models and Kalman filters for each thread of
+        # `_loglike_batch`, by datatype prefix
+        self._batch_kalman_filters = {}
+        # Kalman filters used only to compute the loglikelihood (see
+        # `_filter_loglikelihood`)
+        self._loglikelihood_filters = {}
 
         # Filter options
         self.loglikelihood_burn = loglikelihood_burn
@@ -309,6 +386,10 @@ class KalmanFilter(Representation):
         self.set_filter_timing(**kwargs)
 
         self.tolerance = tolerance
+        self.steady_state_start = steady_state_start
+        self.tolerance_diffuse = tolerance_diffuse
+        self.small_kernels = small_kernels
+        self.recovery_cache = recovery_cache
 
     @property
     def _kalman_filter(self):
@@ -320,7 +401,9 @@ class KalmanFilter(Representation):
     def _initialize_filter(self, filter_method=None, inversion_method=None,
                            stability_method=None, conserve_memory=None,
                            tolerance=None, filter_timing=None,
-                           loglikelihood_burn=None):
+                           loglikelihood_burn=None, kalman_filters=None):
+        if kalman_filters is None:
+            kalman_filters = self._kalman_filters
         if filter_method is None:
             filter_method = self.filter_method
         if inversion_method is None:
@@ -346,11 +429,14 @@ class KalmanFilter(Representation):
 
         # Determine if we need to (re-)create the filter
         # (definitely need to recreate if we recreated the _statespace object)
-        create_filter = create_statespace or prefix not in self._kalman_filters
+        create_filter = create_statespace or prefix not in kalman_filters
         if not create_filter:
-            kalman_filter = self._kalman_filters[prefix]
+            kalman_filter = kalman_filters[prefix]
 
+            # (the statespace object may also have been re-created for
+            # another set of filters, e.g. by `_filter_loglikelihood`)
             create_filter = (
+                not kalman_filter.model is self._statespaces[prefix] or
                 not kalman_filter.conserve_memory == conserve_memory or
                 not kalman_filter.loglikelihood_burn == loglikelihood_burn
             )
@@ -358,19 +444,19 @@ class KalmanFilter(Representation):
         # If the dtype-specific _kalman_filter does not exist (or if we need
         # to re-create it), create it
         if create_filter:
-            if prefix in self._kalman_filters:
+            if prefix in kalman_filters:
                 # Delete the old filter
-                del self._kalman_filters[prefix]
+                del kalman_filters[prefix]
             # Setup the filter
             cls = self.prefix_kalman_filter_map[prefix]
-            self._kalman_filters[prefix] = cls(
+            kalman_filters[prefix] = cls(
                 self._statespaces[prefix], filter_method, inversion_method,
                 stability_method, conserve_memory, filter_timing, tolerance,
                 loglikelihood_burn
             )
         # Otherwise, update the filter parameters
         else:
-            kalman_filter = self._kalman_filters[prefix]
+            kalman_filter = kalman_filters[prefix]
             kalman_filter.set_filter_method(filter_method, False)
             kalman_filter.inversion_method = inversion_method
             kalman_filter.stability_method = stability_method
@@ -378,6 +464,14 @@ class KalmanFilter(Representation):
             kalman_filter.tolerance = tolerance
             # conserve_memory and loglikelihood_burn changes always lead to
             # re-created filters
+        # Options which are not part of the filter bitmasks (these apply to
+        # all of the filters, including those used only to compute the
+        # loglikelihood)
+        kalman_filter = kalman_filters[prefix]
+        kalman_filter.steady_state_start = self.steady_state_start
+        kalman_filter.tolerance_diffuse = self.tolerance_diffuse
+        kalman_filter.small_kernels = self.small_kernels
+        kalman_filter.recovery_cache = self.recovery_cache
 
         return prefix, dtype, create_filter, create_statespace
 
@@ -403,12 +497,77 @@ class KalmanFilter(Representation):
 
         FILTER_CONVENTIONAL = 0x01
             Conventional Kalman filter.
+        FILTER_EXACT_INITIAL = 0x02
+            Exact treatment of a diffuse initialization (see
+            `initialize_diffuse`). Will be used *in addition* to conventional
+            filtering. In the initial periods, the diffuse part of the
+            predicted state covariance matrix is propagated separately, and
+            the filter switches to the usual recursions once it has vanished,
+            so that no loglikelihood burn-in is required. Only available with
+            the predicted filter timing.
         FILTER_UNIVARIATE = 0x10
             Univariate approach to Kalman filtering. Overrides conventional
             method if both are specified.
         FILTER_COLLAPSED = 0x20
             Collapsed approach to Kalman filtering. Will be used *in addition*
             to conventional or univariate filtering.
+        FILTER_SQUARE_ROOT = 0x08
+            Square-root Kalman filtering. Will be used *in addition* to
+            conventional filtering. A lower triangular factor of the predicted
+            state covariance matrix is propagated using an orthogonal (QR)
+            transformation of a pre-array, so that the implied covariance
+            matrices are positive semi-definite by construction and no
+            symmetry-forcing is required. The factors are stored (in packed
+            lower triangular form) for every period. Only available for real
+            data types and the predicted filter timing.
+        FILTER_STEADY_STATE = 0x100
+            Steady-state Kalman filtering. Will be used *in addition* to
+            conventional filtering. The predicted state covariance matrix is
+            replaced by the solution to the discrete algebraic Riccati equation
+            in period `steady_state_start`, after which only the state mean
+            recursions are computed. The periods before `steady_state_start`
+            use the full recursions, so that this period controls the
+            finite-sample accuracy of the filter. Only available for
+            time-invariant models (the intercepts may be time-varying) without
+            missing observations.
+        FILTER_CHANDRASEKHAR = 0x200
+            Chandrasekhar recursions. Will be used *in addition* to
+            conventional filtering. The predicted state covariance matrix is
+            updated using a low-rank factorization of its increment, so that
+            each period requires :math:`O(m^2 p)` rather than :math:`O(m^3)`
+            operations if the model was initialized with the stationary
+            distribution. Only available for time-invariant models (the
+            intercepts may be time-varying) without missing observations.
+        FILTER_INFORMATION = 0x400
+            Information filter. Will be used *in addition* to conventional
+            filtering. The measurement update is computed in information form,
+            using :math:`Z_t' H_t^{-1} Z_t` and :math:`Z_t' H_t^{-1} v_t`, so
+            that the :math:`(p \times p)` forecast error covariance matrix is
+            not factorized. With a diagonal observation covariance matrix
+            each period then requires :math:`O(p m^2)` rather than
+            :math:`O(p^2 m + p^3)` operations, which is much faster for
+            models with many more observed variables than states.
+            :math:`Z_t' H_t^{-1} Z_t` is re-used as long as the design and
+            observation covariance matrices (and the pattern of missing
+            observations) do not change. Requires a positive definite
+            observation covariance matrix. The forecast error covariance
+            matrix is only formed if it is stored, and the quantities used by
+            the smoother if they may be required, so the full benefit is
+            obtained along with `memory_no_forecast` and
+            `memory_no_smoothing` (e.g. in `loglike`).
+        FILTER_BLOCK_SEQUENTIAL = 0x800
+            Block-sequential approach to Kalman filtering. Overrides
+            conventional method if both are specified. The observations are
+            processed sequentially in the blocks given by the block-diagonal
+            structure of the observation covariance matrix (which is detected
+            automatically, and need not be contiguous), so that each period
+            requires the Cholesky factorization of each (small) block of the
+            forecast error covariance matrix rather than of the full matrix.
+            Unlike univariate filtering, the observation covariance matrix is
+            not required to be diagonal. As in univariate filtering, only the
+            diagonal blocks of the forecast error covariance matrices are
+            computed. Cannot be combined with other filtering methods, and
+            the Kalman smoother is not available.
 
         If the bitmask is set directly via the `filter_method` argument, then
         the full method must be provided.
@@ -645,6 +804,12 @@ class KalmanFilter(Representation):
         MEMORY_NO_SMOOTHING = 0x20
             Do not store temporary variables related to Klaman smoothing. If
             this option is used, smoothing is unavailable.
+        MEMORY_PACK_COV = 0x40
+            Store only the lower triangles of the (symmetric) filtered and
+            predicted state covariance matrices and forecast error covariance
+            matrices, which requires about half of the memory. The full
+            matrices are recovered by the results object when first accessed.
+            If this option is used, smoothing is unavailable.
         MEMORY_CONSERVE
             Do not store any intermediate matrices.
 
@@ -710,7 +875,8 @@ class KalmanFilter(Representation):
 
     def filter(self, filter_method=None, inversion_method=None,
                stability_method=None, conserve_memory=None, filter_timing=None,
-               tolerance=None, loglikelihood_burn=None, results=None):
+               tolerance=None, loglikelihood_burn=None, results=None,
+               precision=None):
         r"""
         Apply the Kalman filter to the statespace model.
 
@@ -747,7 +913,24 @@ class KalmanFilter(Representation):
             returned as an ndarray.
             If None, then the default results object is updated with the
             result of filtering.
+        precision : {'single', 'double'}, optional
+            The floating point precision in which to run the filter, for this
+            call only. Default is the `precision` attribute. See
+            `Representation.precision` for more details.
         """
+        # Temporarily override the precision, if requested
+        if precision is not None:
+            _precision = self.precision
+            self.precision = precision
+            try:
+                return self.filter(
+                    filter_method, inversion_method, stability_method,
+                    conserve_memory, filter_timing, tolerance,
+                    loglikelihood_burn, results
+                )
+            finally:
+                self.precision = _precision
+
         # Set the class to be the default results class, if None provided
         if results is None:
             results = self.results_class
@@ -756,7 +939,7 @@ class KalmanFilter(Representation):
         prefix, dtype, create_filter, create_statespace = (
             self._initialize_filter(
                 filter_method, inversion_method, stability_method,
-                conserve_memory, filter_timing, tolerance, loglikelihood_burn
+                conserve_memory, tolerance, filter_timing, loglikelihood_burn
             )
         )
         kfilter = self._kalman_filters[prefix]
@@ -790,6 +973,137 @@ class KalmanFilter(Representation):
 
         return results
 
+    def filter_panel(self, panel, results=None, **kwargs):
+        r"""
+        Apply the Kalman filter to a panel of series sharing the model's
+        system matrices.
+
+        Parameters
+        ----------
+        panel : array_like
+            The panel of observations, shaped `k_endog x nobs x n_series`.
+        results : class or object, optional
+            If a class which is a subclass of PanelFilterResults, then that
+            class is instantiated and returned with the result of filtering.
+            If an object, then that object is updated with the new filtering
+            results. Default is PanelFilterResults.
+        **kwargs
+            Keyword arguments may be used to influence the filter method
+            (see `filter`).
+
+        Returns
+        -------
+        results : PanelFilterResults
+
+        Notes
+        -----
+        The forecast error and state covariance matrices do not depend on the
+        observations, so they are computed only once (from the bound dataset),
+        and are shared by all series in the panel. The state means, forecast
+        errors and loglikelihoods are computed for each series.
+
+        Panel mode is only available with the conventional Kalman filter
+        (without any other filter method, e.g. the square-root, Chandrasekhar,
+        information or block-sequential filters) under the default filter
+        timing, and neither the bound dataset nor the panel may contain
+        missing observations.
+        """
+        panel = np.asarray(panel)
+        if not (panel.ndim == 3 and
+                panel.shape[:2] == (self.k_endog, self.nobs)):
+            raise ValueError('Invalid dimensions for panel of observations.'
+                             ' Requires shape (%d, %d, n_series), got %s' %
+                             (self.k_endog, self.nobs, str(panel.shape)))
+
+        # Set the class to be the default results class, if None provided
+        if results is None:
+            results = PanelFilterResults
+
+        # Initialize the filter
+        prefix, dtype, create_filter, create_statespace = (
+            self._initialize_filter(**kwargs)
+        )
+        kfilter = self._kalman_filters[prefix]
+        statespace = self._statespaces[prefix]
+
+        # Instantiate a new results object, if required
+        new_results = False
+        if isinstance(results, type):
+            if not issubclass(results, PanelFilterResults):
+                raise ValueError
+            results = results(self)
+            new_results = True
+
+        # Initialize the state
+        self._initialize_state(prefix=prefix)
+
+        # Run the filter; the panel is stored internally as
+        # `k_endog x n_series x nobs` so that each period is contiguous
+        statespace.set_panel_obs(
+            np.asfortranarray(panel.transpose(0, 2, 1), dtype=dtype)
+        )
+        try:
+            kfilter()
+            if not new_results:
+                results.update_representation(self)
+            results.update_filter(kfilter)
+        finally:
+            statespace.set_panel_obs(None)
+
+        return results
+
+    def _filter_loglikelihood(self, filter_method=None, inversion_method=None,
+                              stability_method=None, conserve_memory=None,
+                              filter_timing=None, tolerance=None,
+                              loglikelihood_burn=None, results=None,
+                              precision=None):
+        """
+        Apply the Kalman filter for loglikelihood evaluation
+
+        The arguments are as in `filter`, except that `conserve_memory`,
+        `loglikelihood_burn` and `results` are ignored. Returns the underlying
+        Kalman filter object, in which the loglikelihood of each period is
+        stored.
+
+        Notes
+        -----
+        The Kalman filters used here are stored (for each prefix) separately
+        from those used by `filter`, and are configured to store only the
+        loglikelihood of each period (`MEMORY_CONSERVE` except for
+        `MEMORY_NO_LIKELIHOOD`). Since these filters are not re-created when
+        the memory conservation options of the model are changed (or vice
+        versa), repeated evaluations of the loglikelihood (e.g. during
+        numerical optimization) re-use their storage, and do not allocate or
+        fill the full filter output.
+        """
+        # Temporarily override the precision, if requested
+        if precision is not None:
+            _precision = self.precision
+            self.precision = precision
+            try:
+                return self._filter_loglikelihood(
+                    filter_method, inversion_method, stability_method,
+                    filter_timing=filter_timing, tolerance=tolerance
+                )
+            finally:
+                self.precision = _precision
+
+        prefix, dtype, create_filter, create_statespace = (
+            self._initialize_filter(
+                filter_method, inversion_method, stability_method,
+                MEMORY_CONSERVE & ~MEMORY_NO_LIKELIHOOD, tolerance,
+                filter_timing, loglikelihood_burn=0,
+                kalman_filters=self._loglikelihood_filters
+            )
+        )
+        kfilter = self._loglikelihood_filters[prefix]
+
+        # Initialize the state and run the filter
+        self._initialize_state(prefix=prefix)
+        kfilter()
+
+        return kfilter
+
     def loglike(self, loglikelihood_burn=None, **kwargs):
         r"""
         Calculate the loglikelihood associated with the statespace model.
@@ -813,8 +1127,8 @@ class KalmanFilter(Representation):
                                ' MEMORY_NO_LIKELIHOOD option is selected.')
         if loglikelihood_burn is None:
             loglikelihood_burn = self.loglikelihood_burn
-        kwargs['results'] = 'loglikelihood'
-        return np.sum(self.filter(**kwargs)[loglikelihood_burn:])
+        kfilter = self._filter_loglikelihood(**kwargs)
+        return np.sum(np.asarray(kfilter.loglikelihood)[loglikelihood_burn:])
 
     def loglikeobs(self, loglikelihood_burn=None, **kwargs):
         r"""
@@ -845,14 +1159,333 @@ class KalmanFilter(Representation):
                                ' MEMORY_NO_LIKELIHOOD option is selected.')
         if loglikelihood_burn is None:
             loglikelihood_burn = self.loglikelihood_burn
-        kwargs['results'] = 'loglikelihood'
-        llf_obs = self.filter(**kwargs)
+        kfilter = self._filter_loglikelihood(**kwargs)
+        llf_obs = np.array(kfilter.loglikelihood, copy=True)
 
         # Set any burned observations to have zero likelihood
         llf_obs[:loglikelihood_burn] = 0
 
         return llf_obs
 
+    def score_obs(self, partials, loglikelihood_burn=None):
+        r"""
+        Calculate the derivatives of the loglikelihood for each observation
+        with respect to a set of parameters.
+
+        Parameters
+        ----------
+        partials : dict
+            The partial derivatives of the representation matrices with
+            respect to each of the `k_params` parameters, keyed by matrix name
+            (e.g. 'design'). Each is shaped as the corresponding matrix (with
+            its time dimension, which can be of length 1 or `nobs`) with an
+            additional last dimension of length `k_params`; e.g. the entry for
+            'design' is shaped `k_endog x k_states x (1 or nobs) x k_params`.
+            Matrices that are not included are taken not to depend on the
+            parameters. For a known initialization, the partial derivatives of
+            the initial state and initial state covariance matrix may also be
+            given as 'initial_state' and 'initial_state_cov'.
+        loglikelihood_burn : int, optional
+            The number of initial periods during which the loglikelihood is not
+            recorded. Default is 0.
+
+        Returns
+        -------
+        score_obs : array
+            Array of derivatives of the loglikelihood values, shaped
+            `nobs x k_params`.
+
+        Notes
+        -----
+        The derivatives of the predicted state mean and covariance matrix with
+        respect to each parameter are carried through the Kalman filter
+        recursions (Harvey, 1989, section 3.4.6), so that the score for every
+        observation is computed in a single forward pass; the recursions are
+        computed (in double precision) by `score_obs` in `_kalman_filter`.
+        The partial derivatives of covariance matrices are assumed to be
+        symmetric.
+
+        The recursions are those of the conventional Kalman filter; since the
+        loglikelihood does not depend on the filtering method, the results
+        apply to any of them.
+
+        References
+        ----------
+        Harvey, Andrew C. 1990.
+        Forecasting, Structural Time Series Models and the Kalman Filter.
+        Cambridge University Press.
+        """
+        if loglikelihood_burn is None:
+            loglikelihood_burn = self.loglikelihood_burn
+        if self.initialization is None:
+            raise RuntimeError('Statespace model not initialized.')
+        if self.initialization == 'diffuse':
+            raise NotImplementedError('Analytic scores are not available with'
+                                      ' the exact diffuse initialization.')
+
+        k_params = None
+        for partial in partials.values():
+            k_params = partial.shape[-1]
+        if k_params is None:
+            return np.zeros((self.nobs, 0))
+
+        # The recursions are computed in double precision
+        prefix = 'z' if self.prefix in ['c', 'z'] else 'd'
+        dtype = prefix_dtype_map[prefix]
+        self._initialize_representation(prefix=prefix)
+        self._initialize_state(prefix=prefix)
+        statespace = self._statespaces[prefix]
+
+        # Partial derivatives of the representation matrices, with the
+        # parameters along the next-to-last dimension (as required by
+        # `score_obs` in `_kalman_filter`)
+        def get(name):
+            matrix = getattr(self, '_' + name)
+            if name in partials:
+                partial = np.swapaxes(np.asarray(partials[name]), -1, -2)
+            else:
+                partial = np.zeros(matrix.shape[:-1] + (k_params, 1))
+            return np.asfortranarray(partial, dtype=dtype)
+
+        matrices = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                    'state_intercept', 'selection', 'state_cov']
+        partial_matrices = dict([(name, get(name)) for name in matrices])
+
+        # Partial derivatives of the initial state
+        initial_state = np.zeros((self.k_states, k_params), dtype=dtype,
+                                 order='F')
+        initial_state_cov = np.zeros((self.k_states, self.k_states, k_params),
+                                     dtype=dtype, order='F')
+        if self.initialization == 'known':
+            if 'initial_state' in partials:
+                initial_state[:] = partials['initial_state']
+            if 'initial_state_cov' in partials:
+                initial_state_cov[:] = partials['initial_state_cov']
+
+        score_obs = prefix_score_obs_map[prefix](
+            statespace, initial_state, initial_state_cov,
+            *[partial_matrices[name] for name in matrices],
+            stationary=self.initialization == 'stationary',
+            filter_timing=self.filter_timing,
+            loglikelihood_burn=loglikelihood_burn
+        )
+        return score_obs
+
+    def _batch_representation(self):
+        """
+        Snapshot the current representation matrices and initialization, for
+        use as an element of a batch in `_loglike_batch`.
+        """
+        representation = {}
+        for matrix in self.shapes.keys():
+            if not matrix == 'obs':
+                representation[matrix] = getattr(self, '_' + matrix).copy()
+
+        if self.initialization == 'known':
+            initialization = ('known', self._initial_state.copy(),
+                              self._initial_state_cov.copy())
+        elif self.initialization == 'approximate_diffuse':
+            initialization = ('approximate_diffuse', self._initial_variance)
+        elif self.initialization == 'stationary':
+            initialization = ('stationary',)
+        elif self.initialization == 'diffuse':
+            initialization = ('diffuse', self._initial_state.copy(),
+                              self._initial_state_cov.copy(),
+                              self._initial_diffuse_state_cov.copy())
+        else:
+            raise RuntimeError('Statespace model not initialized.')
+
+        return representation, initialization
+
+    def _loglike_batch(self, batch, nthreads=1, **kwargs):
+        """
+        Calculate the loglikelihood for each of a batch of representations.
+
+        Parameters
+        ----------
+        batch : list
+            List of (representation, initialization) tuples, as returned by
+            `_batch_representation`.
+        nthreads : int, optional
+            The number of threads across which to split the batch. Default is
+            1.
+        **kwargs
+            Additional keyword arguments to pass to the Kalman filter. See
+            `KalmanFilter.filter` for more details.
+
+        Returns
+        -------
+        loglike : array
+            The joint loglikelihood for each element of the batch.
+
+        Notes
+        -----
+        The matrices of the elements of the batch are stacked, and each
+        thread evaluates its part of the batch in a single call to the
+        underlying Kalman filter (see `_batch_kalman_filter`).
+        """
+        if self.memory_no_likelihood:
+            raise RuntimeError('Cannot compute loglikelihood if'
+                               ' MEMORY_NO_LIKELIHOOD option is selected.')
+
+        # Initialize the filter (this sets the filter options and makes sure
+        # the dtype-specific representation is available)
+        prefix, dtype, create_filter, create_statespace = (
+            self._initialize_filter(**kwargs)
+        )
+        kfilter = self._kalman_filters[prefix]
+
+        # Stack the representation matrices and the initialization of the
+        # elements of the batch along a trailing axis
+        nbatch = len(batch)
+        k_states = self.k_states
+        stacked = {}
+        for name, matrix in self._representations[prefix].items():
+            if not name == 'obs':
+                stacked[name] = np.zeros(matrix.shape + (nbatch,),
+                                         dtype=dtype, order='F')
+        initialization = []
+        initial_state = np.zeros((k_states, nbatch), dtype=dtype, order='F')
+        initial_state_cov = np.zeros((k_states, k_states, nbatch),
+                                     dtype=dtype, order='F')
+        initial_diffuse_state_cov = np.zeros((k_states, k_states, nbatch),
+                                             dtype=dtype, order='F')
+        initial_variance = np.zeros(nbatch)
+        for i in range(nbatch):
+            representation, element_initialization = batch[i]
+            for name, matrix in representation.items():
+                stacked[name][..., i] = matrix
+            initialization.append(element_initialization[0])
+            if element_initialization[0] in ['known', 'diffuse']:
+                initial_state[:, i] = element_initialization[1]
+                initial_state_cov[:, :, i] = element_initialization[2]
+            if element_initialization[0] == 'diffuse':
+                initial_diffuse_state_cov[:, :, i] = element_initialization[3]
+            elif element_initialization[0] == 'approximate_diffuse':
+                initial_variance[i] = element_initialization[1]
+
+        # Split the batch into one chunk per thread
+        nthreads = max(1, min(nthreads, nbatch))
+        chunks = np.array_split(np.arange(nbatch), nthreads)
+        loglikelihood_batch = prefix_loglikelihood_batch_map[prefix]
+        batch_kfilters = [self._batch_kalman_filter(prefix, i)
+                          for i in range(nthreads)]
+        # (the loglikelihood is accumulated in double precision)
+        llf = np.zeros(nbatch, dtype=np.result_type(dtype, np.float64))
+        errors = []
+
+        def run(thread):
+            chunk = slice(chunks[thread][0], chunks[thread][-1] + 1)
+            try:
+                llf[chunk] = loglikelihood_batch(
+                    batch_kfilters[thread],
+                    *[np.asfortranarray(stacked[name][..., chunk])
+                      for name in ['design', 'obs_intercept', 'obs_cov',
+                                   'transition', 'state_intercept',
+                                   'selection', 'state_cov']] +
+                    [initialization[chunk],
+                     np.asfortranarray(initial_state[:, chunk]),
+                     np.asfortranarray(initial_state_cov[..., chunk]),
+                     np.asfortranarray(initial_diffuse_state_cov[..., chunk]),
+                     initial_variance[chunk]]
+                )
+            except Exception as e:
+                errors.append(e)
+
+        if nthreads == 1:
+            run(0)
+        else:
+            threads = [threading.Thread(target=run, args=(thread,))
+                       for thread in range(nthreads)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if len(errors) > 0:
+            raise errors[0]
+
+        return llf
+
+    def _batch_kalman_filter(self, prefix, thread):
+        """
+        Statespace model and Kalman filter for a thread of `_loglike_batch`.
+
+        Each thread gets its own copy of the statespace model and the Kalman
+        filter, since the representation matrices are overwritten for each
+        element of a batch. The copies are retained between batches, and are
+        only re-created if the statespace model or the options fixed when the
+        Kalman filter is created have since changed; otherwise the data,
+        regimes, matrices given by exogenous data and remaining filter
+        options are updated from those of the model.
+        """
+        kfilter = self._kalman_filters[prefix]
+        model = kfilter.model
+        representations = self._representations[prefix]
+        # (as for `_filter_loglikelihood`, only the loglikelihood of each
+        # period is stored)
+        options = (kfilter.filter_method, kfilter.inversion_method,
+                   kfilter.stability_method,
+                   MEMORY_CONSERVE & ~MEMORY_NO_LIKELIHOOD,
+                   kfilter.filter_timing, kfilter.tolerance,
+                   kfilter.loglikelihood_burn)
+
+        cache = self._batch_kalman_filters.setdefault(prefix, [])
+        if thread < len(cache):
+            source, obs, cached_options, batch_kfilter = cache[thread]
+            statespace = batch_kfilter.model
+            create = not (source is model and cached_options == options)
+            if not create and representations['obs'] is not obs:
+                try:
+                    statespace.set_obs(representations['obs'])
+                except ValueError:
+                    create = True
+        else:
+            create = True
+
+        if create:
+            cls = self.prefix_statespace_map[prefix]
+            statespace = cls(*[
+                representations[name] if name == 'obs' else
+                representations[name].copy(order='F')
+                for name in ['obs', 'design', 'obs_intercept', 'obs_cov',
+                             'transition', 'state_intercept', 'selection',
+                             'state_cov']
+            ] + [model.regimes])
+            batch_kfilter = self.prefix_kalman_filter_map[prefix](
+                statespace, *options
+            )
+        else:
+            if statespace.k_exog > 0:
+                statespace.set_exog_matrices(None)
+            if model.regimes or statespace.regimes:
+                statespace.set_regimes(model.regimes)
+
+        if model.k_exog > 0:
+            # (the coefficients are not part of a batch element, so they are
+            # shared with the model)
+            statespace.set_exog_matrices(*[
+                None if matrix is None else np.asarray(matrix)
+                for matrix in [
+                    model.exog_data, model.design_coefficients,
+                    model.obs_intercept_coefficients,
+                    model.state_intercept_coefficients]
+            ])
+        statespace.subset_design = model.subset_design
+        if model.n_series > 0 or statespace.n_series > 0:
+            statespace.set_panel_obs(
+                np.asarray(model.panel_obs) if model.n_series > 0 else None)
+        for name in ['steady_state_start', 'tolerance_diffuse',
+                     'small_kernels', 'recovery_cache']:
+            setattr(batch_kfilter, name, getattr(kfilter, name))
+
+        entry = (model, representations['obs'], options, batch_kfilter)
+        if thread < len(cache):
+            cache[thread] = entry
+        else:
+            cache.append(entry)
+        return batch_kfilter
+
     def simulate(self, nsimulations, measurement_shocks=None,
                  state_shocks=None, initial_state=None):
         r"""
@@ -952,8 +1585,6 @@ class KalmanFilter(Representation):
 
     def _simulate(self, nsimulations, measurement_shocks, state_shocks,
                   initial_state):
-        time_invariant = self.time_invariant
-
         # Holding variables for the simulations
         simulated_obs = np.zeros((nsimulations, self.k_endog),
                                  dtype=self.dtype)
@@ -962,40 +1593,28 @@ class KalmanFilter(Representation):
         simulated_states[0] = initial_state
 
         # Perform iterations to create the new time series
-        obs_intercept_t = 0
-        design_t = 0
-        state_intercept_t = 0
-        transition_t = 0
-        selection_t = 0
         for t in range(nsimulations):
             # Get the current shocks (this accomodates time-varying matrices)
             if measurement_shocks is None:
                 measurement_shock = np.random.multivariate_normal(
-                    mean=np.zeros(self.k_endog), cov=self['obs_cov', :, :, t])
+                    mean=np.zeros(self.k_endog),
+                    cov=_matrix_at(self, 'obs_cov', t))
             else:
                 measurement_shock = measurement_shocks[t]
 
             if state_shocks is None:
                 state_shock = np.random.multivariate_normal(
                     mean=np.zeros(self.k_posdef),
-                    cov=self['state_cov', :, :, t])
+                    cov=_matrix_at(self, 'state_cov', t))
             else:
                 state_shock = state_shocks[t]
 
             # Get current-iteration matrices
-            if not time_invariant:
-                obs_intercept_t = 0 if self.obs_intercept.shape[-1] == 1 else t
-                design_t = 0 if self.design.shape[-1] == 1 else t
-                state_intercept_t = (
-                    0 if self.state_intercept.shape[-1] == 1 else t)
-                transition_t = 0 if self.transition.shape[-1] == 1 else t
-                selection_t = 0 if self.selection.shape[-1] == 1 else t
-
-            obs_intercept = self['obs_intercept', :, obs_intercept_t]
-            design = self['design', :, :, design_t]
-            state_intercept = self['state_intercept', :, state_intercept_t]
-            transition = self['transition', :, :, transition_t]
-            selection = self['selection', :, :, selection_t]
+            obs_intercept = _matrix_at(self, 'obs_intercept', t)
+            design = _matrix_at(self, 'design', t)
+            state_intercept = _matrix_at(self, 'state_intercept', t)
+            transition = _matrix_at(self, 'transition', t)
+            selection = _matrix_at(self, 'selection', t)
 
             # Iterate the measurement equation
             simulated_obs[t] = (
@@ -1076,15 +1695,15 @@ class KalmanFilter(Representation):
         # Orthogonalize the impulses, if requested, using Cholesky on the
         # first state covariance matrix
         if orthogonalized:
-            state_chol = np.linalg.cholesky(self.state_cov[:,:,0])
+            state_chol = np.linalg.cholesky(self._state_cov[:,:,0])
             impulse = np.dot(state_chol, impulse)
 
         # If we have a time-invariant system, we can solve for the IRF directly
         if self.time_invariant:
             # Get the state space matrices
-            design = self.design[:, :, 0]
-            transition = self.transition[:, :, 0]
-            selection = self.selection[:, :, 0]
+            design = self._design[:, :, 0]
+            transition = self._transition[:, :, 0]
+            selection = self._selection[:, :, 0]
 
             # Holding arrays
             irf = np.zeros((steps, self.k_endog), dtype=self.dtype)
@@ -1106,7 +1725,9 @@ class KalmanFilter(Representation):
             for name, shape in self.shapes.items():
                 if name in ['obs', 'obs_intercept', 'state_intercept']:
                     continue
-                representation[name] = getattr(self, name)
+                # Piecewise-constant matrices and matrices given by
+                # exogenous data are expanded to each period
+                representation[name] = _expand_matrix(self, name)
 
             # Allow additional specification
             warning = ('Model has time-invariant %s matrix, so the %s'
@@ -1255,14 +1876,41 @@ class FilterResults(FrozenRepresentation):
         The predicted state vector at each time period.
     predicted_state_cov : array
         The predicted state covariance matrix at each time period.
+    filtered_state_cov_packed : array
+        If the covariance matrices were stored in packed form (see
+        `MEMORY_PACK_COV`), stores the lower triangle (by column) of the
+        filtered state covariance matrix at each time period, from which
+        `filtered_state_cov` is computed when first accessed. Otherwise None.
+    predicted_state_cov_packed : array
+        As `filtered_state_cov_packed`, for the predicted state covariance
+        matrices.
+    predicted_state_cov_factor : array
+        If filtering using the square-root filter, stores the lower triangular
+        factor of the predicted state covariance matrix at each time period,
+        in packed (by column) form. Otherwise None.
     kalman_gain : array
         The Kalman gain at each time period.
+    nobs_diffuse : int
+        The number of (initial) time periods in which the diffuse recursions
+        were used, if filtering with the exact diffuse initialization.
+    predicted_diffuse_state_cov : array
+        If filtering with the exact diffuse initialization, stores the diffuse
+        part of the predicted state covariance matrix at each time period
+        (in which case `predicted_state_cov` holds the non-diffuse part in
+        the diffuse periods). Otherwise None.
+    forecasts_error_diffuse_cov : array
+        If filtering with the exact diffuse initialization, stores the diffuse
+        part of the forecast error covariance matrix at each time period.
+        Otherwise None.
     forecasts : array
         The one-step-ahead forecasts of observations at each time period.
     forecasts_error : array
         The forecast errors at each time period.
     forecasts_error_cov : array
         The forecast error covariance matrices at each time period.
+    forecasts_error_cov_packed : array
+        As `filtered_state_cov_packed`, for the forecast error covariance
+        matrices.
     llf_obs : array
         The loglikelihood values at each time period.
     collapsed_forecasts : array
@@ -1275,16 +1923,27 @@ class FilterResults(FrozenRepresentation):
         If filtering using collapsed observations, stores the one-step-ahead
         forecast error covariance matrices of collapsed observations at each
         time period.
+    transition_structure : list of str
+        The structure of the transition matrix detected by the filter, for
+        each of its slices (so that it has a single element unless the
+        transition matrix is time-varying): one of 'identity', 'diagonal',
+        'block_diagonal', 'companion', 'transposed_companion' or 'dense'.
+        The prediction step of the conventional filter exploits any structure
+        other than 'dense'. An element is None if the slice was not used.
     """
     _filter_attributes = [
         'filter_method', 'inversion_method', 'stability_method',
         'conserve_memory', 'filter_timing', 'tolerance', 'loglikelihood_burn',
         'converged', 'period_converged', 'filtered_state',
+        'filtered_state_cov_packed', 'predicted_state_cov_packed',
+        'forecasts_error_cov_packed',
         'filtered_state_cov', 'predicted_state', 'predicted_state_cov',
-        'kalman_gain', 'tmp1', 'tmp2', 'tmp3', 'tmp4', 'forecasts',
-        'forecasts_error', 'forecasts_error_cov', 'llf_obs',
+        'predicted_state_cov_factor', 'kalman_gain', 'tmp1', 'tmp2', 'tmp3',
+        'tmp4', 'forecasts', 'forecasts_error', 'forecasts_error_cov',
+        'llf_obs', 'nobs_diffuse', 'predicted_diffuse_state_cov',
+        'forecasts_error_diffuse_cov',
         'collapsed_forecasts', 'collapsed_forecasts_error',
-        'collapsed_forecasts_error_cov',
+        'collapsed_forecasts_error_cov', 'transition_structure',
     ]
 
     _filter_options = (
@@ -1354,20 +2013,76 @@ class FilterResults(FrozenRepresentation):
         self.tolerance = kalman_filter.tolerance
         self.loglikelihood_burn = kalman_filter.loglikelihood_burn
 
+        # Save the structure of the transition matrix
+        structures = np.asarray(kalman_filter.model.transition_structure)
+        self.transition_structure = [
+            transition_structures.get(structure) for structure in structures
+        ]
+
         # Save Kalman filter output
         self.converged = bool(kalman_filter.converged)
         self.period_converged = kalman_filter.period_converged
 
+        # If the covariance matrices were stored in packed form, they are
+        # only unpacked when first accessed
+        self.filtered_state_cov_packed = None
+        self.predicted_state_cov_packed = None
+        self.forecasts_error_cov_packed = None
+        if self.conserve_memory & MEMORY_PACK_COV:
+            if kalman_filter.filtered_state_cov_packed is not None:
+                self.filtered_state_cov_packed = np.array(
+                    kalman_filter.filtered_state_cov_packed, copy=True
+                )
+            if kalman_filter.predicted_state_cov_packed is not None:
+                self.predicted_state_cov_packed = np.array(
+                    kalman_filter.predicted_state_cov_packed, copy=True
+                )
+            if kalman_filter.forecast_error_cov_packed is not None:
+                self.forecasts_error_cov_packed = np.array(
+                    kalman_filter.forecast_error_cov_packed, copy=True
+                )
+
         self.filtered_state = np.array(kalman_filter.filtered_state, copy=True)
-        self.filtered_state_cov = np.array(
-            kalman_filter.filtered_state_cov, copy=True
-        )
+        self.filtered_state_cov = None
+        if self.filtered_state_cov_packed is None:
+            self.filtered_state_cov = np.array(
+                kalman_filter.filtered_state_cov, copy=True
+            )
         self.predicted_state = np.array(
             kalman_filter.predicted_state, copy=True
         )
-        self.predicted_state_cov = np.array(
-            kalman_filter.predicted_state_cov, copy=True
-        )
+        self.predicted_state_cov = None
+        if self.predicted_state_cov_packed is None:
+            self.predicted_state_cov = np.array(
+                kalman_filter.predicted_state_cov, copy=True
+            )
+        # The square-root filter stores the factors of the predicted state
+        # covariance matrices for all time periods, so that they can be
+        # recovered even if the filter did not store them (the filter method
+        # may have been overridden for this call, so check it directly)
+        self.predicted_state_cov_factor = None
+        if self.filter_method & FILTER_SQUARE_ROOT:
+            self.predicted_state_cov_factor = np.array(
+                kalman_filter.predicted_state_cov_factor, copy=True
+            )
+            if self.memory_no_predicted:
+                factor = self.unpack_predicted_state_cov_factor()
+                self.predicted_state_cov = np.einsum(
+                    'ijt,kjt->ikt', factor, factor
+                )
+        # The exact diffuse initialization stores the diffuse parts of the
+        # covariance matrices (these are zero after the diffuse periods)
+        self.nobs_diffuse = 0
+        self.predicted_diffuse_state_cov = None
+        self.forecasts_error_diffuse_cov = None
+        if self.filter_method & FILTER_EXACT_INITIAL:
+            self.nobs_diffuse = kalman_filter.nobs_diffuse
+            self.predicted_diffuse_state_cov = np.array(
+                kalman_filter.predicted_diffuse_state_cov, copy=True
+            )
+            self.forecasts_error_diffuse_cov = np.array(
+                kalman_filter.forecast_error_diffuse_cov, copy=True
+            )
         self.kalman_gain = np.array(kalman_filter.kalman_gain, copy=True)
         # In the partially missing data case, various entries will
         # be in the first rows rather than the correct rows
@@ -1392,9 +2107,11 @@ class FilterResults(FrozenRepresentation):
         self.forecasts_error = np.array(
             kalman_filter.forecast_error, copy=True
         )
-        self.forecasts_error_cov = np.array(
-            kalman_filter.forecast_error_cov, copy=True
-        )
+        self.forecasts_error_cov = None
+        if self.forecasts_error_cov_packed is None:
+            self.forecasts_error_cov = np.array(
+                kalman_filter.forecast_error_cov, copy=True
+            )
         self.llf_obs = np.array(kalman_filter.loglikelihood, copy=True)
 
         # If there was missing data, save the original values from the Kalman
@@ -1441,9 +2158,9 @@ class FilterResults(FrozenRepresentation):
         # Construct the predictions, forecasts
         if not (self.memory_no_forecast or self.memory_no_predicted):
             for t in range(self.nobs):
-                design_t = 0 if self.design.shape[2] == 1 else t
-                obs_cov_t = 0 if self.obs_cov.shape[2] == 1 else t
-                obs_intercept_t = 0 if self.obs_intercept.shape[1] == 1 else t
+                design = _matrix_at(self, 'design', t)
+                obs_cov = _matrix_at(self, 'obs_cov', t)
+                obs_intercept = _matrix_at(self, 'obs_intercept', t)
 
                 # For completely missing observations, the Kalman filter will
                 # produce forecasts, but forecast errors and the forecast
@@ -1468,33 +2185,117 @@ class FilterResults(FrozenRepresentation):
                     # the forecasts, etc. provided by the Kalman filter, from which
                     # the data can be retrieved if desired.
                     self.forecasts[:, t] = np.dot(
-                        self.design[:, :, design_t], self.predicted_state[:, t]
-                    ) + self.obs_intercept[:, obs_intercept_t]
+                        design, self.predicted_state[:, t]
+                    ) + obs_intercept
                     self.forecasts_error[:, t] = np.nan
                     self.forecasts_error[mask, t] = (
                         self.endog[mask, t] - self.forecasts[mask, t])
                     self.forecasts_error_cov[:, :, t] = np.dot(
-                        np.dot(self.design[:, :, design_t],
+                        np.dot(design,
                                self.predicted_state_cov[:, :, t]),
-                        self.design[:, :, design_t].T
-                    ) + self.obs_cov[:, :, obs_cov_t]
+                        design.T
+                    ) + obs_cov
                 # In the collapsed case, everything just needs to be rebuilt
                 # for the original observed data, since the Kalman filter
                 # produced these values for the collapsed data.
                 elif self.filter_collapsed:
                     self.forecasts[:, t] = np.dot(
-                        self.design[:, :, design_t], self.predicted_state[:, t]
-                    ) + self.obs_intercept[:, obs_intercept_t]
+                        design, self.predicted_state[:, t]
+                    ) + obs_intercept
 
                     self.forecasts_error[:, t] = (
                         self.endog[:, t] - self.forecasts[:, t]
                     )
 
                     self.forecasts_error_cov[:, :, t] = np.dot(
-                        np.dot(self.design[:, :, design_t],
+                        np.dot(design,
                                self.predicted_state_cov[:, :, t]),
-                        self.design[:, :, design_t].T
-                    ) + self.obs_cov[:, :, obs_cov_t]
+                        design.T
+                    ) + obs_cov
+
+    def unpack_predicted_state_cov_factor(self):
+        """
+        Lower triangular factors of the predicted state covariance matrices
+
+        Returns
+        -------
+        factor : array
+            Array of shape (k_states, k_states, nobs + 1) such that
+            `factor[:, :, t].dot(factor[:, :, t].T)` is the predicted state
+            covariance matrix for time t.
+
+        Notes
+        -----
+        Only available if the square-root filter was used.
+        """
+        if self.predicted_state_cov_factor is None:
+            raise RuntimeError('Predicted state covariance matrix factors are'
+                               ' only available when using the square-root'
+                               ' Kalman filter.')
+        nobs = self.predicted_state_cov_factor.shape[1]
+        factor = np.zeros((self.k_states, self.k_states, nobs),
+                          dtype=self.predicted_state_cov_factor.dtype)
+        # Packed by column, so the row-major upper triangular indices give
+        # the (column, row) pairs
+        cols, rows = np.triu_indices(self.k_states)
+        factor[rows, cols] = self.predicted_state_cov_factor
+        return factor
+
+    @staticmethod
+    def _unpack_symmetric(packed):
+        # Packed by column, so the row-major upper triangular indices give
+        # the (column, row) pairs of the lower triangle
+        n = int(np.sqrt(8 * packed.shape[0] + 1) - 1) // 2
+        unpacked = np.zeros((n, n, packed.shape[1]), dtype=packed.dtype)
+        cols, rows = np.triu_indices(n)
+        unpacked[rows, cols] = packed
+        unpacked[cols, rows] = packed
+        return unpacked
+
+    @property
+    def filtered_state_cov(self):
+        """
+        Filtered state covariance matrices
+        """
+        if (self._filtered_state_cov is None and
+                self.filtered_state_cov_packed is not None):
+            self._filtered_state_cov = self._unpack_symmetric(
+                self.filtered_state_cov_packed)
+        return self._filtered_state_cov
+
+    @filtered_state_cov.setter
+    def filtered_state_cov(self, value):
+        self._filtered_state_cov = value
+
+    @property
+    def predicted_state_cov(self):
+        """
+        Predicted state covariance matrices
+        """
+        if (self._predicted_state_cov is None and
+                self.predicted_state_cov_packed is not None):
+            self._predicted_state_cov = self._unpack_symmetric(
+                self.predicted_state_cov_packed)
+        return self._predicted_state_cov
+
+    @predicted_state_cov.setter
+    def predicted_state_cov(self, value):
+        self._predicted_state_cov = value
+
+    @property
+    def forecasts_error_cov(self):
+        """
+        Forecast error covariance matrices
+        """
+        if (self._forecasts_error_cov is None and
+                self.forecasts_error_cov_packed is not None):
+            self._forecasts_error_cov = self._unpack_symmetric(
+                self.forecasts_error_cov_packed)
+        return self._forecasts_error_cov
+
+    @forecasts_error_cov.setter
+    def forecasts_error_cov(self, value):
+        self._forecasts_error_cov = value
 
     @property
     def standardized_forecasts_error(self):
@@ -1640,7 +2441,9 @@ class FilterResults(FrozenRepresentation):
         for name, shape in self.shapes.items():
             if name == 'obs':
                 continue
-            representation[name] = getattr(self, name)
+            # Piecewise-constant matrices and matrices given by exogenous
+            # data are expanded to each period
+            representation[name] = _expand_matrix(self, name)
 
         # Update the matrices from kwargs for forecasts
         warning = ('Model has time-invariant %s matrix, so the %s'
@@ -1734,7 +2537,10 @@ class FilterResults(FrozenRepresentation):
         # Save this (which shares memory with the memoryview on which the
         # Kalman filter will be operating) so that we can replace actual data
         # with predicted data during dynamic forecasting
+        # (it may also share memory with the data bound to the model, so the
+        # actual data is restored afterwards)
         endog = model._representations[model.prefix]['obs']
+        dynamic_endog = endog[:, nstatic:nstatic + ndynamic].copy()
 
         # print(nstatic, ndynamic, nforecast, model.nobs)
 
@@ -1764,6 +2570,7 @@ class FilterResults(FrozenRepresentation):
             # Perform any (one-step-ahead) forecasting
             else:
                 next(kfilter)
+        endog[:, nstatic:nstatic + ndynamic] = dynamic_endog
 
         # Return the predicted state and predicted state covariance matrices
         results = FilterResults(model)
@@ -1771,6 +2578,84 @@ class FilterResults(FrozenRepresentation):
         return results
 
 
+class PanelFilterResults(FilterResults):
+    r"""
+    Results from applying the Kalman filter to a panel of series sharing a
+    state space model.
+
+    Parameters
+    ----------
+    model : Representation
+        A Statespace representation
+
+    Attributes
+    ----------
+    n_series : int
+        The number of series in the panel.
+    panel_filtered_state : array
+        The filtered state vector of each series at each time period,
+        shaped `k_states x nobs x n_series`.
+    panel_predicted_state : array
+        The predicted state vector of each series at each time period,
+        shaped `k_states x (nobs + 1) x n_series`.
+    panel_forecasts_error : array
+        The forecast errors of each series at each time period, shaped
+        `k_endog x nobs x n_series`.
+    panel_llf_obs : array
+        The loglikelihood values of each series at each time period, shaped
+        `nobs x n_series`.
+
+    Notes
+    -----
+    All other attributes are those of `FilterResults`, and refer to the
+    dataset bound to the model. In particular the covariance matrices (e.g.
+    `predicted_state_cov`, `forecasts_error_cov`) are shared by all series in
+    the panel.
+    """
+    _filter_attributes = FilterResults._filter_attributes + [
+        'n_series', 'panel_filtered_state', 'panel_predicted_state',
+        'panel_forecasts_error', 'panel_llf_obs'
+    ]
+
+    _attributes = FrozenRepresentation._model_attributes + _filter_attributes
+
+    def update_filter(self, kalman_filter):
+        """
+        Update the filter results
+
+        Parameters
+        ----------
+        kalman_filter : KalmanFilter
+            The model object from which to take the updated values.
+
+        Notes
+        -----
+        This method is rarely required except for internal usage.
+        """
+        super(PanelFilterResults, self).update_filter(kalman_filter)
+
+        self.n_series = kalman_filter.n_series
+        self.panel_filtered_state = np.array(
+            kalman_filter.panel_filtered_state, copy=True
+        ).transpose(0, 2, 1)
+        self.panel_predicted_state = np.array(
+            kalman_filter.panel_predicted_state, copy=True
+        ).transpose(0, 2, 1)
+        self.panel_forecasts_error = np.array(
+            kalman_filter.panel_forecast_error, copy=True
+        ).transpose(0, 2, 1)
+        self.panel_llf_obs = np.array(
+            kalman_filter.panel_loglikelihood, copy=True
+        ).T
+
+    @property
+    def panel_llf(self):
+        """
+        (array) The loglikelihood of each series in the panel.
+        """
+        return np.sum(self.panel_llf_obs[self.loglikelihood_burn:], axis=0)
+
+
 class PredictionResults(FilterResults):
     r"""
     Results of in-sample and out-of-sample prediction for state space models
@@ -1901,7 +2786,9 @@ class PredictionResults(FilterResults):
                 # Subset to the correct time frame
                 value = value[..., self.start:self.end]
             elif attr in self.representation_attributes:
-                value = getattr(self.results, attr).copy()
+                # Expand a piecewise-constant matrix or a matrix given by
+                # exogenous data to each period
+                value = _expand_matrix(self.results, attr).copy()
                 # If a time-invariant matrix, return it. Otherwise, subset to
                 # the correct period.
                 if value.shape[-1] == 1:
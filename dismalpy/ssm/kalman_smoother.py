@@ -7,8 +7,8 @@ License: Simplified-BSD
 from __future__ import division, absolute_import, print_function
 
 import numpy as np
-from .representation import OptionWrapper
-from .kalman_filter import KalmanFilter, FilterResults
+from .representation import OptionWrapper, _matrix_at
+from .kalman_filter import KalmanFilter, FilterResults, FILTER_EXACT_INITIAL
 from .tools import prefix_kalman_smoother_map
 
 SMOOTHER_STATE = 0x01          # Durbin and Koopman (2012), Chapter 4.4.2
@@ -248,6 +248,12 @@ class KalmanSmoother(KalmanFilter):
             self._initialize_state()
             kfilter()
 
+        # The smoother does not (yet) treat the diffuse periods exactly
+        if (kfilter.filter_method & FILTER_EXACT_INITIAL and
+                kfilter.nobs_diffuse > 0):
+            raise NotImplementedError('Smoothing is not available with the'
+                                      ' exact diffuse initialization.')
+
         # Run the smoother
         smoother = self._kalman_smoothers[prefix]
         smoother()
@@ -517,11 +523,10 @@ class SmootherResults(FilterResults):
                         self.smoothed_measurement_disturbance[mask, t] = (
                             tmp[:k_endog])
                     if 'smoothed_measurement_disturbance_cov' in attributes:
-                        obs_cov_t = 0 if self.obs_cov.shape[2] == 1 else t
                         tmp = np.copy(
                             self.smoothed_measurement_disturbance_cov[:, :, t])
                         self.smoothed_measurement_disturbance_cov[:, :, t] = (
-                            np.copy(self.obs_cov[:, :, obs_cov_t]))
+                            np.copy(_matrix_at(self, 'obs_cov', t)))
                         ix = np.ix_(mask, mask, [t])
                         self.smoothed_measurement_disturbance_cov[ix] = (
                             tmp[:k_endog, :k_endog, np.newaxis])
@@ -543,25 +548,25 @@ class SmootherResults(FilterResults):
             )
 
             for t in range(self.nobs):
-                design_t = 0 if self.design.shape[2] == 1 else t
-                obs_cov_t = 0 if self.obs_cov.shape[2] == 1 else t
-                obs_intercept_t = 0 if self.obs_intercept.shape[1] == 1 else t
+                design = _matrix_at(self, 'design', t)
+                obs_cov = _matrix_at(self, 'obs_cov', t)
+                obs_intercept = _matrix_at(self, 'obs_intercept', t)
 
                 mask = ~self.missing[:, t].astype(bool)
                 # We can recover forecasts
                 self._smoothed_forecasts[:, t] = np.dot(
-                    self.design[:, :, design_t], self.smoothed_state[:, t]
-                ) + self.obs_intercept[:, obs_intercept_t]
+                    design, self.smoothed_state[:, t]
+                ) + obs_intercept
                 if self.nmissing[t] > 0:
                     self._smoothed_forecasts_error[:, t] = np.nan
                 self._smoothed_forecasts_error[mask, t] = (
                     self.endog[mask, t] - self._smoothed_forecasts[mask, t]
                 )
                 self._smoothed_forecasts_error_cov[:, :, t] = np.dot(
-                    np.dot(self.design[:, :, design_t],
+                    np.dot(design,
                            self.smoothed_state_cov[:, :, t]),
-                    self.design[:, :, design_t].T
-                ) + self.obs_cov[:, :, obs_cov_t]
+                    design.T
+                ) + obs_cov
         return (
             self._smoothed_forecasts,
             self._smoothed_forecasts_error,
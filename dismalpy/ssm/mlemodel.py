@@ -7,6 +7,7 @@ License: Simplified-BSD
 from __future__ import division, absolute_import, print_function
 
 import numpy as np
+from .kalman_filter import INVERT_UNIVARIATE, SOLVE_LU
 from .simulation_smoother import SimulationSmoother, SimulationSmoothResults
 try:
     from statsmodels.tsa.statespace import mlemodel, varmax
@@ -115,6 +116,12 @@ class MLEMixin(object):
             matrix formula from Harvey (1989), and 'cs' uses second-order
             complex step differentiation. This keyword is only relevant if the
             optimization method uses the Hessian matrix.
+        precision : {'single', 'double'}, optional
+            The floating point precision in which to run the Kalman filter
+            during the optimization. The results object is always constructed
+            at the precision of the state space model. Default is the
+            precision of the state space model. See `Representation.precision`
+            for more details.
         **kwargs
             Additional keyword arguments to pass to the optimizer.
 
@@ -130,7 +137,16 @@ class MLEMixin(object):
         # Save the return_params argument
         return_params = kwargs.get('return_params', False)
         kwargs['return_params'] = False
-        results = super(MLEMixin, self).fit(*args, **kwargs)
+
+        # Optimize, possibly at a different precision
+        precision = kwargs.pop('precision', None)
+        _precision = self.ssm.precision
+        if precision is not None:
+            self.ssm.precision = precision
+        try:
+            results = super(MLEMixin, self).fit(*args, **kwargs)
+        finally:
+            self.ssm.precision = _precision
 
         # Construct the results class if desired
         if return_params:
@@ -149,6 +165,236 @@ class MLEMixin(object):
 
         return results
 
+    def loglike_batch(self, params, transformed=True, nthreads=1, **kwargs):
+        """
+        Loglikelihood evaluation for a batch of parameter vectors
+
+        Parameters
+        ----------
+        params : array_like
+            Two-dimensional array of parameters, shaped `nbatch x k_params`,
+            at each row of which to evaluate the loglikelihood function.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+        nthreads : int, optional
+            The number of threads across which to split the batch. Default is
+            1.
+        **kwargs
+            Additional keyword arguments to pass to the Kalman filter. See
+            `KalmanFilter.filter` for more details.
+
+        Returns
+        -------
+        loglike : array
+            Array of length `nbatch` holding the loglikelihood evaluated at
+            each row of `params`.
+
+        Notes
+        -----
+        The state space representation is built for each row of `params`
+        (using `update`, in Python), and then all of the loglikelihoods are
+        computed in a single call to the Kalman filter, which copies the
+        matrices for each row into the statespace model and filters them
+        without returning to Python (except to compute a stationary or exact
+        diffuse initialization). This avoids the overhead of calling
+        `loglike` for each parameter vector, but not the cost of `update`
+        or of the filtering itself; the gain is therefore largest for small
+        models and short samples, where that overhead dominates (see the
+        `batch` benchmark in `tools/benchmarks.py`). Splitting the batch
+        across threads helps only if several processor cores are available.
+
+        After this method returns, the state space representation corresponds
+        to the last row of `params`.
+
+        See Also
+        --------
+        loglike
+        """
+        params = np.array(params, ndmin=2)
+
+        batch = []
+        for i in range(params.shape[0]):
+            params_i = params[i]
+            if not transformed:
+                params_i = self.transform_params(params_i)
+            self.update(params_i, transformed=True)
+            batch.append(self.ssm._batch_representation())
+
+        return self.ssm._loglike_batch(batch, nthreads=nthreads, **kwargs)
+
+    def representation_jacobian(self, params):
+        """
+        Partial derivatives of the state space representation matrices
+
+        Parameters
+        ----------
+        params : array_like
+            Array of (transformed) parameters at which to evaluate the
+            derivatives.
+
+        Returns
+        -------
+        partials : dict
+            The partial derivatives of the representation matrices with
+            respect to each parameter, keyed by matrix name. See
+            `KalmanFilter.score_obs` for details.
+
+        Notes
+        -----
+        This is computed by complex-step differentiation of the `update`
+        method, which requires only one call to `update` (and no filtering)
+        per parameter. It therefore requires that `update` accept complex
+        parameters and set the representation matrices by analytic functions
+        of them; for example, an `update` that casts the parameters to floats
+        or takes their absolute value gives incorrect derivatives. None of
+        the models in this package (including `SARIMAX` and `VARMAX`) provide
+        analytic derivatives; models can override this method to do so.
+
+        After this method returns, the state space representation corresponds
+        to `params`.
+        """
+        params = np.array(params, ndmin=1)
+        k_params = len(params)
+        epsilon = 1e-20
+
+        names = [name for name in self.ssm.shapes.keys() if not name == 'obs']
+        partials = {}
+        for i in range(k_params):
+            increment = np.zeros(k_params, dtype=complex)
+            increment[i] = 1j * epsilon
+            self.update(params + increment, transformed=True)
+            for name in names:
+                matrix = getattr(self.ssm, '_' + name)
+                if name not in partials:
+                    partials[name] = np.zeros(matrix.shape + (k_params,))
+                # (if the matrix has become time-varying, all of the
+                # previously computed partials are expanded)
+                elif not partials[name].shape[:-1] == matrix.shape:
+                    partials[name] = np.array(np.broadcast_to(
+                        partials[name], matrix.shape + (k_params,)))
+                if np.iscomplexobj(matrix):
+                    partials[name][..., i] = matrix.imag / epsilon
+        self.update(params, transformed=True)
+
+        return partials
+
+    def score_obs(self, params, transformed=True, method='approx', **kwargs):
+        """
+        Compute the score per observation, evaluated at params
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters at which to evaluate the score.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+        method : {'analytic', 'approx'}, optional
+            If 'analytic', the score is computed in a single forward pass of
+            the Kalman filter derivative recursions (see
+            `KalmanFilter.score_obs`), using `representation_jacobian`.
+            Otherwise, it is computed by numerical differentiation of
+            `loglikeobs`. Default is 'approx'.
+        **kwargs
+            Additional keyword arguments to pass to the Kalman filter, if the
+            numerical approximation is used. See `KalmanFilter.filter` for
+            more details.
+
+        Returns
+        -------
+        score : array (nobs, k_vars)
+            Score per observation, evaluated at `params`.
+        """
+        if method == 'analytic':
+            return self._score_obs_analytic(params, transformed=transformed)
+
+        # (the numerical approximation is with respect to the transformed
+        # parameters, and passes any remaining arguments to `loglikeobs`;
+        # as for the complex-step covariance matrices, Cholesky inversion
+        # cannot be relied on, since it ignores the imaginary step of the
+        # diagonal of the forecast error covariance matrix)
+        kwargs.setdefault('inversion_method', INVERT_UNIVARIATE | SOLVE_LU)
+        params = np.array(params, ndmin=1)
+        if not transformed:
+            transform_jacobian = self.transform_jacobian(params)
+            params = self.transform_params(params)
+        score_obs = super(MLEMixin, self).score_obs(params, **kwargs)
+        if not transformed:
+            score_obs = np.dot(score_obs, transform_jacobian)
+        return score_obs
+
+    def score(self, params, transformed=True, method='approx', **kwargs):
+        """
+        Compute the score function at params.
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters at which to evaluate the score.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+        method : {'analytic', 'approx'}, optional
+            If 'analytic', the score is the sum of the analytic score per
+            observation (see `score_obs`). Otherwise, it is computed by
+            numerical differentiation of `loglike`. Default is 'approx'.
+        **kwargs
+            Additional keyword arguments to pass to the numerical
+            approximation, if used.
+
+        Returns
+        ----------
+        score : array
+            Score, evaluated at `params`.
+
+        Notes
+        -----
+        The optimizers used by `fit` pass `transformed` as the only
+        positional argument.
+        """
+        if method == 'analytic':
+            return np.sum(
+                self._score_obs_analytic(params, transformed=transformed),
+                axis=0)
+        return super(MLEMixin, self).score(params, transformed, **kwargs)
+
+    def observed_information_matrix(self, params, **kwargs):
+        """
+        Observed information matrix
+
+        Parameters
+        ----------
+        params : array_like, optional
+            Array of parameters at which to evaluate the loglikelihood
+            function.
+        **kwargs
+            Additional keyword arguments to pass to the Kalman filter. See
+            `KalmanFilter.filter` for more details.
+
+        Notes
+        -----
+        The partial derivatives are computed by complex-step differentiation,
+        so by default the forecast error covariance matrix is inverted using
+        an LU decomposition rather than the Cholesky decomposition (see
+        `score_obs`).
+        """
+        kwargs.setdefault('inversion_method', INVERT_UNIVARIATE | SOLVE_LU)
+        return super(MLEMixin, self).observed_information_matrix(
+            params, **kwargs)
+
+    def _score_obs_analytic(self, params, transformed=True):
+        params = np.array(params, ndmin=1)
+
+        if not transformed:
+            transform_jacobian = self.transform_jacobian(params)
+            params = self.transform_params(params)
+
+        partials = self.representation_jacobian(params)
+        score_obs = self.ssm.score_obs(partials)
+
+        if not transformed:
+            score_obs = np.dot(score_obs, transform_jacobian)
+
+        return score_obs
+
     def filter(self, params, transformed=True, cov_type=None, cov_kwds=None,
                return_ssm=False, **kwargs):
         """
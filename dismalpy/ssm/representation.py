@@ -11,7 +11,7 @@ from warnings import warn
 import numpy as np
 from .tools import (
     find_best_blas_type, prefix_dtype_map, prefix_statespace_map,
-    validate_matrix_shape, validate_vector_shape
+    precision_prefix_map, validate_matrix_shape, validate_vector_shape
 )
 
 
@@ -46,20 +46,56 @@ class MatrixWrapper(object):
         # # Remove last dimension if the array is not actually time-varying
         # if matrix is not None and matrix.shape[-1] == 1:
         #     return np.squeeze(matrix, -1)
+
+        # The caller may modify the returned matrix in place (see
+        # `_changed_matrices`)
+        exposed = getattr(obj, '_exposed_matrices', None)
+        if exposed is not None and matrix is not None:
+            exposed.add(self.attribute)
         return matrix
 
     def __set__(self, obj, value):
+        given = value
         value = np.asarray(value, order="F")
         shape = obj.shapes[self.attribute]
 
+        # A piecewise-constant matrix remains so if it is given the same
+        # number of distinct values (e.g. if a slice of it was set), and
+        # otherwise its regimes are removed
+        nobs = obj.nobs
+        regimes = getattr(obj, '_regimes', {})
+        if self.attribute in regimes:
+            k_regimes = getattr(obj, self._attribute).shape[-1]
+            if value.ndim == len(shape) and value.shape[-1] == k_regimes:
+                nobs = k_regimes
+            else:
+                del regimes[self.attribute]
+
         if len(shape) == 3:
-            value = self._set_matrix(obj, value, shape)
+            value = self._set_matrix(obj, value, shape, nobs)
         else:
-            value = self._set_vector(obj, value, shape)
+            value = self._set_vector(obj, value, shape, nobs)
+
+        # A matrix given by exogenous data remains so if it is given a
+        # time-invariant value, and otherwise its coefficients are removed
+        exog_matrices = getattr(obj, '_exog_matrices', {})
+        if self.attribute in exog_matrices and value.shape[-1] > 1:
+            del exog_matrices[self.attribute]
+
+        # Mark the matrix as changed (see `_initialize_representation`), and
+        # as possibly modified in place if the caller holds it
+        if getattr(obj, '_changed', None) is not None:
+            obj._set_changed([self.attribute])
+        exposed = getattr(obj, '_exposed_matrices', None)
+        if exposed is not None:
+            if value is given:
+                exposed.add(self.attribute)
+            else:
+                exposed.discard(self.attribute)
 
         setattr(obj, self._attribute, value)
 
-    def _set_matrix(self, obj, value, shape):
+    def _set_matrix(self, obj, value, shape, nobs):
         # Expand 1-dimensional array if possible
         if (value.ndim == 1 and shape[0] == 1
                 and value.shape[0] == shape[1]):
@@ -67,7 +103,7 @@ class MatrixWrapper(object):
 
         # Enforce that the matrix is appropriate size
         validate_matrix_shape(
-            self.name, value.shape, shape[0], shape[1], obj.nobs
+            self.name, value.shape, shape[0], shape[1], nobs
         )
 
         # Expand time-invariant matrix
@@ -76,10 +112,10 @@ class MatrixWrapper(object):
 
         return value
 
-    def _set_vector(self, obj, value, shape):
+    def _set_vector(self, obj, value, shape, nobs):
         # Enforce that the vector has appropriate length
         validate_vector_shape(
-            self.name, value.shape, shape[0], obj.nobs
+            self.name, value.shape, shape[0], nobs
         )
 
         # Expand the time-invariant vector
@@ -89,6 +125,43 @@ class MatrixWrapper(object):
         return value
 
 
+def _matrix_index(representation, name, t):
+    """
+    Index of the slice of a (possibly time-varying or piecewise-constant)
+    representation matrix which applies in period `t`
+    """
+    if name in representation.regimes:
+        return representation.regimes[name][t]
+    return 0 if getattr(representation, name).shape[-1] == 1 else t
+
+
+def _matrix_at(representation, name, t):
+    """
+    Value in period `t` of a (possibly time-varying, piecewise-constant or
+    given by exogenous data) representation matrix
+    """
+    matrix = getattr(representation, name)
+    if name in representation.exog_matrices:
+        return matrix[..., 0] + np.dot(
+            representation.exog_matrices[name],
+            representation.exog_matrices_data[:, t])
+    return matrix[..., _matrix_index(representation, name, t)]
+
+
+def _expand_matrix(representation, name):
+    """
+    Representation matrix with a slice for each period, unless it is
+    time-invariant
+    """
+    matrix = getattr(representation, name)
+    if name in representation.regimes:
+        return matrix[..., representation.regimes[name]]
+    if name in representation.exog_matrices:
+        return matrix + np.dot(representation.exog_matrices[name],
+                               representation.exog_matrices_data)
+    return matrix
+
+
 class Representation(object):
     r"""
     State space representation of a time series process
@@ -107,14 +180,24 @@ class Representation(object):
     initial_variance : float, optional
         Initial variance used when approximate diffuse initialization is
         specified. Default is 1e6.
-    initialization : {'approximate_diffuse','stationary','known'}, optional
+    initialization : {'approximate_diffuse','stationary','known','diffuse'}, optional
         Initialization method for the initial state.
     initial_state : array_like, optional
-        If known initialization is used, the mean of the initial state's
-        distribution.
+        If known or diffuse initialization is used, the mean of the initial
+        state's distribution.
     initial_state_cov : array_like, optional
         If known initialization is used, the covariance matrix of the initial
-        state's distribution.
+        state's distribution. If diffuse initialization is used, the
+        non-diffuse part of the covariance matrix.
+    initial_diffuse_state_cov : array_like, optional
+        If diffuse initialization is used, the diffuse part of the covariance
+        matrix of the initial state's distribution.
+    precision : {'single', 'double'}, optional
+        The floating point precision in which the Kalman filter (and the
+        other algorithms) are run, regardless of the datatype of the
+        representation matrices. Default is to use the datatype of the
+        representation matrices. See the `precision` attribute for more
+        details.
     nobs : integer, optional
         If an endogenous vector is not given (i.e. `k_endog` is an integer),
         the number of observations can optionally be specified. If not
@@ -171,6 +254,8 @@ class Representation(object):
     initial_variance : float
         Initial variance for approximate diffuse
         initialization. Default is 1e6.
+    precision : {'single', 'double'} or None
+        Floating point precision of the Kalman filter. Default is unset.
 
     Notes
     -----
@@ -210,7 +295,11 @@ class Representation(object):
 
     In the case that one of the matrices is time-invariant (so that, for
     example, :math:`Z_t = Z_{t+1} ~ \forall ~ t`), its last dimension may
-    be of size :math:`1` rather than size `nobs`.
+    be of size :math:`1` rather than size `nobs`. If it is instead
+    piecewise-constant, its last dimension may be of the size of the number
+    of its distinct values (see `set_regimes`). The design matrix and the
+    intercepts may also be given by exogenous data (see
+    `set_exog_matrices`).
 
     References
     ----------
@@ -302,6 +391,28 @@ class Representation(object):
             'state_cov': (self.k_posdef, self.k_posdef, 1),
         }
 
+        # Regime indices of piecewise-constant matrices (see `set_regimes`)
+        self._regimes = {}
+
+        # Coefficients of the matrices given by exogenous data, and the data
+        # (see `set_exog_matrices`)
+        self._exog_matrices = {}
+        self._exog_matrices_data = None
+
+        # For each underlying statespace object, the representation matrices
+        # set since they were last synced with it; the matrices which the
+        # caller may hold (and so may have modified in place), and, for each
+        # underlying statespace object, their values when they were last
+        # synced with it (see `_changed_matrices`)
+        self._changed = {}
+        self._exposed_matrices = set()
+        self._synced_values = {}
+
+        # The underlying statespace objects initialized as stationary since
+        # their transition, selection and state covariance matrices last
+        # changed (see `_initialize_state`)
+        self._stationary_initializations = {}
+
         # Representation matrices
         # These matrices are only used in the Python object as containers,
         # which will be copied to the appropriate _statespace object if a
@@ -320,6 +431,7 @@ class Representation(object):
 
         # Options
         self.initial_variance = initial_variance
+        self.precision = kwargs.get('precision', None)
         self.prefix_statespace_map = (statespace_classes
                                       if statespace_classes is not None
                                       else prefix_statespace_map)
@@ -328,6 +440,7 @@ class Representation(object):
         self.initialization = kwargs.get('initialization', None)
         self._initial_state = None
         self._initial_state_cov = None
+        self._initial_diffuse_state_cov = None
         self._initial_variance = None
 
         if self.initialization == 'approximate_diffuse':
@@ -344,6 +457,11 @@ class Representation(object):
                                  ' initialization method.')
             self.initialize_known(kwargs['initial_state'],
                                   kwargs['initial_state_cov'])
+        elif self.initialization == 'diffuse':
+            self.initialize_diffuse(kwargs.get('initial_state', None),
+                                    kwargs.get('initial_state_cov', None),
+                                    kwargs.get('initial_diffuse_state_cov',
+                                               None))
         elif self.initialization is not None:
             raise ValueError("Invalid state space initialization method.")
 
@@ -441,9 +559,14 @@ class Representation(object):
             if matrix.shape[-1] == 1 and len(slice_) == matrix.ndim-1:
                 slice_ = slice_ + (0,)
 
-            # Set the new value
+            # Set the new value (the caller only holds the matrix if it held
+            # it before, see `_changed_matrices`)
+            exposed = (matrix is getattr(self, '_' + name) and
+                       name in self._exposed_matrices)
             matrix[slice_] = value
             setattr(self, name, matrix)
+            if not exposed:
+                self._exposed_matrices.discard(name)
         # Otherwise we got a single non-string key, (e.g. mod[:]), which is
         # invalid
         else:
@@ -462,7 +585,53 @@ class Representation(object):
         )
         if self.endog is not None:
             arrays = (self.endog,) + arrays
-        return find_best_blas_type(arrays)[0]
+        prefix = find_best_blas_type(arrays)[0]
+        if self.precision is not None:
+            prefix = precision_prefix_map[self.precision][prefix]
+        return prefix
+
+    @property
+    def precision(self):
+        """
+        (str) Floating point precision of the Kalman filter
+
+        If 'single', the recursions are run in single precision (float32 or
+        complex64) and the output arrays (other than the loglikelihood) are
+        stored in single precision, which approximately halves the memory
+        required and can substantially increase throughput for large models.
+        The determinant of the forecast error covariance matrix and the
+        loglikelihood are always accumulated in double precision.
+
+        If 'double', the recursions are run in double precision even if the
+        representation matrices are single precision. If None, the precision
+        is that of the representation matrices.
+
+        Notes
+        -----
+        Single precision has a machine epsilon of approximately 1e-7, so that
+        it is only suitable for well-conditioned models. For example, with
+        nonstationary or approximately diffuse initializations the forecast
+        error covariance matrices may lose most of their significant digits,
+        and so convergence to the steady-state may be falsely detected. The
+        filter may also fail outright: for the model of Clark (1989) used in
+        the tests, the single precision filter encounters a singular forecast
+        error covariance matrix.
+
+        Nor is single precision faster for small models, for which the cost
+        of each call to BLAS is mostly overhead rather than arithmetic: with
+        ten observed variables and 5 to 20 states, the speedup over the
+        double precision filter was mostly between 0.9x and 1.1x, and only
+        with 50 states was it consistently faster (about 1.5x). See the
+        `precision` section of `tools/benchmarks.py`.
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, value):
+        if value is not None and value not in precision_prefix_map:
+            raise ValueError('Invalid precision. Must be one of %s or None.'
+                             % ', '.join(sorted(precision_prefix_map)))
+        self._precision = value
 
     @property
     def dtype(self):
@@ -477,13 +646,192 @@ class Representation(object):
         (bool) Whether or not currently active representation matrices are
         time-invariant
         """
-        return (
+        return not self._regimes and not self._exog_matrices and (
             self._design.shape[2] == self._obs_intercept.shape[1] ==
             self._obs_cov.shape[2] == self._transition.shape[2] ==
             self._state_intercept.shape[1] == self._selection.shape[2] ==
             self._state_cov.shape[2]
         )
 
+    @property
+    def regimes(self):
+        """
+        (dict) Regime index (of length `nobs`) of each of the
+        piecewise-constant representation matrices, by name. Should only be
+        changed using `set_regimes`.
+        """
+        return self._regimes
+
+    def set_regimes(self, name, matrices, index):
+        """
+        Set a piecewise-constant representation matrix
+
+        Parameters
+        ----------
+        name : str
+            The name of the representation matrix (e.g. 'transition').
+        matrices : array_like
+            The distinct values of the matrix, stacked along the last axis
+            (so that a matrix is shaped, for example,
+            (`k_states`, `k_states`, `k_regimes`)).
+        index : array_like of int
+            The regime in each period, i.e. the index (between 0 and
+            `k_regimes - 1`) of the value of the matrix which applies in that
+            period. Must be of length `nobs`.
+
+        Notes
+        -----
+        Rather than holding `nobs` copies of a matrix which only takes a few
+        distinct values (for example, before and after a structural break),
+        only the distinct values are held, and the underlying statespace
+        object looks up the value which applies in each period. Since the
+        arrays derived from a matrix (for example, the selected state
+        covariance matrix, or the transformations of the observation
+        covariance matrix) are cached by the index of the value from which
+        they were computed, they are re-used within (and across) regimes.
+        Also, if each of the matrices entering the covariance recursions is
+        either time-invariant or piecewise-constant, the Kalman filter may
+        converge to the steady-state within each regime.
+
+        Setting a slice of the matrix (for example,
+        `mod['transition', 0, 0, 1] = 0.5` sets the first element in the
+        second regime) or setting the matrix to a new stack with the same
+        number of values keeps the regimes; setting it to any other value
+        removes them.
+        """
+        if name not in self.shapes or name == 'obs':
+            raise IndexError('"%s" is an invalid state space matrix name'
+                             % name)
+        shape = self.shapes[name]
+        given = matrices
+        matrices = np.asarray(matrices, order="F")
+        index = np.asarray(index)
+
+        if not (matrices.ndim == len(shape) and
+                matrices.shape[:-1] == shape[:-1]):
+            raise ValueError('Invalid dimensions for piecewise-constant %s'
+                             ' matrix. Requires shape %s, got %s' %
+                             (name, str(shape[:-1] + ('k_regimes',)),
+                              str(matrices.shape)))
+        k_regimes = matrices.shape[-1]
+        if not (index.shape == (self.nobs,) and
+                np.issubdtype(index.dtype, np.integer)):
+            raise ValueError('Invalid regime index. Requires an integer'
+                             ' vector of length %d.' % self.nobs)
+        if np.any(index < 0) or np.any(index >= k_regimes):
+            raise ValueError('Invalid regime index. Requires values between'
+                             ' 0 and %d.' % (k_regimes - 1))
+
+        if name in self._exog_matrices:
+            raise ValueError('Invalid piecewise-constant %s matrix: it is'
+                             ' given by exogenous data.' % name)
+
+        setattr(self, '_' + name, matrices)
+        self._regimes[name] = np.array(index, dtype=np.int32)
+        self._set_changed([name])
+        if matrices is given:
+            self._exposed_matrices.add(name)
+        else:
+            self._exposed_matrices.discard(name)
+
+    @property
+    def exog_matrices(self):
+        """
+        (dict) Coefficients on the exogenous data of each of the
+        representation matrices given by exogenous data, by name. Should only
+        be changed using `set_exog_matrices`.
+        """
+        return self._exog_matrices
+
+    @property
+    def exog_matrices_data(self):
+        """
+        (array) Exogenous data (transposed, so shaped (`k_exog`, `nobs`)) of
+        the representation matrices given by exogenous data, or None. Should
+        only be changed using `set_exog_matrices`.
+        """
+        return self._exog_matrices_data
+
+    def set_exog_matrices(self, exog_data, design=None, obs_intercept=None,
+                          state_intercept=None):
+        r"""
+        Set the representation matrices given by exogenous data
+
+        Parameters
+        ----------
+        exog_data : array_like or None
+            The exogenous data, shaped (`nobs`, `k_exog`). If None, the
+            matrices given by exogenous data are removed (and their
+            time-invariant values are kept).
+        design : array_like, optional
+            The coefficients of the design matrix on the exogenous data,
+            shaped (`k_endog`, `k_states`, `k_exog`).
+        obs_intercept : array_like, optional
+            The coefficients of the observation intercept, shaped
+            (`k_endog`, `k_exog`).
+        state_intercept : array_like, optional
+            The coefficients of the state intercept, shaped
+            (`k_states`, `k_exog`).
+
+        Notes
+        -----
+        Each of the given matrices is computed in each period as
+
+        .. math::
+
+            Z_t = Z + \sum_{j=1}^{k\_exog} x_{j,t} Z^{(j)}
+
+        where :math:`Z` is the (time-invariant) value of the matrix and
+        :math:`Z^{(j)}` are the coefficients. Rather than holding `nobs`
+        slices of the matrix, the underlying statespace object evaluates it
+        in each period into a single buffer, so that the memory required by
+        a time-varying design matrix is that of the exogenous data. This
+        saves memory but not time: evaluating the matrix costs about as much
+        as reading an expanded slice.
+
+        The matrices must be time-invariant and not piecewise-constant.
+        Setting a matrix to a time-invariant value keeps its coefficients
+        (so that its value is the new constant); setting it to a
+        time-varying value removes them.
+        """
+        self._set_changed(['design', 'obs_intercept', 'state_intercept'])
+        self._exog_matrices = {}
+        self._exog_matrices_data = None
+        if exog_data is None:
+            return
+
+        exog_data = np.asarray(exog_data)
+        if exog_data.ndim == 1:
+            exog_data = exog_data[:, None]
+        if not (exog_data.ndim == 2 and exog_data.shape[0] == self.nobs):
+            raise ValueError('Invalid dimensions for exogenous data. Requires'
+                             ' shape (%d, k_exog), got %s' %
+                             (self.nobs, str(exog_data.shape)))
+        k_exog = exog_data.shape[1]
+
+        exog_matrices = {}
+        coefficients = [('design', design), ('obs_intercept', obs_intercept),
+                        ('state_intercept', state_intercept)]
+        for name, value in coefficients:
+            if value is None:
+                continue
+            shape = self.shapes[name][:-1] + (k_exog,)
+            value = np.array(value, order="F")
+            if not value.shape == shape:
+                raise ValueError('Invalid dimensions for the coefficients of'
+                                 ' the %s matrix on the exogenous data.'
+                                 ' Requires shape %s, got %s' %
+                                 (name, str(shape), str(value.shape)))
+            if (name in self._regimes or
+                    getattr(self, '_' + name).shape[-1] > 1):
+                raise ValueError('Invalid %s matrix given by exogenous data:'
+                                 ' requires a time-invariant matrix.' % name)
+            exog_matrices[name] = value
+
+        if exog_matrices:
+            self._exog_matrices = exog_matrices
+            self._exog_matrices_data = np.asfortranarray(exog_data.T)
+
     @property
     def _statespace(self):
         prefix = self.prefix
@@ -574,6 +922,12 @@ class Representation(object):
         self.endog = endog
         self.nobs = self.endog.shape[1]
 
+        # Mark the observations of the underlying statespace objects to be
+        # replaced (see `_initialize_representation`)
+        if hasattr(self, '_representations'):
+            for representations in self._representations.values():
+                representations.pop('obs', None)
+
         # Reset shapes
         if hasattr(self, 'shapes'):
             self.shapes['obs'] = self.endog.shape
@@ -637,54 +991,123 @@ class Representation(object):
         """
         self.initialization = 'stationary'
 
+    def initialize_diffuse(self, initial_state=None, initial_state_cov=None,
+                           initial_diffuse_state_cov=None):
+        """
+        Initialize the statespace model with exact diffuse values.
+
+        The covariance matrix of the initial state is
+        :math:`P_1 = \kappa P_{\infty,1} + P_{*,1}`, where
+        :math:`\kappa \to \infty`. This is handled exactly by the Kalman
+        filter, which requires the `filter_exact_initial` filter method.
+
+        Parameters
+        ----------
+        initial_state : array_like, optional
+            Mean of the initial state vector. Default is zeros.
+        initial_state_cov : array_like, optional
+            The non-diffuse part of the covariance matrix of the initial state
+            vector, :math:`P_{*,1}`. Default is zeros.
+        initial_diffuse_state_cov : array_like, optional
+            The diffuse part of the covariance matrix of the initial state
+            vector, :math:`P_{\infty,1}`. Default is the identity matrix, so
+            that all of the states are diffuse.
+
+        Notes
+        -----
+        See Durbin and Koopman (2012), Chapter 5.
+        """
+        if initial_state is None:
+            initial_state = np.zeros(self.k_states)
+        if initial_state_cov is None:
+            initial_state_cov = np.zeros((self.k_states, self.k_states))
+        if initial_diffuse_state_cov is None:
+            initial_diffuse_state_cov = np.eye(self.k_states)
+        initial_state = np.asarray(initial_state, order="F")
+        initial_state_cov = np.asarray(initial_state_cov, order="F")
+        initial_diffuse_state_cov = np.asarray(initial_diffuse_state_cov,
+                                               order="F")
+
+        if not initial_state.shape == (self.k_states,):
+            raise ValueError('Invalid dimensions for initial state vector.'
+                             ' Requires shape (%d,), got %s' %
+                             (self.k_states, str(initial_state.shape)))
+        for name, matrix in (('initial covariance', initial_state_cov),
+                             ('initial diffuse covariance',
+                              initial_diffuse_state_cov)):
+            if not matrix.shape == (self.k_states, self.k_states):
+                raise ValueError('Invalid dimensions for %s matrix.'
+                                 ' Requires shape (%d,%d), got %s' %
+                                 (name, self.k_states, self.k_states,
+                                  str(matrix.shape)))
+
+        self._initial_state = initial_state
+        self._initial_state_cov = initial_state_cov
+        self._initial_diffuse_state_cov = initial_diffuse_state_cov
+        self.initialization = 'diffuse'
+
     def _initialize_representation(self, prefix=None):
         if prefix is None:
             prefix = self.prefix
         dtype = prefix_dtype_map[prefix]
 
-        # If the dtype-specific representation matrices do not exist, create
-        # them
+        # Create or update the dtype-specific representation matrices. These
+        # are the representation matrices themselves (so that no copy is
+        # made) if they are already of the datatype and Fortran-ordered, and
+        # otherwise are (cast) copies.
         if prefix not in self._representations:
-            # Copy the statespace representation matrices
             self._representations[prefix] = {}
-            for matrix in self.shapes.keys():
-                if matrix == 'obs':
-                    self._representations[prefix][matrix] = (
-                        self.obs.astype(dtype)
-                    )
-                else:
-                    # Note: this always makes a copy
-                    self._representations[prefix][matrix] = (
-                        getattr(self, '_' + matrix).astype(dtype)
-                    )
-        # If they do exist, update them
-        else:
-            for matrix in self.shapes.keys():
-                existing = self._representations[prefix][matrix]
-                if matrix == 'obs':
-                    existing = self.obs.astype(dtype)[:]
-                else:
-                    new = getattr(self, '_' + matrix).astype(dtype)
-                    if existing.shape == new.shape:
-                        existing[:] = new[:]
-                    else:
-                        existing = new
-
+        representations = self._representations[prefix]
+        changed = self._changed_matrices(prefix)
+        for matrix in self.shapes.keys():
+            if matrix == 'obs' or (matrix not in changed and
+                                   matrix in representations):
+                continue
+            value = getattr(self, '_' + matrix)
+            existing = representations.get(matrix, None)
+            if value is existing:
+                continue
+            new = np.require(value, dtype, ['F', 'A', 'W'])
+            if existing is None or not existing.shape == new.shape:
+                representations[matrix] = new
+            # The existing matrix is held by the statespace object, so the
+            # new values are copied into it; if the matrix was replaced by
+            # one of the datatype, the existing matrix then replaces it in
+            # turn, so that they are again shared
+            else:
+                existing[:] = new
+                if new is value:
+                    setattr(self, '_' + matrix, existing)
+
+        # The observations are only updated when data is bound to the model,
+        # in which case they replace those of an existing statespace object
+        # if its missing data patterns are unchanged (see `bind`)
+        create_obs = False
+        if 'obs' not in representations:
+            representations['obs'] = np.require(self.obs, dtype,
+                                                ['F', 'A', 'W'])
+            if prefix in self._statespaces:
+                try:
+                    self._statespaces[prefix].set_obs(representations['obs'])
+                except ValueError:
+                    create_obs = True
 
         # Determine if we need to (re-)create the _statespace models
         # (if time-varying matrices changed)
         if prefix in self._statespaces:
             ss = self._statespaces[prefix]
             create = (
+                create_obs or
                 not ss.obs.shape[1] == self.endog.shape[1] or
-                not ss.design.shape[2] == self.design.shape[2] or
-                not ss.obs_intercept.shape[1] == self.obs_intercept.shape[1] or
-                not ss.obs_cov.shape[2] == self.obs_cov.shape[2] or
-                not ss.transition.shape[2] == self.transition.shape[2] or
+                not ss.design.shape[2] == self._design.shape[2] or
+                not (ss.obs_intercept.shape[1] ==
+                     self._obs_intercept.shape[1]) or
+                not ss.obs_cov.shape[2] == self._obs_cov.shape[2] or
+                not ss.transition.shape[2] == self._transition.shape[2] or
                 not (ss.state_intercept.shape[1] ==
-                     self.state_intercept.shape[1]) or
-                not ss.selection.shape[2] == self.selection.shape[2] or
-                not ss.state_cov.shape[2] == self.state_cov.shape[2]
+                     self._state_intercept.shape[1]) or
+                not ss.selection.shape[2] == self._selection.shape[2] or
+                not ss.state_cov.shape[2] == self._state_cov.shape[2]
             )
         else:
             create = True
@@ -704,17 +1127,89 @@ class Representation(object):
                 self._representations[prefix]['transition'],
                 self._representations[prefix]['state_intercept'],
                 self._representations[prefix]['selection'],
-                self._representations[prefix]['state_cov']
+                self._representations[prefix]['state_cov'],
+                self._regimes
             )
+        # Otherwise update the regimes of piecewise-constant matrices
+        # (after removing the matrices given by exogenous data, which may
+        # since have become piecewise-constant), if any matrix has changed
+        elif changed:
+            ss = self._statespaces[prefix]
+            if ss.k_exog > 0:
+                ss.set_exog_matrices(None)
+            if self._regimes or ss.regimes:
+                ss.set_regimes(self._regimes)
+
+        # Set the matrices given by exogenous data
+        # (the coefficients are flattened in column-major order)
+        if self._exog_matrices and (create or changed):
+            coefficients = {}
+            for name, value in self._exog_matrices.items():
+                coefficients[name] = np.asfortranarray(
+                    value.reshape(-1, value.shape[-1], order="F"),
+                    dtype=dtype)
+            self._statespaces[prefix].set_exog_matrices(
+                np.asfortranarray(self._exog_matrices_data, dtype=dtype),
+                **coefficients)
+
+        # The statespace object retains the arrays it computed from the
+        # unchanged matrices, and the stationary initialization is retained
+        # unless the matrices from which it is computed have changed
+        if not create:
+            self._statespaces[prefix].set_changed(changed)
+        if create or not changed.isdisjoint(['transition', 'selection',
+                                             'state_cov']):
+            self._stationary_initializations.pop(prefix, None)
+        self._changed[prefix] = set()
 
         return prefix, dtype, create
 
+    def _changed_matrices(self, prefix):
+        """
+        Representation matrices changed since they were last synced with the
+        underlying statespace object of the given prefix
+
+        A matrix has changed if it has been set since (e.g. with
+        `__setitem__`, see `_changed`). The caller may also modify a matrix
+        in place if it holds it, i.e. if it was retrieved as an attribute
+        (e.g. `mod.design[0, 0] = 1`) or set to an array which was not copied,
+        so the values of these matrices are also compared to their values
+        when they were last synced. Since only the values of time-invariant
+        and piecewise-constant matrices are retained, time-varying matrices
+        which the caller may hold are always changed.
+        """
+        names = [name for name in self.shapes if not name == 'obs']
+        changed = set(self._changed.get(prefix, names))
+        synced_values = self._synced_values.setdefault(prefix, {})
+        for name in names:
+            if name not in self._exposed_matrices:
+                synced_values.pop(name, None)
+                continue
+            value = getattr(self, '_' + name)
+            synced = synced_values.get(name, None)
+            if (name not in changed and synced is not None and
+                    np.array_equal(synced, value)):
+                continue
+            changed.add(name)
+            synced_values[name] = (
+                value.copy() if value.shape[-1] == 1 or name in self._regimes
+                else None)
+        return changed
+
+    def _set_changed(self, names):
+        # Mark the given matrices as changed for each underlying statespace
+        # object (see `_changed_matrices`)
+        for changed in self._changed.values():
+            changed.update(names)
+
     def _initialize_state(self, prefix=None, complex_step=False):
         if prefix is None:
             prefix = self.prefix
         dtype = prefix_dtype_map[prefix]
 
         # (Re-)initialize the statespace model
+        if not self.initialization == 'stationary':
+            self._stationary_initializations.pop(prefix, None)
         if self.initialization == 'known':
             self._statespaces[prefix].initialize_known(
                 self._initial_state.astype(dtype),
@@ -725,7 +1220,21 @@ class Representation(object):
                 self._initial_variance
             )
         elif self.initialization == 'stationary':
-            self._statespaces[prefix].initialize_stationary(complex_step=complex_step)
+            # (only if not already so initialized, see
+            # `_initialize_representation`)
+            ss = self._statespaces[prefix]
+            initialization = self._stationary_initializations.get(prefix, None)
+            if not (initialization is not None and
+                    initialization[0] is ss and
+                    initialization[1] == complex_step):
+                ss.initialize_stationary(complex_step=complex_step)
+                self._stationary_initializations[prefix] = (ss, complex_step)
+        elif self.initialization == 'diffuse':
+            self._statespaces[prefix].initialize_diffuse(
+                self._initial_state.astype(dtype),
+                np.asfortranarray(self._initial_state_cov, dtype=dtype),
+                np.asfortranarray(self._initial_diffuse_state_cov, dtype=dtype)
+            )
         else:
             raise RuntimeError('Statespace model not initialized.')
 
@@ -787,19 +1296,34 @@ class FrozenRepresentation(object):
         the ith row of the `endog` array.
     time_invariant : bool
         Whether or not the representation matrices are time-invariant
+    regimes : dict
+        The regime index of each of the piecewise-constant representation
+        matrices, by name (see `Representation.set_regimes`).
+    exog_matrices : dict
+        The coefficients on the exogenous data of each of the representation
+        matrices given by exogenous data, by name (see
+        `Representation.set_exog_matrices`).
+    exog_matrices_data : array or None
+        The exogenous data of the representation matrices given by exogenous
+        data.
     initialization : str
         Kalman filter initialization method.
     initial_state : array_like
         The state vector used to initialize the Kalamn filter.
     initial_state_cov : array_like
         The state covariance matrix used to initialize the Kalamn filter.
+    initial_diffuse_state_cov : array_like
+        The diffuse part of the state covariance matrix used to initialize the
+        Kalman filter, if the initialization is diffuse (otherwise None).
     """
     _model_attributes = [
         'model', 'prefix', 'dtype', 'nobs', 'k_endog', 'k_states',
         'k_posdef', 'time_invariant', 'endog', 'design', 'obs_intercept',
         'obs_cov', 'transition', 'state_intercept', 'selection',
-        'state_cov', 'missing', 'nmissing', 'shapes', 'initialization',
-        'initial_state', 'initial_state_cov', 'initial_variance'
+        'state_cov', 'regimes', 'exog_matrices', 'exog_matrices_data',
+        'missing', 'nmissing', 'shapes',
+        'initialization', 'initial_state', 'initial_state_cov',
+        'initial_diffuse_state_cov', 'initial_variance'
     ]
     _attributes = _model_attributes
 
@@ -835,6 +1359,11 @@ class FrozenRepresentation(object):
         self.state_intercept = model._state_intercept.copy()
         self.selection = model._selection.copy()
         self.state_cov = model._state_cov.copy()
+        self.regimes = dict([(name, index.copy())
+                             for name, index in model.regimes.items()])
+        self.exog_matrices = dict([(name, value.copy()) for name, value in
+                                   model.exog_matrices.items()])
+        self.exog_matrices_data = model.exog_matrices_data
 
         self.missing = np.array(model._statespaces[self.prefix].missing,
                                 copy=True)
@@ -858,3 +1387,8 @@ class FrozenRepresentation(object):
                 model._statespaces[self.prefix].initial_state, copy=True)
             self.initial_state_cov = np.array(
                 model._statespaces[self.prefix].initial_state_cov, copy=True)
+            self.initial_diffuse_state_cov = None
+            if model.initialization == 'diffuse':
+                self.initial_diffuse_state_cov = np.array(
+                    model._statespaces[self.prefix].initial_diffuse_state_cov,
+                    copy=True)
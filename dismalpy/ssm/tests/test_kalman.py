@@ -21,6 +21,7 @@ from __future__ import division, absolute_import, print_function
 import numpy as np
 import pandas as pd
 import os
+import threading
 
 try:
     from scipy.linalg.blas import find_best_blas_type
@@ -36,8 +37,19 @@ except ImportError:
 
 
 from dismalpy.ssm import _statespace, _kalman_filter
+from dismalpy.ssm.kalman_filter import (
+    KalmanFilter, FILTER_CONVENTIONAL, FILTER_EXACT_INITIAL,
+    FILTER_STEADY_STATE, FILTER_CHANDRASEKHAR, FILTER_SQUARE_ROOT,
+    FILTER_UNIVARIATE, FILTER_INFORMATION, FILTER_BLOCK_SEQUENTIAL,
+    MEMORY_NO_FORECAST, MEMORY_NO_PREDICTED, MEMORY_NO_FILTERED,
+    MEMORY_NO_LIKELIHOOD, MEMORY_PACK_COV, MEMORY_CONSERVE, SOLVE_LU,
+    TRANSITION_BLOCK_DIAGONAL, TIMING_INIT_FILTERED
+)
+from dismalpy.ssm.kalman_smoother import KalmanSmoother
+from dismalpy.ssm.simulation_smoother import SimulationSmoother
 import dismalpy.ssm.tests.results_kalman as results_kalman_filter
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import (assert_almost_equal, assert_allclose,
+                           assert_equal, assert_raises)
 from nose.exc import SkipTest
 
 prefix_statespace_map = {
@@ -639,6 +651,101 @@ class TestClark1989ForecastConserve(Clark1989Forecast):
         self.run_filter()
 
 
+class TestClark1989ForecastIterate(Clark1989Forecast):
+    """
+    Test that stepping through the filter with the iterator protocol gives the
+    same results as the whole-sample filtering loop, including in the periods
+    with missing observations.
+    """
+    def __init__(self, filter_method=FILTER_CONVENTIONAL):
+        super(TestClark1989ForecastIterate, self).__init__()
+        self.filter.set_filter_method(filter_method)
+        self.run_filter()
+        self.loglikelihood = np.array(self.filter.loglikelihood)
+        self.filtered_state = np.array(self.filter.filtered_state)
+        self.predicted_state_cov = np.array(self.filter.predicted_state_cov)
+
+        # Re-run the filter, one period at a time
+        self.filter.seek(0)
+        for t in range(self.model.nobs):
+            next(self.filter)
+
+    def test_iterate(self):
+        assert_allclose(self.filter.loglikelihood, self.loglikelihood)
+        assert_allclose(self.filter.filtered_state, self.filtered_state)
+        assert_allclose(self.filter.predicted_state_cov,
+                        self.predicted_state_cov)
+
+    def test_stop_iteration(self):
+        assert_raises(StopIteration, next, self.filter)
+
+
+class TestClark1989ForecastIterateBlockSequential(
+        TestClark1989ForecastIterate):
+    """
+    Iterator protocol test with the block-sequential filter, the arrays of
+    which are only prepared at the start of the pass.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastIterateBlockSequential, self).__init__(
+            FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL)
+
+
+class TestClark1989ForecastIterateSquareRoot(TestClark1989ForecastIterate):
+    """
+    Iterator protocol test with the square-root filter, the state of which is
+    only prepared at the start of the pass.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastIterateSquareRoot, self).__init__(
+            FILTER_CONVENTIONAL | FILTER_SQUARE_ROOT)
+
+
+class TestClark1987Threaded(Clark1987):
+    """
+    Test that filters run concurrently (the filtering loop does not hold the
+    GIL) give the same results as a filter run by itself.
+    """
+    def __init__(self, nthreads=4):
+        super(TestClark1987Threaded, self).__init__(dtype=float)
+        self.init_filter()
+        self.run_filter()
+
+        filters = []
+        for i in range(nthreads):
+            self.init_filter()
+            filters.append(self.filter)
+        threads = [threading.Thread(target=kfilter) for kfilter in filters]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.filters = filters
+
+    def test_threaded(self):
+        for kfilter in self.filters:
+            assert_allclose(kfilter.loglikelihood,
+                            self.filter.loglikelihood)
+            assert_allclose(kfilter.filtered_state, self.result['state'])
+
+
+class TestClark1987Singular(object):
+    """
+    Test that an error encountered inside the filtering loop is raised once
+    the loop exits.
+    """
+    def __init__(self):
+        self.clark = Clark1987(dtype=float)
+        # Zero design matrix and observation covariance matrix imply a zero
+        # forecast error covariance matrix
+        self.clark.design[:] = 0
+        self.clark.init_filter()
+
+    def test_error(self):
+        assert_raises(np.linalg.LinAlgError, self.clark.filter)
+        assert_equal(self.clark.filter.t, 0)
+
+
 class TestClark1989ConserveAll(Clark1989):
     """
     Memory conservation forecasting test for the loglikelihood and filtered
@@ -675,4 +782,2177 @@ class TestClark1989ConserveAll(Clark1989):
         assert_almost_equal(
             self.result['state'][5][-1],
             self.true_states.iloc[end-1, 3], 4
-        )
\ No newline at end of file
+        )
+
+class TestClark1989Panel(object):
+    """
+    Test that filtering a panel of series sharing the model's system matrices
+    gives the same results as filtering each series separately.
+    """
+    def __init__(self, n_series=3):
+        self.clark = Clark1989(dtype=float)
+        obs = self.clark.obs
+        self.panel = np.asfortranarray(np.dstack([
+            obs, obs * 1.01, obs + np.sin(np.arange(obs.shape[1]))/100
+        ][:n_series]))
+
+        # Filter each series separately
+        self.results = []
+        for i in range(n_series):
+            self.clark.obs = np.asfortranarray(self.panel[:, :, i])
+            self.clark.init_filter()
+            self.clark.run_filter()
+            self.results.append(self.clark.filter)
+
+        # Filter the panel
+        self.clark.obs = obs
+        self.clark.init_filter()
+        self.clark.model.set_panel_obs(
+            np.asfortranarray(self.panel.transpose(0, 2, 1))
+        )
+        self.clark.run_filter()
+        self.filter = self.clark.filter
+
+    def test_panel(self):
+        for i, kfilter in enumerate(self.results):
+            assert_allclose(self.filter.panel_loglikelihood[i],
+                            kfilter.loglikelihood)
+            assert_allclose(self.filter.panel_forecast_error[:, i],
+                            kfilter.forecast_error)
+            assert_allclose(self.filter.panel_filtered_state[:, i],
+                            kfilter.filtered_state)
+            assert_allclose(self.filter.panel_predicted_state[:, i],
+                            kfilter.predicted_state)
+
+    def test_missing(self):
+        panel = self.panel.transpose(0, 2, 1).copy(order='F')
+        panel[0, 0, 0] = np.nan
+        assert_raises(ValueError, self.clark.model.set_panel_obs, panel)
+
+    def test_invalid_shape(self):
+        assert_raises(ValueError, self.clark.model.set_panel_obs, self.panel)
+
+    def test_invalid_filter_method(self):
+        # The panel recursions require the conventional filter
+        for filter_method in [FILTER_CONVENTIONAL | FILTER_SQUARE_ROOT,
+                              FILTER_CONVENTIONAL | FILTER_CHANDRASEKHAR,
+                              FILTER_CONVENTIONAL | FILTER_INFORMATION,
+                              FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL,
+                              FILTER_CONVENTIONAL | FILTER_UNIVARIATE,
+                              FILTER_SQUARE_ROOT, FILTER_INFORMATION]:
+            self.filter.set_filter_method(filter_method)
+            assert_raises(NotImplementedError, self.filter)
+
+
+class TestClark1987SteadyState(object):
+    """
+    Test that the steady-state filter gives the same results as the
+    conventional filter, once the conventional filter has converged.
+    """
+    def __init__(self):
+        self.clark = Clark1987(dtype=float)
+        self.clark.init_filter()
+        # The default tolerance is too strict for this model to converge
+        self.clark.filter.tolerance = 1e-14
+        self.clark.run_filter()
+        self.conventional = self.clark.filter
+        self.start = self.conventional.period_converged
+
+        self.clark.init_filter()
+        self.clark.filter.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_STEADY_STATE)
+        self.clark.filter.steady_state_start = self.start
+        self.clark.run_filter()
+        self.filter = self.clark.filter
+
+    def test_steady_state_cov(self):
+        assert_equal(self.filter.period_converged, self.start)
+        assert_allclose(self.filter.steady_state_cov,
+                        self.conventional.converged_predicted_state_cov,
+                        atol=1e-6)
+
+    def test_loglike(self):
+        start = self.start
+        assert_allclose(self.filter.loglikelihood[:start],
+                        self.conventional.loglikelihood[:start])
+        assert_allclose(self.filter.loglikelihood[start:],
+                        self.conventional.loglikelihood[start:], atol=1e-3)
+
+    def test_filtered_state(self):
+        start = self.start
+        assert_allclose(self.filter.filtered_state[:, :start],
+                        self.conventional.filtered_state[:, :start])
+        assert_allclose(self.filter.filtered_state[:, start:],
+                        self.conventional.filtered_state[:, start:],
+                        atol=1e-4)
+
+    def test_missing(self):
+        self.clark.obs = self.clark.obs.copy(order='F')
+        self.clark.obs[0, 0] = np.nan
+        self.clark.init_filter()
+        self.clark.filter.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_STEADY_STATE)
+        assert_raises(ValueError, self.clark.filter)
+
+
+class TestClark1989Chandrasekhar(Clark1989):
+    """
+    Test that the Chandrasekhar recursions give the same results as the
+    conventional filter, with a known (non-stationary) initialization.
+    """
+    def __init__(self):
+        super(TestClark1989Chandrasekhar, self).__init__(dtype=float)
+        self.init_filter()
+        self.run_filter()
+        self.conventional = self.filter
+
+        self.init_filter()
+        self.filter.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_CHANDRASEKHAR)
+        self.run_filter()
+
+    def test_rank(self):
+        assert_equal(self.filter.chandrasekhar_rank,
+                     self.model.k_states + self.model.k_endog)
+
+    def test_covariances(self):
+        # The initial state covariance matrix is large relative to the
+        # steady-state, so that some precision is lost in the increments
+        assert_allclose(self.filter.loglikelihood,
+                        self.conventional.loglikelihood, rtol=1e-5)
+        assert_allclose(self.filter.forecast_error_cov,
+                        self.conventional.forecast_error_cov, atol=1e-9)
+        assert_allclose(self.filter.predicted_state_cov,
+                        self.conventional.predicted_state_cov, atol=1e-8)
+        assert_allclose(self.filter.filtered_state_cov,
+                        self.conventional.filtered_state_cov, atol=1e-8)
+        assert_allclose(self.filter.kalman_gain,
+                        self.conventional.kalman_gain, atol=1e-4)
+
+
+class TestStationaryChandrasekhar(object):
+    """
+    Test that the Chandrasekhar recursions give the same results as the
+    conventional filter, with the stationary initialization.
+    """
+    def __init__(self, nobs=50, k_endog=2, k_states=6):
+        np.random.seed(1234)
+        transition = np.random.normal(size=(k_states, k_states))
+        transition /= 1.1 * np.max(np.abs(np.linalg.eigvals(transition)))
+        selection = np.random.normal(size=(k_states, 3))
+        design = np.random.normal(size=(k_endog, k_states))
+
+        def statespace(obs):
+            model = _statespace.dStatespace(
+                obs, np.asfortranarray(design[:, :, None]),
+                np.zeros((k_endog, 1), order='F'),
+                np.asfortranarray(np.eye(k_endog)[:, :, None]),
+                np.asfortranarray(transition[:, :, None]),
+                np.zeros((k_states, 1), order='F'),
+                np.asfortranarray(selection[:, :, None]),
+                np.asfortranarray(np.eye(3)[:, :, None])
+            )
+            model.initialize_stationary()
+            return model
+
+        self.obs = np.asfortranarray(np.random.normal(size=(k_endog, nobs)))
+        self.statespace = statespace
+        self.conventional = _kalman_filter.dKalmanFilter(statespace(self.obs))
+        self.conventional()
+        self.filter = _kalman_filter.dKalmanFilter(
+            statespace(self.obs), FILTER_CONVENTIONAL | FILTER_CHANDRASEKHAR)
+        self.filter()
+
+    def test_rank(self):
+        assert_equal(self.filter.chandrasekhar_rank, 2)
+
+    def test_covariances(self):
+        assert_allclose(self.filter.loglikelihood,
+                        self.conventional.loglikelihood)
+        assert_allclose(self.filter.forecast_error_cov,
+                        self.conventional.forecast_error_cov)
+        assert_allclose(self.filter.predicted_state_cov,
+                        self.conventional.predicted_state_cov, atol=1e-12)
+        assert_allclose(self.filter.filtered_state,
+                        self.conventional.filtered_state)
+
+    def test_missing(self):
+        obs = self.obs.copy(order='F')
+        obs[0, 0] = np.nan
+        kfilter = _kalman_filter.dKalmanFilter(
+            self.statespace(obs), FILTER_CONVENTIONAL | FILTER_CHANDRASEKHAR)
+        assert_raises(ValueError, kfilter)
+
+
+class TestSquareRoot(object):
+    """
+    Test that the square-root filter gives the same results as the
+    conventional filter, including with (partially) missing observations and
+    a diffuse initialization.
+    """
+    def __init__(self, nobs=50, k_endog=2, k_states=4):
+        np.random.seed(1234)
+        obs = np.random.normal(size=(nobs, k_endog))
+        obs[10:13] = np.nan
+        obs[20:25, 0] = np.nan
+        self.design = np.random.normal(size=(k_endog, k_states))
+        self.transition = np.diag([1., 0.9, 0.5, -0.3])
+        self.obs = obs
+        self.k_endog = k_endog
+        self.k_states = k_states
+
+        self.conventional = self.model().filter()
+        self.results = self.model(filter_square_root=True).filter()
+
+    def model(self, **kwargs):
+        mod = KalmanFilter(k_endog=self.k_endog, k_states=self.k_states,
+                           **kwargs)
+        mod.bind(self.obs)
+        mod['design'] = self.design
+        mod['obs_cov'] = np.diag([0.5, 0.3])
+        mod['transition'] = self.transition
+        mod['selection'] = np.eye(self.k_states)
+        mod['state_cov'] = np.eye(self.k_states) * 0.4
+        mod.initialize_approximate_diffuse(1e4)
+        return mod
+
+    def test_filter_method(self):
+        assert_equal(self.results.filter_method,
+                     FILTER_CONVENTIONAL | FILTER_SQUARE_ROOT)
+
+    def test_covariances(self):
+        assert_allclose(self.results.llf_obs, self.conventional.llf_obs)
+        assert_allclose(self.results.forecasts_error_cov,
+                        self.conventional.forecasts_error_cov)
+        assert_allclose(self.results.predicted_state_cov,
+                        self.conventional.predicted_state_cov, atol=1e-8)
+        assert_allclose(self.results.filtered_state,
+                        self.conventional.filtered_state, atol=1e-8)
+
+    def test_factor(self):
+        factor = self.results.unpack_predicted_state_cov_factor()
+        assert_equal(factor.shape,
+                     (self.k_states, self.k_states, self.obs.shape[0] + 1))
+        assert_equal(np.triu(factor[:, :, 10], 1), 0)
+        assert_allclose(np.einsum('ijt,kjt->ikt', factor, factor),
+                        self.results.predicted_state_cov)
+        assert_raises(RuntimeError,
+                      self.conventional.unpack_predicted_state_cov_factor)
+
+    def test_memory_no_predicted(self):
+        results = self.model(
+            filter_square_root=True, conserve_memory=MEMORY_NO_PREDICTED
+        ).filter()
+        assert_allclose(results.llf_obs, self.conventional.llf_obs)
+        assert_allclose(results.predicted_state_cov,
+                        self.conventional.predicted_state_cov, atol=1e-8)
+
+    def test_invalid(self):
+        mod = self.model(filter_square_root=True)
+        mod.filter_univariate = True
+        assert_raises(NotImplementedError, mod.filter)
+        mod = self.model(filter_square_root=True)
+        mod['design'] = self.design + 0j
+        assert_raises(NotImplementedError, mod.filter)
+
+
+class TestExactDiffuse(object):
+    """
+    Test the exact diffuse initialization, using a local linear trend model
+    (two diffuse periods) and a bivariate model with one diffuse state.
+    """
+    def __init__(self, nobs=30):
+        np.random.seed(1234)
+        self.nobs = nobs
+        self.endog = np.cumsum(np.random.normal(size=nobs))
+
+    def trend_model(self, endog=None, exact=True):
+        mod = KalmanFilter(k_endog=1, k_states=2)
+        mod.bind(self.endog.copy() if endog is None else endog)
+        mod['design'] = np.array([[1., 0]])
+        mod['obs_cov'] = np.array([[0.7]])
+        mod['transition'] = np.array([[1., 1], [0, 1]])
+        mod['selection'] = np.eye(2)
+        mod['state_cov'] = np.diag([0.3, 0.1])
+        if exact:
+            mod.initialize_diffuse()
+            mod.filter_exact_initial = True
+        else:
+            mod.initialize_approximate_diffuse(1e7)
+        return mod
+
+    def test_local_level(self):
+        # With a single diffuse state, the first observation gives
+        # $a_2 = y_1$ and $P_2 = \sigma_\varepsilon^2 + \sigma_\eta^2$
+        def local_level(endog):
+            mod = KalmanFilter(k_endog=1, k_states=1)
+            mod.bind(endog.copy())
+            mod['design'] = np.array([[1.]])
+            mod['obs_cov'] = np.array([[0.7]])
+            mod['transition'] = np.array([[1.]])
+            mod['selection'] = np.array([[1.]])
+            mod['state_cov'] = np.array([[0.3]])
+            return mod
+
+        mod = local_level(self.endog)
+        mod.initialize_diffuse()
+        res = mod.filter(filter_method=FILTER_CONVENTIONAL |
+                                       FILTER_EXACT_INITIAL)
+
+        assert_equal(res.nobs_diffuse, 1)
+        assert_allclose(res.predicted_state[0, 1], self.endog[0])
+        assert_allclose(res.predicted_state_cov[0, 0, 1], 1.0)
+        assert_allclose(res.predicted_diffuse_state_cov[0, 0, :2], [1, 0])
+        assert_allclose(res.llf_obs[0], -0.5 * np.log(2 * np.pi))
+
+        # The remaining periods are as if initialized with known values
+        mod = local_level(self.endog[1:])
+        mod.initialize_known(np.array([self.endog[0]]), np.array([[1.0]]))
+        desired = mod.filter(filter_method=FILTER_CONVENTIONAL)
+        assert_allclose(res.llf_obs[1:], desired.llf_obs)
+
+    def test_approximate_diffuse(self):
+        res = self.trend_model().filter()
+        desired = self.trend_model(exact=False).filter()
+        assert_equal(res.nobs_diffuse, 2)
+        assert_equal(res.filter_method,
+                     FILTER_CONVENTIONAL | FILTER_EXACT_INITIAL)
+        assert_allclose(res.llf_obs[2:], desired.llf_obs[2:], rtol=1e-6)
+        assert_allclose(res.filtered_state[:, 2:],
+                        desired.filtered_state[:, 2:], rtol=1e-6)
+        assert_allclose(res.predicted_state_cov[:, :, 3:],
+                        desired.predicted_state_cov[:, :, 3:], rtol=1e-6)
+        assert_allclose(res.predicted_diffuse_state_cov[:, :, 2:], 0)
+
+    def test_missing(self):
+        endog = self.endog.copy()
+        endog[1] = np.nan
+        res = self.trend_model(endog).filter()
+        desired = self.trend_model(endog, exact=False).filter()
+        assert_equal(res.nobs_diffuse, 3)
+        assert_equal(res.forecasts_error_diffuse_cov[0, 0, 1], 0)
+        assert_allclose(res.llf_obs[3:], desired.llf_obs[3:], rtol=1e-6)
+
+    def test_partially_diffuse(self):
+        # A random walk (diffuse) and an AR(1) (stationary) state
+        endog = np.c_[self.endog, np.random.normal(size=self.nobs)]
+        transition = np.diag([1., 0.5])
+        design = np.array([[1., 0.5], [0.2, 1.]])
+        initial_state_cov = np.diag([0., 1 / (1 - 0.5**2)])
+        initial_diffuse_state_cov = np.diag([1., 0.])
+
+        def model():
+            mod = KalmanFilter(k_endog=2, k_states=2)
+            mod.bind(endog.copy())
+            mod['design'] = design
+            mod['obs_cov'] = np.diag([0.7, 0.4])
+            mod['transition'] = transition
+            mod['selection'] = np.eye(2)
+            mod['state_cov'] = np.eye(2)
+            return mod
+
+        mod = model()
+        mod.initialize_diffuse(initial_state_cov=initial_state_cov,
+                               initial_diffuse_state_cov=np.eye(2))
+        mod.filter_exact_initial = True
+        # F_\infty is nonsingular, so that all states are identified by
+        # the first observation
+        assert_equal(mod.filter().nobs_diffuse, 1)
+
+        # With one diffuse state F_\infty has rank one, so that the
+        # observations in the first period are processed one at a time
+        mod.initialize_diffuse(
+            initial_state_cov=initial_state_cov,
+            initial_diffuse_state_cov=initial_diffuse_state_cov)
+        res = mod.filter()
+
+        desired = model()
+        desired.initialize_known(
+            np.zeros(2), initial_state_cov + 1e7 * initial_diffuse_state_cov)
+        desired = desired.filter()
+
+        assert_equal(res.nobs_diffuse, 1)
+        assert_allclose(res.llf_obs[1:], desired.llf_obs[1:], rtol=1e-6)
+        assert_allclose(res.filtered_state[:, 1:],
+                        desired.filtered_state[:, 1:], rtol=1e-5)
+
+    def test_batch(self):
+        mod = self.trend_model()
+        batch = [mod._batch_representation()] * 2
+        assert_allclose(mod._loglike_batch(batch), mod.loglike() * np.ones(2))
+
+    def test_invalid(self):
+        # The exact diffuse initialization requires FILTER_EXACT_INITIAL
+        mod = self.trend_model()
+        mod.filter_exact_initial = False
+        assert_raises(ValueError, mod.filter)
+
+        # Singular but non-zero diffuse forecast error covariance matrix, with
+        # a non-diagonal observation covariance matrix
+        mod = KalmanFilter(k_endog=2, k_states=2)
+        mod.bind(np.c_[self.endog, self.endog])
+        mod['design'] = np.ones((2, 2))
+        mod['obs_cov'] = np.array([[1., 0.5], [0.5, 1.]])
+        mod['transition'] = np.eye(2)
+        mod['selection'] = np.eye(2)
+        mod['state_cov'] = np.eye(2)
+        mod.initialize_diffuse()
+        mod.filter_exact_initial = True
+        assert_raises(np.linalg.LinAlgError, mod.filter)
+
+
+class TestLoglikelihoodBatch(object):
+    """
+    Test the loglikelihood of a batch of representations, with elements
+    differing in their matrices and initialization, against the
+    loglikelihood of each element computed separately.
+    """
+    def __init__(self, nobs=40):
+        np.random.seed(1234)
+        self.endog = np.c_[np.cumsum(np.random.normal(size=nobs)),
+                           np.random.normal(size=nobs)]
+        self.mod = KalmanFilter(k_endog=2, k_states=2)
+        self.mod.bind(self.endog.copy())
+        self.mod['design'] = np.array([[1., 0.5], [0.2, 1.]])
+        self.mod['obs_cov'] = np.diag([0.7, 0.4])
+        self.mod['selection'] = np.eye(2)
+        self.mod['state_cov'] = np.diag([0.3, 0.1])
+        self.mod.filter_exact_initial = True
+
+    def batch(self, **kwargs):
+        # (the first state is a random walk only for the elements with a
+        # diffuse initialization)
+        mod = self.mod
+        batch = []
+        desired = []
+        initializations = [
+            lambda: mod.initialize_known(np.array([1., -1.]),
+                                         np.diag([2., 1.])),
+            lambda: mod.initialize_approximate_diffuse(1e3),
+            lambda: mod.initialize_stationary(),
+            lambda: mod.initialize_diffuse(
+                initial_state_cov=np.diag([0., 1 / (1 - 0.5**2)]),
+                initial_diffuse_state_cov=np.diag([1., 0.]))
+        ]
+        for i in range(8):
+            initialize = initializations[i % 4]
+            rho = 1. if i % 4 == 3 else 0.9 - 0.2 * i
+            mod['transition'] = np.diag([rho, 0.5])
+            mod['obs_cov', 0, 0] = 0.5 + 0.1 * i
+            initialize()
+            batch.append(mod._batch_representation())
+            desired.append(mod.loglike(**kwargs))
+        return batch, desired
+
+    def test_batch(self):
+        batch, desired = self.batch()
+        assert_allclose(self.mod._loglike_batch(batch), desired)
+        for nthreads in [2, 3]:
+            assert_allclose(self.mod._loglike_batch(batch, nthreads=nthreads),
+                            desired)
+        assert_allclose(self.mod._loglike_batch(batch[:1]), desired[:1])
+
+    def test_cache(self):
+        # The statespace models and Kalman filters of each thread are
+        # retained between batches
+        mod = self.mod
+        batch, desired = self.batch()
+        mod._loglike_batch(batch, nthreads=2)
+        kfilters = [entry[3] for entry in mod._batch_kalman_filters['d']]
+        assert_allclose(mod._loglike_batch(batch, nthreads=2), desired)
+        assert_equal([entry[3] for entry in mod._batch_kalman_filters['d']],
+                     kfilters)
+
+        # They are re-created if the options of the Kalman filter change
+        batch, desired = self.batch(loglikelihood_burn=3)
+        assert_allclose(mod._loglike_batch(batch, loglikelihood_burn=3),
+                        desired)
+        assert_equal(mod._batch_kalman_filters['d'][0][3] is kfilters[0],
+                     False)
+
+        # And they are given new data bound to the model
+        mod.bind(self.endog[::-1].copy())
+        batch, desired = self.batch()
+        assert_allclose(mod._loglike_batch(batch), desired)
+
+    def test_invalid(self):
+        mod = self.mod
+        batch, desired = self.batch()
+        mod._loglike_batch(batch)
+        kfilter = mod._batch_kalman_filters['d'][0][3]
+        matrices = [
+            np.zeros(matrix.shape + (2,), order='F')
+            for matrix in [mod._design, mod._obs_intercept, mod._obs_cov,
+                           mod._transition, mod._state_intercept,
+                           mod._selection, mod._state_cov]
+        ]
+        initialization = [
+            ['known'] * 2, np.zeros((2, 2), order='F'),
+            np.zeros((2, 2, 2), order='F'), np.zeros((2, 2, 2), order='F'),
+            np.ones(2)
+        ]
+        loglikelihood_batch = _kalman_filter.dloglikelihood_batch
+
+        # Matrices with the wrong shape
+        invalid = list(matrices)
+        invalid[3] = np.zeros((3, 2, 1, 2), order='F')
+        assert_raises(ValueError, loglikelihood_batch, kfilter,
+                      *invalid + initialization)
+
+        # Inconsistent number of elements in the batch
+        invalid = list(matrices)
+        invalid[0] = np.zeros(mod._design.shape + (3,), order='F')
+        assert_raises(ValueError, loglikelihood_batch, kfilter,
+                      *invalid + initialization)
+        invalid = list(initialization)
+        invalid[0] = ['known']
+        assert_raises(ValueError, loglikelihood_batch, kfilter,
+                      *matrices + invalid)
+
+        # Invalid initialization
+        invalid = list(initialization)
+        invalid[0] = ['known', 'invalid']
+        assert_raises(RuntimeError, loglikelihood_batch, kfilter,
+                      *matrices + invalid)
+
+
+class TestScoreObs(object):
+    """
+    Test the analytic score per observation against central finite
+    differences of the loglikelihood, for a model with more observed
+    variables than states, intercepts, time-varying matrices, and periods
+    with some or all observations missing.
+    """
+    def __init__(self, nobs=30):
+        np.random.seed(1234)
+        self.endog = np.random.normal(size=(nobs, 3))
+        self.endog[3, :] = np.nan
+        self.endog[7, 1] = np.nan
+        self.params = np.array([0.2, 0.3, 0.9, 0.5, 0.1, 0.7, 0.4])
+
+    def model(self, params, initialization='stationary', filter_timing=0):
+        nobs = self.endog.shape[0]
+        mod = KalmanFilter(k_endog=3, k_states=2)
+        mod.bind(self.endog.copy())
+        mod['design'] = np.arange(6).reshape(3, 2) / 5. + params[0]
+        mod['obs_intercept'] = np.ones((3, nobs)) * params[1]
+        mod['obs_cov'] = np.diag([1., 2., 3.]) * params[2]
+        mod['transition'] = np.array([[params[3], 0.1], [0., 0.3]])
+        mod['state_intercept'] = np.ones(2) * params[4]
+        mod['selection'] = np.c_[[1., params[6]], [0., 1.]]
+        mod['state_cov'] = (np.eye(2)[:, :, None] *
+                            (params[5] + np.arange(nobs) / nobs))
+        if initialization == 'known':
+            mod.initialize_known(np.array([params[6], 0.]),
+                                 np.eye(2) * params[5])
+        else:
+            mod.initialize_stationary()
+        mod.filter_timing = filter_timing
+        mod.loglikelihood_burn = 2
+        return mod
+
+    def check_score_obs(self, epsilon=1e-6, **kwargs):
+        k_params = len(self.params)
+        desired = np.zeros((self.endog.shape[0], k_params))
+        partials = {}
+        for i in range(k_params):
+            increment = np.zeros(k_params)
+            increment[i] = epsilon
+            upper = self.model(self.params + increment, **kwargs)
+            lower = self.model(self.params - increment, **kwargs)
+            desired[:, i] = (upper.loglikeobs() -
+                             lower.loglikeobs()) / (2 * epsilon)
+            for name in list(upper.shapes.keys()) + ['initial_state',
+                                                     'initial_state_cov']:
+                if name == 'obs' or getattr(upper, '_' + name) is None:
+                    continue
+                matrix = getattr(upper, '_' + name)
+                partial = (matrix - getattr(lower, '_' + name)) / (2 * epsilon)
+                if name not in partials:
+                    partials[name] = np.zeros(matrix.shape + (k_params,))
+                partials[name][..., i] = partial
+
+        mod = self.model(self.params, **kwargs)
+        assert_allclose(mod.score_obs(partials), desired, rtol=1e-5,
+                        atol=1e-6)
+        assert_equal(mod.score_obs(partials)[:2], 0)
+
+    def test_stationary(self):
+        self.check_score_obs()
+
+    def test_known(self):
+        self.check_score_obs(initialization='known')
+
+    def test_filter_timing(self):
+        self.check_score_obs(filter_timing=TIMING_INIT_FILTERED)
+
+    def test_invalid(self):
+        mod = self.model(self.params)
+        assert_raises(ValueError, mod.score_obs,
+                      {'design': np.zeros((3, 3, 1, 2))})
+        assert_raises(ValueError, mod.score_obs,
+                      {'obs_intercept': np.zeros((3, 2, 2))})
+
+
+class ConserveRing(object):
+    """
+    Memory conservation test in which the forecasts, filtered and predicted
+    output of the last periods are held in ring buffers; these should
+    correspond to the output of the last periods when all output is stored.
+    """
+    timing_init_filtered = False
+
+    def run_ring(self):
+        # Filter, storing all output
+        self.init_filter()
+        self.filter.filter_timing = self.timing_init_filtered
+        self.run_filter()
+        self.desired = dict([
+            (name, np.array(getattr(self.filter, name)))
+            for name in ['forecast', 'forecast_error', 'forecast_error_cov',
+                         'filtered_state', 'filtered_state_cov',
+                         'predicted_state', 'predicted_state_cov']
+        ])
+
+        # Filter, storing the output of the last periods only
+        self.conserve_memory = (MEMORY_NO_FORECAST | MEMORY_NO_PREDICTED |
+                                MEMORY_NO_FILTERED)
+        self.init_filter()
+        self.filter.filter_timing = self.timing_init_filtered
+        self.run_filter()
+
+    def test_filtered_state(self):
+        end = self.true_states.shape[0]
+        for i, state in enumerate(self.states):
+            assert_almost_equal(
+                self.result['state'][state][-1],
+                self.true_states.iloc[end-1, i], 4
+            )
+
+    def test_last_periods(self):
+        kfilter = self.filter
+        assert_equal(np.array(kfilter.filtered_state).shape[1], 2)
+        for name in ['forecast', 'forecast_error', 'filtered_state']:
+            assert_allclose(getattr(kfilter, name)[:, 0],
+                            self.desired[name][:, -1])
+            assert_allclose(getattr(kfilter, name)[:, 1],
+                            self.desired[name][:, -1])
+        for name in ['forecast_error_cov', 'filtered_state_cov']:
+            assert_allclose(getattr(kfilter, name)[:, :, 1],
+                            self.desired[name][:, :, -1])
+
+        if self.timing_init_filtered:
+            assert_allclose(np.array(kfilter.predicted_state)[:, :2],
+                            self.desired['predicted_state'][:, [-2, -2]])
+            assert_allclose(
+                np.array(kfilter.predicted_state_cov)[:, :, :2],
+                self.desired['predicted_state_cov'][:, :, [-2, -2]])
+        else:
+            assert_allclose(kfilter.predicted_state,
+                            self.desired['predicted_state'][:, [-2, -1, -1]])
+            assert_allclose(
+                kfilter.predicted_state_cov,
+                self.desired['predicted_state_cov'][:, :, [-2, -1, -1]])
+
+
+class TestClark1987ConserveRing(ConserveRing, Clark1987):
+    """
+    Memory conservation (ring buffer) test for the loglikelihood and filtered
+    states.
+    """
+    states = [0, 1, 3]
+
+    def __init__(self):
+        super(TestClark1987ConserveRing, self).__init__(dtype=float)
+        self.run_ring()
+
+
+class TestClark1987ConserveRingFiltered(ConserveRing, Clark1987):
+    """
+    Memory conservation (ring buffer) test for the loglikelihood and filtered
+    states, with the filter initialized with the filtered state.
+    """
+    states = [0, 1, 3]
+    timing_init_filtered = True
+
+    def __init__(self):
+        super(TestClark1987ConserveRingFiltered, self).__init__(dtype=float)
+        # Kim and Nelson's (1999) initial state covariance matrix is that of
+        # the filtered initial state
+        self.initial_state_cov = np.asfortranarray(np.eye(self.k_states)*100)
+        self.run_ring()
+
+
+class TestClark1989ConserveRing(ConserveRing, Clark1989):
+    """
+    Memory conservation (ring buffer) test for the loglikelihood and filtered
+    states with two-dimensional observation vector (the sample size of which
+    gives a different arrangement of the ring buffers).
+    """
+    states = [0, 1, 4, 5]
+
+    def __init__(self):
+        super(TestClark1989ConserveRing, self).__init__(dtype=float)
+        self.run_ring()
+
+
+class PackedCovariances(object):
+    """
+    Packed covariance storage test: the covariance matrices stored in packed
+    (lower triangular, by column) form should correspond to those stored in
+    full.
+    """
+    timing_init_filtered = False
+
+    def run_packed(self):
+        # Filter, storing the covariance matrices in full
+        self.init_filter()
+        self.filter.filter_timing = self.timing_init_filtered
+        self.run_filter()
+        self.desired = dict([
+            (name, np.array(getattr(self.filter, name)))
+            for name in ['forecast_error_cov', 'filtered_state_cov',
+                         'predicted_state_cov']
+        ])
+
+        # Filter, storing the covariance matrices in packed form
+        self.conserve_memory = MEMORY_PACK_COV
+        self.init_filter()
+        self.filter.filter_timing = self.timing_init_filtered
+        self.run_filter()
+
+    def test_packed(self):
+        for name, desired in self.desired.items():
+            packed = np.array(getattr(self.filter, name + '_packed'))
+            rows, cols = np.triu_indices(desired.shape[0])
+            assert_equal(packed.shape, (len(rows), desired.shape[2]))
+            assert_allclose(packed, desired[cols, rows])
+
+
+class TestClark1987Packed(PackedCovariances, Clark1987):
+    """
+    Packed covariance storage test for the loglikelihood and filtered states.
+    """
+    def __init__(self):
+        super(TestClark1987Packed, self).__init__(dtype=float)
+        self.run_packed()
+
+    def test_results(self):
+        mod = KalmanSmoother(k_endog=1, k_states=1)
+        mod.bind(np.arange(10) * 1.)
+        mod['design', 0, 0] = 1.
+        mod['obs_cov', 0, 0] = 1.
+        mod['transition', 0, 0] = 1.
+        mod['selection', 0, 0] = 1.
+        mod['state_cov', 0, 0] = 1.
+        mod.initialize_approximate_diffuse()
+        desired = mod.filter()
+        mod.set_conserve_memory(MEMORY_PACK_COV)
+        res = mod.filter()
+
+        # The results unpack the covariance matrices on access
+        for name in ['filtered_state_cov', 'predicted_state_cov',
+                     'forecasts_error_cov']:
+            assert_allclose(getattr(res, name), getattr(desired, name))
+
+        # Smoothing is not available with packed storage
+        assert_raises(ValueError, mod.smooth)
+
+
+class TestClark1987PackedFiltered(PackedCovariances, Clark1987):
+    """
+    Packed covariance storage test for the loglikelihood and filtered states,
+    with the filter initialized with the filtered state.
+    """
+    timing_init_filtered = True
+
+    def __init__(self):
+        super(TestClark1987PackedFiltered, self).__init__(dtype=float)
+        # Kim and Nelson's (1999) initial state covariance matrix is that of
+        # the filtered initial state
+        self.initial_state_cov = np.asfortranarray(np.eye(self.k_states)*100)
+        self.run_packed()
+
+
+class TestClark1989ForecastPacked(PackedCovariances, Clark1989Forecast):
+    """
+    Packed covariance storage forecasting test for the loglikelihood and
+    filtered states.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastPacked, self).__init__(dtype=float)
+        self.run_packed()
+
+
+class TestClark1987SmallKernels(Clark1987):
+    """
+    Test for the loglikelihood and filtered states with the unrolled kernels
+    used for small models (a single observed variable and at most four
+    states), which should give the same results as the BLAS-based
+    conventional filter.
+    """
+    names = ['loglikelihood', 'forecast', 'forecast_error',
+             'forecast_error_cov', 'filtered_state', 'filtered_state_cov',
+             'predicted_state', 'predicted_state_cov', 'kalman_gain', 'tmp1']
+
+    def __init__(self, dtype=float):
+        super(TestClark1987SmallKernels, self).__init__(dtype=dtype)
+        self.dtype = dtype
+
+        # Filter with the BLAS-based kernels
+        self.init_filter()
+        self.filter.small_kernels = False
+        self.run_filter()
+        self.desired = dict([
+            (name, np.array(getattr(self.filter, name)))
+            for name in self.names
+        ])
+
+        # Filter with the unrolled kernels (the default)
+        self.init_filter()
+        self.run_filter()
+
+    def test_small_kernels(self):
+        for name in self.names:
+            assert_allclose(getattr(self.filter, name), self.desired[name],
+                            rtol=1e-7)
+
+    def check_k_states(self, k_states):
+        np.random.seed(1234)
+        endog = np.cumsum(np.random.normal(size=50))
+        endog[10:12] = np.nan
+        mod = KalmanFilter(k_endog=1, k_states=k_states)
+        mod.bind(endog.astype(self.dtype))
+        mod['design'] = np.arange(1, k_states + 1)[None, :] / k_states
+        mod['obs_cov'] = np.array([[0.5]])
+        mod['transition'] = np.eye(k_states) * 0.5
+        mod['selection'] = np.eye(k_states)
+        mod['state_cov'] = np.eye(k_states) * 0.1
+        mod.initialize_approximate_diffuse()
+        res = mod.filter()
+        mod.small_kernels = False
+        desired = mod.filter()
+
+        # The option also applies to the loglikelihood evaluation
+        assert_allclose(mod.loglike(), res.llf_obs.sum())
+        assert_equal(mod._loglikelihood_filters[mod.prefix].small_kernels,
+                     False)
+
+        for name in ['llf_obs', 'filtered_state', 'filtered_state_cov',
+                     'kalman_gain', 'tmp1']:
+            assert_allclose(getattr(res, name), getattr(desired, name),
+                            rtol=1e-7)
+
+    def test_k_states(self):
+        # (the other sizes for which the unrolled kernels are used)
+        for k_states in [1, 2, 3]:
+            yield self.check_k_states, k_states
+
+
+class TestClark1987SmallKernelsComplex(TestClark1987SmallKernels):
+    """
+    Double complex test for the loglikelihood and filtered states with the
+    unrolled kernels used for small models.
+    """
+    def __init__(self):
+        super(TestClark1987SmallKernelsComplex, self).__init__(dtype=complex)
+
+
+class TestClark1989ForecastMissing(Clark1989Forecast):
+    """
+    Forecasting test for the loglikelihood and filtered states, with only one
+    of the observed variables missing in some of the forecast periods (so
+    that the selected matrices are cached for several missing data patterns).
+    """
+    def __init__(self, time_varying=False):
+        super(TestClark1989ForecastMissing, self).__init__(dtype=float)
+        nobs = self._obs.shape[1]
+
+        # Observe one of the variables in some of the forecast periods
+        self.obs[0, nobs + 10:nobs + 20] = self._obs[0, -10:]
+        self.obs[1, nobs + 30:nobs + 40] = self._obs[1, -10:]
+        self.obs[1, nobs + 50:nobs + 52] = self._obs[1, -2:]
+        if time_varying:
+            self.design = np.asfortranarray(
+                np.repeat(self.design, self.obs.shape[1], axis=2))
+            self.design[1, 1, nobs:] *= 0.5
+        self.init_filter()
+        self.run_filter()
+
+        # The stored results only cover the periods prior to the forecasts
+        self.result['loglike'] = (
+            lambda burn: np.sum(self.filter.loglikelihood[burn:nobs]))
+
+    def desired_loglikelihood(self, design, obs_intercept, obs_cov):
+        # Kalman filter, selecting the non-missing elements of each period
+        nobs = self.obs.shape[1]
+        loglikelihood = np.zeros(nobs)
+        a = self.initial_state
+        P = self.initial_state_cov
+        T = self.transition[:, :, 0]
+        Q = self.state_cov[:, :, 0]
+        for t in range(nobs):
+            mask = ~np.isnan(self.obs[:, t])
+            if np.any(mask):
+                Z = design[:, :, t if design.shape[2] > 1 else 0][mask]
+                H = obs_cov[:, :, 0][mask][:, mask]
+                v = self.obs[mask, t] - obs_intercept[mask, 0] - Z.dot(a)
+                F = Z.dot(P).dot(Z.T) + H
+                loglikelihood[t] = -0.5 * (
+                    mask.sum() * np.log(2 * np.pi) +
+                    np.log(np.linalg.det(F)) + v.dot(np.linalg.solve(F, v)))
+                K = P.dot(Z.T).dot(np.linalg.inv(F))
+                a = a + K.dot(v)
+                P = P - K.dot(Z).dot(P)
+            a = T.dot(a)
+            P = T.dot(P).dot(T.T) + Q
+        return loglikelihood
+
+    def test_patterns(self):
+        missing = np.isnan(self.obs).astype(np.int32)
+        assert_equal(self.model.n_missing_patterns, 4)
+        assert_equal(
+            np.asarray(self.model.missing_patterns)[
+                :, self.model.missing_pattern],
+            missing)
+
+    def test_missing(self):
+        assert_allclose(
+            self.filter.loglikelihood,
+            self.desired_loglikelihood(self.design, self.obs_intercept,
+                                       self.obs_cov))
+
+    def test_changed_matrices(self):
+        # The cached matrices must be re-computed if the matrices are changed
+        # between runs of the filter
+        mod = KalmanFilter(k_endog=2, k_states=6)
+        mod.bind(self.obs.T.copy())
+        for name in ['design', 'obs_cov', 'transition', 'selection',
+                     'state_cov']:
+            mod[name] = getattr(self, name).copy()
+        mod.initialize_known(self.initial_state, self.initial_state_cov)
+        mod.filter()
+        mod['design', 1, 1] = 0.5 * self.design[1, 1, 0]
+        mod['obs_cov', 0, 0] = 1e-4
+        mod['obs_cov', 0, 1] = mod['obs_cov', 1, 0] = 1e-8
+        mod['obs_intercept', 1] = 0.01
+        res = mod.filter()
+        # (the direct implementation loses precision as the variance of the
+        # unobserved states grows in the forecast periods)
+        assert_allclose(
+            res.llf_obs,
+            self.desired_loglikelihood(mod.design, mod.obs_intercept,
+                                       mod.obs_cov), rtol=1e-5)
+
+
+class TestClark1989ForecastMissingTimeVarying(TestClark1989ForecastMissing):
+    """
+    Forecasting test for the loglikelihood and filtered states, with only one
+    of the observed variables missing in some of the forecast periods and a
+    time-varying design matrix.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastMissingTimeVarying, self).__init__(
+            time_varying=True)
+
+
+class TestConvergenceTimeVaryingIntercepts(object):
+    """
+    Test that a model whose only time-varying matrices are the intercepts
+    converges to the steady-state, and that the results match those of the
+    filter without convergence.
+    """
+    @staticmethod
+    def model(design):
+        np.random.seed(1234)
+        nobs = 100
+        mod = KalmanFilter(k_endog=1, k_states=2)
+        mod.bind(np.cumsum(np.random.normal(size=nobs)))
+        mod['design'] = design
+        mod['obs_cov'] = np.array([[0.5]])
+        mod['obs_intercept'] = np.linspace(0, 1, nobs)[None, :]
+        mod['transition'] = np.array([[0.8, 0.1], [0., 0.5]])
+        mod['state_intercept'] = np.random.normal(size=(2, nobs))
+        mod['selection'] = np.eye(2)
+        mod['state_cov'] = np.eye(2) * 0.2
+        mod.initialize_stationary()
+        return mod
+
+    @classmethod
+    def setup_class(cls):
+        design = np.array([[1., 0.5]])
+        cls.mod = cls.model(design)
+        cls.results = cls.mod.filter()
+
+        # The same model, but with a (constant) time-varying design matrix, so
+        # that the convergence check is never made
+        cls.time_varying = cls.model(np.repeat(design[:, :, None], 100,
+                                               axis=2))
+        cls.desired = cls.time_varying.filter()
+
+    def test_covariance_invariant(self):
+        assert_equal(self.mod._statespace.time_invariant, False)
+        assert_equal(self.mod._statespace.covariance_invariant, True)
+        assert_equal(self.time_varying._statespace.covariance_invariant,
+                     False)
+
+    def test_converged(self):
+        assert_equal(self.results.converged, True)
+        assert_equal(0 < self.results.period_converged < self.mod.nobs, True)
+        assert_equal(self.desired.converged, False)
+
+    def test_results(self):
+        for name in ['llf_obs', 'forecasts', 'forecasts_error',
+                     'forecasts_error_cov', 'filtered_state',
+                     'filtered_state_cov', 'predicted_state',
+                     'predicted_state_cov']:
+            assert_allclose(getattr(self.results, name),
+                            getattr(self.desired, name))
+
+
+class TestClark1989ForecastRecovery(Clark1989Forecast):
+    """
+    Forecasting test for the loglikelihood and filtered states, with the
+    observations of the forecast periods given but for a few gaps, from which
+    the converged filter recovers along paths cached for each missing data
+    pattern.
+    """
+    def __init__(self, inversion_method=None):
+        super(TestClark1989ForecastRecovery, self).__init__(
+            dtype=float, nforecast=150)
+        self.nobs = nobs = self._obs.shape[1]
+        self.inversion_method = inversion_method
+
+        # Observe the forecast periods, except for two gaps of each of two
+        # missing data patterns (once the filter has converged)
+        self.obs[:, nobs:] = self._obs[:, -150:]
+        self.obs[:, [nobs + 20, nobs + 50]] = np.nan
+        self.obs[0, [nobs + 80, nobs + 110]] = np.nan
+        self.run_recovery()
+        self.desired = self.filter
+
+        self.run_recovery(recovery_cache=False)
+        self.uncached = self.filter
+
+        # The same model, but with a (constant) time-varying design matrix,
+        # so that the convergence check is never made
+        design = self.design
+        self.design = np.asfortranarray(
+            np.repeat(design, self.obs.shape[1], axis=2))
+        self.run_recovery()
+        self.time_varying = self.filter
+        self.design = design
+
+        self.run_recovery()
+
+        # The stored results only cover the periods prior to the forecasts
+        self.result['loglike'] = (
+            lambda burn: np.sum(self.filter.loglikelihood[burn:nobs]))
+
+    def run_recovery(self, recovery_cache=True):
+        self.init_filter()
+        if self.inversion_method is not None:
+            self.filter.inversion_method = self.inversion_method
+        self.filter.recovery_cache = recovery_cache
+        self.run_filter()
+
+    def test_recovery(self):
+        nobs = self.nobs
+
+        # The filter converged before the first gap, and the recovery paths
+        # were cached for each missing data pattern
+        assert_equal(self.filter.converged, True)
+        assert_equal(self.time_varying.converged, False)
+        length = np.asarray(self.filter.recovery_length)
+        assert_equal(np.sum(length > 0), 2)
+        assert_equal(np.max(length) < 30, True)
+
+        # The cached paths are re-used exactly
+        predicted_state_cov = np.array(self.filter.predicted_state_cov)
+        kalman_gain = np.array(self.filter.kalman_gain)
+        for start in [nobs + 20, nobs + 80]:
+            assert_equal(predicted_state_cov[:, :, start + 30:start + 60],
+                         predicted_state_cov[:, :, start:start + 30])
+            assert_equal(kalman_gain[:, :, start + 30:start + 60],
+                         kalman_gain[:, :, start:start + 30])
+
+        # Compare against the filter without the cache and without
+        # convergence (these differ by the approximation of the steady-state
+        # by the converged matrices)
+        for name in ['loglikelihood', 'forecast', 'filtered_state',
+                     'filtered_state_cov', 'predicted_state',
+                     'predicted_state_cov', 'kalman_gain']:
+            actual = getattr(self.filter, name)
+            assert_allclose(actual, getattr(self.uncached, name), atol=1e-4)
+            assert_allclose(actual, getattr(self.time_varying, name),
+                            atol=1e-4)
+
+
+class TestClark1989ForecastRecoveryLU(TestClark1989ForecastRecovery):
+    """
+    Forecasting test for the loglikelihood and filtered states, with the
+    recovery paths of the converged filter cached, where the forecast error
+    covariance matrix is inverted with an LU decomposition.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastRecoveryLU, self).__init__(
+            inversion_method=SOLVE_LU)
+
+
+class Precision(object):
+    """
+    Single precision Kalman filter (with the loglikelihood accumulated in
+    double precision) test for the loglikelihood and filtered states, against
+    the double precision filter.
+
+    The models of Clark (1987, 1989) are too ill-conditioned for single
+    precision (see `TestClark1987Single`), so that this uses a
+    well-conditioned stationary model.
+    """
+    def __init__(self, filter_method=FILTER_CONVENTIONAL, dtype=float):
+        np.random.seed(1234)
+        endog = np.random.normal(size=(200, 2))
+        endog[[20, 21], 0] = np.nan
+        endog[50] = np.nan
+        self.dtype = dtype
+        self.mod = mod = KalmanFilter(k_endog=2, k_states=3)
+        mod.bind(endog.astype(dtype))
+        mod['design'] = np.array([[1., 0.5, 0.], [0.2, 0., 1.]])
+        mod['obs_cov'] = np.eye(2) * 0.5
+        mod['transition'] = np.array([[0.8, 0.1, 0.], [0., 0.5, 0.],
+                                      [0., 0.2, -0.3]])
+        mod['selection'] = np.eye(3)
+        mod['state_cov'] = np.eye(3) * 0.2
+        mod.initialize_stationary()
+        mod.filter_method = filter_method
+
+        self.desired = mod.filter()
+        self.results = mod.filter(precision='single')
+
+    def test_loglike(self):
+        assert_allclose(self.results.llf_obs, self.desired.llf_obs,
+                        rtol=1e-5)
+        assert_allclose(np.sum(self.results.llf_obs),
+                        np.sum(self.desired.llf_obs), rtol=1e-6)
+        assert_allclose(self.mod.loglike(precision='single'),
+                        np.sum(self.results.llf_obs))
+
+    def test_filtered_state(self):
+        for name in ['forecasts', 'filtered_state', 'filtered_state_cov',
+                     'predicted_state', 'predicted_state_cov']:
+            assert_allclose(getattr(self.results, name),
+                            getattr(self.desired, name), atol=1e-5)
+
+    def test_dtype(self):
+        # The precision is only overridden for the call
+        double = self.dtype == float
+        assert_equal(self.mod.precision, None)
+        assert_equal(self.desired.prefix, 'd' if double else 'z')
+        assert_equal(self.results.prefix, 's' if double else 'c')
+
+        # Outputs are stored in single precision, except the loglikelihood
+        assert_equal(self.results.filtered_state.dtype,
+                     np.float32 if double else np.complex64)
+        assert_equal(self.results.llf_obs.dtype,
+                     np.float64 if double else np.complex128)
+
+
+class TestPrecision(Precision):
+    """
+    Single precision test for the loglikelihood and filtered states.
+    """
+    def __init__(self):
+        super(TestPrecision, self).__init__()
+
+    def test_precision_option(self):
+        mod = self.mod
+        assert_equal(mod.prefix, 'd')
+        mod.precision = 'single'
+        assert_equal(mod.prefix, 's')
+        res = mod.filter()
+        assert_equal(res.filtered_state.dtype, np.float32)
+        mod.precision = 'double'
+        assert_equal(mod.prefix, 'd')
+
+        mod = KalmanFilter(k_endog=1, k_states=1, precision='single')
+        assert_equal(mod.prefix, 's')
+        assert_raises(ValueError, setattr, mod, 'precision', 'half')
+        assert_raises(ValueError, KalmanFilter, k_endog=1, k_states=1,
+                      precision='half')
+
+
+class TestPrecisionUnivariate(Precision):
+    """
+    Single precision test for the loglikelihood and filtered states with the
+    univariate filter.
+    """
+    def __init__(self):
+        super(TestPrecisionUnivariate, self).__init__(
+            filter_method=FILTER_UNIVARIATE)
+
+
+class TestPrecisionComplex(Precision):
+    """
+    Single precision complex test for the loglikelihood and filtered states.
+    """
+    def __init__(self):
+        super(TestPrecisionComplex, self).__init__(dtype=complex)
+
+
+class LoglikelihoodFilter(object):
+    """
+    Test for the loglikelihood evaluated with the Kalman filters reserved for
+    it (which store only the loglikelihood), and for the filtered states of
+    the filter used by `filter`.
+    """
+    def run_loglikelihood_filter(self, filter_method=FILTER_CONVENTIONAL):
+        self.mod = mod = KalmanFilter(k_endog=self.k_endog,
+                                      k_states=self.k_states)
+        mod.bind(self.obs.T.copy())
+        for name in ['design', 'obs_cov', 'transition', 'selection',
+                     'state_cov']:
+            mod[name] = getattr(self, name).copy()
+        mod.initialize_known(self.initial_state, self.initial_state_cov)
+        mod.filter_method = filter_method
+        self.results = mod.filter()
+        self.result = {
+            'loglike': lambda burn: mod.loglike(loglikelihood_burn=burn),
+            'state': self.results.filtered_state,
+        }
+
+    def test_loglikelihood_filter(self):
+        mod = self.mod
+        kfilter = mod._kalman_filter
+        llf = mod.loglike()
+        assert_allclose(llf, np.sum(self.results.llf_obs))
+        llf_obs = mod.loglikeobs(loglikelihood_burn=2)
+        assert_allclose(llf_obs[2:], self.results.llf_obs[2:])
+        assert_equal(llf_obs[:2], 0)
+
+        # The filters used by `filter` were not re-created, and the
+        # loglikelihood filter is cached and stores only the loglikelihood
+        assert_equal(mod._kalman_filter is kfilter, True)
+        llf_filter = mod._loglikelihood_filters['d']
+        assert_equal(llf_filter.conserve_memory,
+                     MEMORY_CONSERVE & ~MEMORY_NO_LIKELIHOOD)
+        assert_equal(llf_filter.filtered_state.shape[1] < mod.nobs, True)
+        assert_equal(llf_filter.predicted_state_cov.shape[2] < mod.nobs, True)
+        mod['state_cov', 0, 0] = 2 * mod.state_cov[0, 0, 0]
+        assert_equal(mod.loglike() == llf, False)
+        assert_equal(mod._loglikelihood_filters['d'] is llf_filter, True)
+        assert_allclose(mod.loglike(), np.sum(mod.filter().llf_obs))
+
+    def test_filter_options(self):
+        # The filter timing and the tolerance are passed to the filter
+        res = self.mod.filter(tolerance=1e-10)
+        assert_equal(res.tolerance, 1e-10)
+        assert_equal(res.filter_timing, 0)
+
+        # The filter settings are also applied to the loglikelihood filter
+        self.mod.recovery_cache = False
+        self.mod.steady_state_start = 10
+        self.mod.loglike()
+        llf_filter = self.mod._loglikelihood_filters['d']
+        assert_equal(llf_filter.recovery_cache, False)
+        assert_equal(llf_filter.steady_state_start, 10)
+
+
+class TestClark1987LoglikelihoodFilter(LoglikelihoodFilter, Clark1987):
+    """
+    Loglikelihood filter test for the loglikelihood and filtered states.
+    """
+    def __init__(self):
+        super(TestClark1987LoglikelihoodFilter, self).__init__(dtype=float)
+        self.run_loglikelihood_filter()
+
+
+class TestClark1989LoglikelihoodFilterUnivariate(LoglikelihoodFilter,
+                                                 Clark1989):
+    """
+    Loglikelihood filter test for the loglikelihood and filtered states with
+    two-dimensional observation vector and the univariate filter.
+    """
+    def __init__(self):
+        super(TestClark1989LoglikelihoodFilterUnivariate, self).__init__(
+            dtype=float)
+        self.run_loglikelihood_filter(FILTER_UNIVARIATE)
+
+
+class InformationFilter(object):
+    """
+    Information filter (the conventional Kalman filter with the measurement
+    update computed in information form) test for the loglikelihood and
+    filtered states, against the conventional Kalman filter.
+
+    The information filter requires a positive definite observation
+    covariance matrix, which the models of Clark (1987, 1989) do not have,
+    so that this uses a model with many observed variables.
+    """
+    def __init__(self, diagonal=True, time_varying=False, missing=False,
+                 dtype=np.float64):
+        np.random.seed(1234)
+        nobs, k_endog, k_states = 50, 10, 3
+        endog = np.random.normal(size=(nobs, k_endog))
+        if missing:
+            endog[5:8, :3] = np.nan
+            endog[20, :] = np.nan
+        self.mod = mod = KalmanFilter(k_endog=k_endog, k_states=k_states)
+        mod.bind(endog.astype(dtype))
+        design = np.random.uniform(size=(k_endog, k_states, nobs))
+        mod['design'] = design if time_varying else design[:, :, 0]
+        if diagonal:
+            mod['obs_cov'] = np.diag(np.random.uniform(0.5, 1.5, k_endog))
+        else:
+            tmp = np.random.normal(size=(k_endog, k_endog)) * 0.2
+            mod['obs_cov'] = np.dot(tmp, tmp.T) + np.eye(k_endog)
+        mod['transition'] = (np.eye(k_states) * 0.5 +
+                             np.eye(k_states, k=1) * 0.2)
+        mod['selection'] = np.eye(k_states)
+        mod['state_cov'] = np.eye(k_states) * 0.1
+        mod.initialize_stationary()
+
+        self.desired = mod.filter()
+        self.desired_llf = mod.loglike()
+        mod.filter_method = FILTER_CONVENTIONAL | FILTER_INFORMATION
+        self.results = mod.filter()
+
+    def test_loglike(self):
+        assert_allclose(self.results.llf_obs, self.desired.llf_obs)
+        assert_allclose(self.mod.loglike(), self.desired_llf)
+
+    def test_filtered_state(self):
+        for name in ['filtered_state', 'filtered_state_cov',
+                     'predicted_state', 'predicted_state_cov',
+                     'forecasts_error_cov', 'kalman_gain']:
+            assert_allclose(getattr(self.results, name),
+                            getattr(self.desired, name), atol=1e-10)
+
+
+class TestInformationFilter(InformationFilter):
+    """
+    Information filter test for the loglikelihood and filtered states.
+    """
+    def __init__(self):
+        super(TestInformationFilter, self).__init__()
+
+    def test_invalid(self):
+        mod = self.mod
+        mod.filter_method = (FILTER_CONVENTIONAL | FILTER_INFORMATION |
+                             FILTER_SQUARE_ROOT)
+        assert_raises(NotImplementedError, mod.filter)
+
+        # The observation covariance matrix must be positive definite
+        mod.filter_method = FILTER_CONVENTIONAL | FILTER_INFORMATION
+        mod['obs_cov'] = np.zeros((10, 10))
+        assert_raises(np.linalg.LinAlgError, mod.filter)
+
+
+class TestInformationFilterNonDiagonal(InformationFilter):
+    """
+    Information filter test for the loglikelihood and filtered states with a
+    non-diagonal observation covariance matrix.
+    """
+    def __init__(self):
+        super(TestInformationFilterNonDiagonal, self).__init__(
+            diagonal=False)
+
+
+class TestInformationFilterTimeVarying(InformationFilter):
+    """
+    Information filter test for the loglikelihood and filtered states with a
+    time-varying design matrix.
+    """
+    def __init__(self):
+        super(TestInformationFilterTimeVarying, self).__init__(
+            time_varying=True)
+
+
+class TestInformationFilterMissing(InformationFilter):
+    """
+    Information filter test for the loglikelihood and filtered states with
+    missing observations.
+    """
+    def __init__(self):
+        super(TestInformationFilterMissing, self).__init__(missing=True)
+
+    def test_cache(self):
+        # In a time-invariant model, $Z' H^{-1} Z$ is only computed once for
+        # each pattern of missing observations
+        ss = self.mod._statespace
+        cache = np.asarray(ss.pattern_cache_t)[7:9]
+        complete = np.asarray(ss.missing_pattern)[0]
+        assert_equal(cache[:, complete], 0)
+        assert_equal(np.asarray(ss.information_diagonal)[complete], 1)
+
+
+class TestInformationFilterMissingNonDiagonal(InformationFilter):
+    """
+    Information filter test for the loglikelihood and filtered states with
+    missing observations, a non-diagonal observation covariance matrix and a
+    time-varying design matrix.
+    """
+    def __init__(self):
+        super(TestInformationFilterMissingNonDiagonal, self).__init__(
+            diagonal=False, time_varying=True, missing=True)
+
+
+class TestInformationFilterComplex(InformationFilter):
+    """
+    Information filter complex test for the loglikelihood and filtered
+    states.
+    """
+    def __init__(self):
+        super(TestInformationFilterComplex, self).__init__(
+            dtype=np.complex128)
+
+
+class TestClark1989BlockSequential(Clark1989):
+    """
+    Block-sequential filter test for the loglikelihood and filtered states
+    with two-dimensional observation vector (the diagonal observation
+    covariance matrix of which has two blocks).
+    """
+    def __init__(self):
+        super(TestClark1989BlockSequential, self).__init__(dtype=float)
+        self.init_filter()
+        self.run_filter()
+        self.desired_forecast_error_cov = np.array(
+            self.filter.forecast_error_cov)
+        self.init_filter()
+        self.filter.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL)
+        self.run_filter()
+
+    def test_blocks(self):
+        assert_equal(np.asarray(self.model.n_blocks)[0], 2)
+
+        # Only the diagonal blocks of the forecast error covariance matrices
+        # are computed, and (as in the univariate filter) each is conditional
+        # on the observations in the previous blocks, so that only the first
+        # block is the same as in the conventional filter
+        forecast_error_cov = np.array(self.filter.forecast_error_cov)
+        assert_allclose(forecast_error_cov[0, 0],
+                        self.desired_forecast_error_cov[0, 0])
+        assert_equal(forecast_error_cov[0, 1], 0)
+
+    def test_permuted_blocks(self):
+        # Blocks of the observation covariance matrix (which are not
+        # contiguous)
+        blocks = [[0, 3, 7], [1, 2], [4], [5, 8, 9], [6]]
+        np.random.seed(1234)
+        endog = np.random.normal(size=(50, 10))
+        endog[5:8, :4] = np.nan
+        mod = KalmanFilter(k_endog=10, k_states=3)
+        mod.bind(endog)
+        mod['design'] = np.random.uniform(size=(10, 3))
+        obs_cov = np.zeros((10, 10))
+        for block in blocks:
+            tmp = np.random.normal(size=(len(block), len(block))) * 0.5
+            obs_cov[np.ix_(block, block)] = (
+                np.dot(tmp, tmp.T) + np.eye(len(block)))
+        mod['obs_cov'] = obs_cov
+        mod['transition'] = np.eye(3) * 0.5 + np.eye(3, k=1) * 0.2
+        mod['selection'] = np.eye(3)
+        mod['state_cov'] = np.eye(3) * 0.1
+        mod.initialize_stationary()
+        desired = mod.filter()
+        mod.filter_method = FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL
+        res = mod.filter()
+        assert_allclose(res.llf_obs, desired.llf_obs)
+        assert_allclose(res.filtered_state, desired.filtered_state)
+
+        ss = mod._statespace
+        complete = np.asarray(ss.missing_pattern)[0]
+        n_blocks = ss.n_blocks[complete]
+        index = np.asarray(ss.block_index)[:, complete]
+        start = np.asarray(ss.block_start)[:n_blocks + 1, complete]
+        assert_equal(n_blocks, len(blocks))
+        assert_equal([sorted(index[start[i]:start[i+1]])
+                      for i in range(n_blocks)], blocks)
+
+        # With the first four observations missing, the blocks are found in
+        # the selected observation covariance matrix
+        partial = np.asarray(ss.missing_pattern)[5]
+        assert_equal(ss.n_blocks[partial], 4)
+
+    def test_invalid(self):
+        self.filter.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL |
+            FILTER_INFORMATION)
+        assert_raises(NotImplementedError, self.filter)
+
+        # The smoother is not available
+        mod = KalmanSmoother(k_endog=2, k_states=6)
+        mod.bind(self.obs.T.copy())
+        for name in ['design', 'obs_cov', 'transition', 'selection',
+                     'state_cov']:
+            mod[name] = getattr(self, name).copy()
+        mod.initialize_known(self.initial_state, self.initial_state_cov)
+        mod.filter_method = FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL
+        assert_raises(NotImplementedError, mod.smooth)
+
+
+class TestClark1989ForecastBlockSequential(Clark1989Forecast):
+    """
+    Block-sequential filter forecasting test for the loglikelihood and
+    filtered states.
+    """
+    def __init__(self, dtype=float):
+        super(TestClark1989ForecastBlockSequential, self).__init__(
+            dtype=dtype)
+        self.filter.set_filter_method(
+            FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL)
+        self.run_filter()
+
+
+class TestClark1989ForecastBlockSequentialComplex(
+        TestClark1989ForecastBlockSequential):
+    """
+    Block-sequential filter complex forecasting test for the loglikelihood
+    and filtered states.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastBlockSequentialComplex, self).__init__(
+            dtype=complex)
+
+
+class StructuredTransition(object):
+    """
+    Test for the loglikelihood and filtered states with the prediction step
+    of the conventional Kalman filter exploiting the structure of the
+    transition matrix, which should give the same results as the prediction
+    step with a dense transition matrix.
+    """
+    def run_structured(self):
+        # Filter, treating the transition matrix as dense
+        self.init_filter()
+        self.model.structured_transition = False
+        self.run_filter()
+        self.desired = dict([
+            (name, np.array(getattr(self.filter, name)))
+            for name in ['loglikelihood', 'filtered_state',
+                         'filtered_state_cov', 'predicted_state',
+                         'predicted_state_cov']
+        ])
+
+        # Filter, exploiting the structure (the default)
+        self.init_filter()
+        self.run_filter()
+
+    def test_structured_transition(self):
+        for name, desired in self.desired.items():
+            assert_allclose(getattr(self.filter, name), desired, atol=1e-10)
+
+        # The Clark (1989) transition matrix is block-diagonal, with a block
+        # for the trend and the unemployment rate and one for the cycle
+        assert_equal(np.asarray(self.model.transition_structure),
+                     TRANSITION_BLOCK_DIAGONAL)
+        assert_equal(np.asarray(self.model.transition_n_blocks), 2)
+        assert_equal(np.asarray(self.model.transition_block_start)[:3, 0],
+                     [0, 5, 6])
+
+
+class TestClark1989StructuredTransition(StructuredTransition, Clark1989):
+    """
+    Structured transition matrix test for the loglikelihood and filtered
+    states with two-dimensional observation vector.
+    """
+    def __init__(self):
+        super(TestClark1989StructuredTransition, self).__init__(dtype=float)
+        self.run_structured()
+
+    @staticmethod
+    def structured_transition(structure, m=6):
+        if structure == 'identity':
+            # e.g. random walks
+            return np.eye(m)
+        elif structure == 'diagonal':
+            return np.diag(np.random.uniform(0.2, 0.9, size=m))
+        elif structure == 'companion':
+            # e.g. a bivariate VAR(3)
+            transition = np.eye(m, k=-2)
+            transition[:2, :] = np.random.uniform(-0.3, 0.3, size=(2, m))
+            return transition
+        elif structure == 'transposed_companion':
+            # e.g. an ARMA(6, 5)
+            transition = np.eye(m, k=1)
+            transition[:, 0] = np.random.uniform(-0.2, 0.2, size=m)
+            return transition
+
+    def check_structure(self, structure, dtype=np.float64):
+        np.random.seed(1234)
+        endog = np.random.normal(size=(50, 2))
+        endog[5:8, 0] = np.nan
+        mod = KalmanFilter(k_endog=2, k_states=6)
+        mod.bind(endog.astype(dtype))
+        mod['design'] = np.random.uniform(size=(2, 6))
+        mod['obs_cov'] = np.eye(2)
+        mod['transition'] = self.structured_transition(structure)
+        mod['state_intercept'] = np.random.normal(size=6)
+        mod['selection'] = np.eye(6)
+        state_cov = np.random.normal(size=(6, 6))
+        mod['state_cov'] = np.dot(state_cov, state_cov.T)
+        mod.initialize_known(np.zeros(6), np.eye(6))
+        res = mod.filter()
+        assert_equal(res.transition_structure, [structure])
+
+        # Treat the transition matrix as dense
+        mod._statespace.structured_transition = False
+        desired = mod.filter()
+        assert_allclose(res.llf_obs, desired.llf_obs)
+        for name in ['filtered_state', 'filtered_state_cov',
+                     'predicted_state', 'predicted_state_cov']:
+            assert_allclose(getattr(res, name), getattr(desired, name),
+                            atol=1e-10)
+        return mod
+
+    def test_structures(self):
+        # (the other structures that are exploited)
+        for structure in ['identity', 'diagonal', 'companion',
+                          'transposed_companion']:
+            yield self.check_structure, structure
+        yield self.check_structure, 'companion', np.complex128
+
+    def test_structure(self):
+        mod = self.check_structure('companion')
+        assert_equal(mod._statespace.transition_companion_order[0], 2)
+
+        mod = self.check_structure('transposed_companion')
+        assert_equal(mod._statespace.transition_companion_order[0], 1)
+
+        # The structure is found again if the transition matrix changes
+        mod['transition'] = np.eye(mod.k_states) * 0.5
+        res = mod.filter()
+        assert_equal(res.transition_structure, ['diagonal'])
+
+
+class TestClark1989ForecastStructuredTransition(StructuredTransition,
+                                                Clark1989Forecast):
+    """
+    Structured transition matrix forecasting test for the loglikelihood and
+    filtered states, with a (constant) time-varying transition matrix.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastStructuredTransition, self).__init__(
+            dtype=float)
+        self.transition = np.asfortranarray(
+            np.repeat(self.transition, self.obs.shape[1], axis=2))
+        self.run_structured()
+
+
+class IndexedSelection(object):
+    """
+    Test for the loglikelihood and filtered states with a selection matrix
+    which only selects states (so that it is held as an index), which should
+    give the same results as an equivalent selection matrix which does not.
+    """
+    def run_indexed(self, index, time_varying=False):
+        # Select the states with the given indices (the variance of a state
+        # selected by more than one column is split across these), which
+        # leaves the model unchanged if these include all of the states with
+        # non-zero variances
+        self.index = index
+        counts = np.bincount(index, minlength=self.k_states)
+        variances = np.diag(self.state_cov[:, :, 0])[index] / counts[index]
+        selection = np.asfortranarray(
+            np.eye(self.k_states, dtype=self.obs.dtype)[:, index, None])
+        state_cov = np.diag(variances).astype(self.obs.dtype)[:, :, None]
+        if time_varying:
+            state_cov = np.repeat(state_cov, self.obs.shape[1], axis=2)
+        state_cov = np.asfortranarray(state_cov)
+
+        # Filter, with the selection matrix scaled so that it does not only
+        # select states (with R Q R' unchanged)
+        self.selection = np.asfortranarray(selection * 2)
+        self.state_cov = np.asfortranarray(state_cov / 4)
+        self.init_filter()
+        self.run_filter()
+        assert_equal(self.model.indexed_selection[0], False)
+        self.desired = dict([
+            (name, np.array(getattr(self.filter, name)))
+            for name in ['loglikelihood', 'filtered_state',
+                         'filtered_state_cov', 'predicted_state',
+                         'predicted_state_cov']
+        ])
+        self.desired['selected_state_cov'] = np.array(
+            self.model.selected_state_cov)
+
+        # Filter, with the selection matrix held as an index
+        self.selection = selection
+        self.state_cov = state_cov
+        self.init_filter()
+        self.run_filter()
+
+    def test_indexed_selection(self):
+        assert_equal(np.asarray(self.model.indexed_selection), True)
+        assert_equal(np.asarray(self.model.selection_index)[:, 0],
+                     self.index)
+        assert_allclose(self.model.selected_state_cov,
+                        self.desired['selected_state_cov'])
+        for name in ['loglikelihood', 'filtered_state', 'filtered_state_cov',
+                     'predicted_state', 'predicted_state_cov']:
+            assert_allclose(getattr(self.filter, name), self.desired[name],
+                            atol=1e-8)
+
+
+class TestClark1989IndexedSelection(IndexedSelection, Clark1989):
+    """
+    Indexed selection matrix test for the loglikelihood and filtered states
+    with two-dimensional observation vector, where only the states with
+    non-zero variances are selected.
+    """
+    def __init__(self):
+        super(TestClark1989IndexedSelection, self).__init__(dtype=float)
+        self.run_indexed([5, 0, 4, 1])
+
+
+class TestClark1989IndexedSelectionRepeated(IndexedSelection, Clark1989):
+    """
+    Indexed selection matrix test for the loglikelihood and filtered states
+    with two-dimensional observation vector, where a state is selected by two
+    columns of the selection matrix.
+    """
+    def __init__(self):
+        super(TestClark1989IndexedSelectionRepeated, self).__init__(
+            dtype=float)
+        self.run_indexed([0, 1, 1, 4, 5])
+
+
+class TestClark1989ForecastIndexedSelection(IndexedSelection,
+                                            Clark1989Forecast):
+    """
+    Indexed selection matrix forecasting test for the loglikelihood and
+    filtered states, with a (constant) time-varying state covariance matrix.
+    """
+    def __init__(self, dtype=float):
+        super(TestClark1989ForecastIndexedSelection, self).__init__(
+            dtype=dtype)
+        self.run_indexed([0, 1, 4, 5], time_varying=True)
+
+
+class TestClark1989ForecastIndexedSelectionComplex(
+        TestClark1989ForecastIndexedSelection):
+    """
+    Indexed selection matrix complex forecasting test for the loglikelihood
+    and filtered states.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastIndexedSelectionComplex, self).__init__(
+            dtype=complex)
+
+
+class PiecewiseConstant(object):
+    """
+    Test for the loglikelihood and filtered states with piecewise-constant
+    matrices (held as the distinct matrices and a regime index), which take
+    the same value in each regime, and test of the smoother and simulation
+    smoother against the same model with the matrices expanded to each
+    period.
+    """
+    def regime_model(self, names, expanded=False, tolerance=0):
+        nobs = self.obs.shape[1]
+        mod = SimulationSmoother(k_endog=self.k_endog, k_states=self.k_states)
+        mod.bind(self.obs.T.copy())
+        for name in ['design', 'obs_intercept', 'obs_cov', 'transition',
+                     'state_intercept', 'selection', 'state_cov']:
+            value = getattr(self, name)
+            if name not in names:
+                mod[name] = value.copy()
+            elif expanded:
+                mod[name] = np.repeat(value, nobs, axis=-1)
+            else:
+                mod.set_regimes(name, np.repeat(value, 2, axis=-1),
+                                self.regimes)
+        mod.initialize_known(self.initial_state, self.initial_state_cov)
+        mod.tolerance = tolerance
+        return mod
+
+    def run_regimes(self, names):
+        nobs = self.obs.shape[1]
+        self.names = names
+        self.regimes = np.zeros(nobs, dtype=int)
+        self.regimes[nobs // 3:2 * nobs // 3] = 1
+        self.mod = mod = self.regime_model(names)
+        self.results = mod.smooth()
+        self.result = {
+            'loglike': lambda burn: mod.loglike(loglikelihood_burn=burn),
+            'state': self.results.filtered_state,
+        }
+
+    def test_piecewise_constant(self):
+        ss = self.mod._statespace
+        assert_equal(sorted(self.results.regimes), sorted(self.names))
+        assert_equal(self.mod.time_invariant, False)
+        # Only the distinct matrices are held
+        names = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                 'state_intercept', 'selection', 'state_cov']
+        for i, name in enumerate(names):
+            regime_index = np.asarray(ss.regime_index)[i]
+            if name in self.names:
+                assert_equal(regime_index, self.regimes)
+                assert_equal(getattr(ss, name).shape[-1], 2)
+            else:
+                assert_equal(regime_index, 0)
+        assert_equal(ss.covariance_invariant, False)
+        assert_equal(ss.covariance_piecewise, True)
+
+        # Smoother, against the expanded matrices
+        desired_mod = self.regime_model(self.names, expanded=True)
+        desired = desired_mod.smooth()
+        assert_equal(desired_mod._statespace.covariance_piecewise, False)
+        for name in ['llf_obs', 'forecasts', 'forecasts_error',
+                     'forecasts_error_cov', 'filtered_state',
+                     'filtered_state_cov', 'predicted_state',
+                     'predicted_state_cov', 'smoothed_state',
+                     'smoothed_state_cov', 'smoothed_state_disturbance']:
+            assert_allclose(getattr(self.results, name),
+                            getattr(desired, name), atol=1e-12)
+
+        # Simulation smoother with the same variates (without missing
+        # observations)
+        if np.any(np.isnan(self.obs)):
+            return
+        np.random.seed(1234)
+        variates = np.random.normal(size=(self.mod.k_endog +
+                                          self.mod.k_posdef) * self.mod.nobs)
+        initial_variates = np.random.normal(size=self.mod.k_states)
+        sims = []
+        for model in [self.mod, desired_mod]:
+            sim = model.simulation_smoother()
+            sim.simulate(disturbance_variates=variates,
+                         initial_state_variates=initial_variates)
+            sims.append(sim)
+        assert_allclose(sims[0].generated_obs, sims[1].generated_obs)
+        assert_allclose(sims[0].simulated_state[:, :-1],
+                        sims[1].simulated_state[:, :-1])
+
+    def test_batch(self):
+        # The regimes also apply to each element of a batch
+        mod = self.regime_model(self.names)
+        batch = [mod._batch_representation()]
+        desired = [mod.loglike()]
+        mod['transition', 1, 1, 1] = 0.5 * self.transition[1, 1, 0]
+        batch.append(mod._batch_representation())
+        desired.append(mod.loglike())
+        assert_allclose(mod._loglike_batch(batch), desired)
+        assert_allclose(mod._loglike_batch(batch, nthreads=2), desired)
+
+    def test_set_regimes(self):
+        mod = self.regime_model(self.names)
+        desired = self.regime_model(self.names, expanded=True)
+        value = 0.5 * self.transition[1, 1, 0]
+
+        # Setting a slice of the matrix keeps the regimes
+        mod['transition', 1, 1, 1] = value
+        desired['transition', 1, 1, self.regimes == 1] = value
+        assert_equal(sorted(mod.regimes), sorted(self.names))
+        assert_allclose(mod.loglike(), desired.loglike())
+
+        # Changing the regimes of an existing model
+        regimes = 1 - self.regimes
+        mod.set_regimes('transition', mod['transition'], regimes)
+        desired['transition'] = mod['transition'][..., regimes]
+        assert_allclose(mod.loglike(), desired.loglike())
+
+        # Setting the matrix removes the regimes
+        mod['transition'] = self.transition.copy()
+        assert_equal('transition' in mod.regimes, False)
+        assert_allclose(mod.loglike(), self.result['loglike'](0))
+
+    def test_invalid(self):
+        transition = np.repeat(self.transition, 2, axis=-1)
+        # Invalid index
+        assert_raises(ValueError, self.mod.set_regimes, 'transition',
+                      transition, self.regimes[:-1])
+        assert_raises(ValueError, self.mod.set_regimes, 'transition',
+                      transition, self.regimes * 2)
+        assert_raises(ValueError, self.mod.set_regimes, 'transition',
+                      transition, self.regimes * 0.5)
+        # Invalid matrices
+        assert_raises(ValueError, self.mod.set_regimes, 'transition',
+                      transition[:, :-1], self.regimes)
+        assert_raises(IndexError, self.mod.set_regimes, 'obs', transition,
+                      self.regimes)
+
+
+class TestClark1989PiecewiseConstant(PiecewiseConstant, Clark1989):
+    """
+    Piecewise-constant matrices test for the loglikelihood and filtered
+    states with two-dimensional observation vector, where the matrices
+    entering the covariance recursions are piecewise-constant.
+    """
+    def __init__(self, names=('obs_cov', 'transition', 'state_cov')):
+        super(TestClark1989PiecewiseConstant, self).__init__(dtype=float)
+        self.run_regimes(names)
+
+    def test_convergence(self):
+        # The filter converges within each regime, and re-converges after
+        # each change of regime
+        mod = self.regime_model(self.names, tolerance=1e-15)
+        mod.set_regimes('obs_cov', np.dstack([self.obs_cov,
+                                              self.obs_cov * 2]),
+                        self.regimes)
+        res = mod.filter()
+        desired_mod = self.regime_model(self.names, expanded=True)
+        desired_mod['obs_cov'] = mod['obs_cov'][..., self.regimes]
+        desired = desired_mod.filter()
+        assert_equal(res.converged, True)
+        assert_equal(res.period_converged > 2 * mod.nobs // 3, True)
+        assert_equal(desired.converged, False)
+        # (the converged covariance matrices are only accurate to within the
+        # tolerance, which leads to larger differences in the states and the
+        # loglikelihood)
+        for name in ['filtered_state_cov', 'predicted_state_cov']:
+            assert_allclose(getattr(res, name), getattr(desired, name),
+                            atol=1e-6)
+        for name in ['llf_obs', 'filtered_state']:
+            assert_allclose(getattr(res, name), getattr(desired, name),
+                            atol=1e-3)
+
+
+class TestClark1989PiecewiseConstantAll(TestClark1989PiecewiseConstant):
+    """
+    Piecewise-constant matrices test for the loglikelihood and filtered
+    states with two-dimensional observation vector, where all of the matrices
+    are piecewise-constant.
+    """
+    def __init__(self):
+        super(TestClark1989PiecewiseConstantAll, self).__init__(
+            names=['design', 'obs_intercept', 'obs_cov', 'transition',
+                   'state_intercept', 'selection', 'state_cov'])
+
+
+class TestClark1989ForecastPiecewiseConstant(PiecewiseConstant,
+                                             Clark1989Forecast):
+    """
+    Piecewise-constant matrices forecasting test for the loglikelihood and
+    filtered states.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastPiecewiseConstant, self).__init__(
+            dtype=float)
+        self.run_regimes(['obs_cov', 'transition', 'state_cov'])
+
+
+class ExogMatrices(object):
+    """
+    Test for the loglikelihood and filtered states with matrices given by
+    exogenous data (evaluated in each period), whose terms cancel so that
+    the matrices take their original values, and test of the smoother,
+    prediction, simulation and simulation smoother against the same model
+    with the matrices expanded to each period.
+    """
+    def exog_model(self, names, expanded=False):
+        nobs = self.obs.shape[1]
+        mod = SimulationSmoother(k_endog=self.k_endog, k_states=self.k_states)
+        mod.bind(self.obs.T.copy())
+        for name in ['obs_cov', 'transition', 'selection', 'state_cov']:
+            mod[name] = getattr(self, name).copy()
+        mod.initialize_known(self.initial_state, self.initial_state_cov)
+
+        # Each matrix is computed as (Z - A) + (1 + u_t) A - u_t A, with the
+        # exogenous data x_t = (1 + u_t, u_t)
+        np.random.seed(1234)
+        u = np.random.normal(size=nobs)
+        exog_data = np.c_[1 + u, u]
+        coefficients = {}
+        for name in ['design', 'obs_intercept', 'state_intercept']:
+            value = getattr(self, name)
+            if name not in names:
+                mod[name] = value.copy()
+                continue
+            coefficient = np.random.normal(size=value.shape[:-1])
+            coefficients[name] = np.stack([coefficient, -coefficient],
+                                          axis=-1)
+            if expanded:
+                mod[name] = (value - coefficient[..., None] +
+                             np.dot(coefficients[name], exog_data.T))
+            else:
+                mod[name] = value - coefficient[..., None]
+        if not expanded:
+            mod.set_exog_matrices(exog_data, **coefficients)
+        return mod
+
+    def run_exog(self, names):
+        self.names = names
+        self.mod = mod = self.exog_model(names)
+        self.results = mod.smooth()
+        self.result = {
+            'loglike': lambda burn: mod.loglike(loglikelihood_burn=burn),
+            'state': self.results.filtered_state,
+        }
+
+    def test_exog_matrices(self):
+        ss = self.mod._statespace
+        assert_equal(sorted(self.results.exog_matrices), sorted(self.names))
+        assert_equal(self.results.time_invariant, False)
+        assert_equal(ss.k_exog, 2)
+        assert_equal(ss.exog_design, int('design' in self.names))
+        assert_equal(ss.exog_obs_intercept,
+                     int('obs_intercept' in self.names))
+        assert_equal(ss.exog_state_intercept,
+                     int('state_intercept' in self.names))
+        # Time-varying intercepts do not affect the covariance recursions
+        covariance_invariant = int('design' not in self.names)
+        assert_equal(ss.covariance_invariant, covariance_invariant)
+        assert_equal(ss.covariance_piecewise, covariance_invariant)
+        # Only the constant matrices are held
+        assert_equal(ss.design.shape[2], 1)
+        assert_equal(ss.obs_intercept.shape[1], 1)
+        assert_equal(ss.state_intercept.shape[1], 1)
+
+        # Smoother, against the expanded matrices (which are only equal up to
+        # rounding, which is amplified in particular in the smoothed state
+        # covariance matrices, since the first observation has no
+        # measurement error)
+        desired_mod = self.exog_model(self.names, expanded=True)
+        desired = desired_mod.smooth()
+        for name in ['llf_obs', 'forecasts', 'forecasts_error',
+                     'forecasts_error_cov', 'filtered_state',
+                     'filtered_state_cov', 'predicted_state',
+                     'predicted_state_cov', 'smoothed_state',
+                     'smoothed_state_cov', 'smoothed_state_disturbance',
+                     'smoothed_forecasts']:
+            assert_allclose(getattr(self.results, name),
+                            getattr(desired, name), atol=1e-6)
+
+        # In-sample prediction
+        assert_allclose(self.results.predict().forecasts,
+                        desired.predict().forecasts, atol=1e-12)
+
+        # Simulation with the same shocks
+        mod = self.mod
+        np.random.seed(1234)
+        measurement_shocks = np.random.normal(size=(mod.nobs, mod.k_endog))
+        state_shocks = np.random.normal(size=(mod.nobs, mod.k_posdef))
+        simulated = mod.simulate(mod.nobs, measurement_shocks, state_shocks)
+        desired_simulated = desired_mod.simulate(
+            mod.nobs, measurement_shocks, state_shocks)
+        assert_allclose(simulated[0], desired_simulated[0])
+        assert_allclose(simulated[1], desired_simulated[1])
+
+        # Simulation smoother with the same variates (without missing
+        # observations)
+        if np.any(np.isnan(self.obs)):
+            return
+        variates = np.random.normal(size=(mod.k_endog + mod.k_posdef) *
+                                    mod.nobs)
+        initial_variates = np.random.normal(size=mod.k_states)
+        sims = []
+        for model in [mod, desired_mod]:
+            sim = model.simulation_smoother()
+            sim.simulate(disturbance_variates=variates,
+                         initial_state_variates=initial_variates)
+            sims.append(sim)
+        assert_allclose(sims[0].generated_obs, sims[1].generated_obs)
+        assert_allclose(sims[0].simulated_state[:, :-1],
+                        sims[1].simulated_state[:, :-1], atol=1e-6)
+
+    def test_batch(self):
+        # The matrices given by exogenous data also apply to each element of
+        # a batch
+        mod = self.exog_model(self.names)
+        batch = [mod._batch_representation()]
+        desired = [mod.loglike()]
+        mod['obs_cov', 1, 1] = 2 * self.obs_cov[1, 1, 0]
+        batch.append(mod._batch_representation())
+        desired.append(mod.loglike())
+        assert_allclose(mod._loglike_batch(batch), desired)
+        assert_allclose(mod._loglike_batch(batch, nthreads=2), desired)
+
+    def test_set_exog_matrices(self):
+        name = self.names[0]
+        mod = self.exog_model(self.names)
+        desired = self.exog_model(self.names, expanded=True)
+
+        # Setting a time-invariant matrix keeps its coefficients
+        change = np.zeros(getattr(self, name).shape)
+        change[1, ...] = 0.1
+        mod[name] = getattr(mod, name) + change
+        desired[name] = getattr(desired, name) + change
+        assert_equal(sorted(mod.exog_matrices), sorted(self.names))
+        assert_allclose(mod.loglike(), desired.loglike())
+
+        # Setting a time-varying matrix removes them
+        mod[name] = getattr(desired, name)
+        assert_equal(name in mod.exog_matrices, False)
+        assert_allclose(mod.loglike(), desired.loglike())
+
+        # Removing the matrices given by exogenous data (on an existing model)
+        mod = self.exog_model(self.names)
+        mod.loglike()
+        mod.set_exog_matrices(None)
+        assert_equal(mod.exog_matrices_data, None)
+        assert_equal(mod.time_invariant, True)
+        desired = self.exog_model([])
+        for name in self.names:
+            desired[name] = getattr(mod, name)
+        assert_allclose(mod.loglike(), desired.loglike())
+        assert_equal(mod._statespace.k_exog, 0)
+
+    def test_invalid(self):
+        mod = self.exog_model([])
+        nobs = mod.nobs
+        k_endog, k_states = self.k_endog, self.k_states
+        exog_data = np.zeros((nobs, 2))
+        # Invalid data
+        assert_raises(ValueError, mod.set_exog_matrices, exog_data[:-1],
+                      design=np.zeros((k_endog, k_states, 2)))
+        # Invalid coefficients
+        assert_raises(ValueError, mod.set_exog_matrices, exog_data,
+                      design=np.zeros((k_endog, k_states, 1)))
+        # Invalid matrices
+        mod.set_regimes('design', np.zeros((k_endog, k_states, 2)),
+                        np.zeros(nobs, dtype=int))
+        assert_raises(ValueError, mod.set_exog_matrices, exog_data,
+                      design=np.zeros((k_endog, k_states, 2)))
+        mod['obs_intercept'] = np.zeros((k_endog, nobs))
+        assert_raises(ValueError, mod.set_exog_matrices, exog_data,
+                      obs_intercept=np.zeros((k_endog, 2)))
+        mod.set_exog_matrices(exog_data,
+                              state_intercept=np.zeros((k_states, 2)))
+        assert_raises(ValueError, mod.set_regimes, 'state_intercept',
+                      np.zeros((k_states, 2)), np.zeros(nobs, dtype=int))
+
+
+class TestClark1989ExogMatrices(ExogMatrices, Clark1989):
+    """
+    Matrices given by exogenous data test for the loglikelihood and filtered
+    states with two-dimensional observation vector, where the design matrix
+    is given by exogenous data.
+    """
+    def __init__(self, names=('design',)):
+        super(TestClark1989ExogMatrices, self).__init__(dtype=float)
+        self.run_exog(names)
+
+
+class TestClark1989ExogMatricesIntercepts(TestClark1989ExogMatrices):
+    """
+    Matrices given by exogenous data test for the loglikelihood and filtered
+    states with two-dimensional observation vector, where the intercepts are
+    given by exogenous data.
+    """
+    def __init__(self):
+        super(TestClark1989ExogMatricesIntercepts, self).__init__(
+            names=('obs_intercept', 'state_intercept'))
+
+
+class TestClark1989ExogMatricesAll(TestClark1989ExogMatrices):
+    """
+    Matrices given by exogenous data test for the loglikelihood and filtered
+    states with two-dimensional observation vector, where the design matrix
+    and the intercepts are given by exogenous data.
+    """
+    def __init__(self):
+        super(TestClark1989ExogMatricesAll, self).__init__(
+            names=('design', 'obs_intercept', 'state_intercept'))
+
+
+class TestClark1989ForecastExogMatrices(ExogMatrices, Clark1989Forecast):
+    """
+    Matrices given by exogenous data forecasting test for the loglikelihood
+    and filtered states.
+    """
+    def __init__(self):
+        super(TestClark1989ForecastExogMatrices, self).__init__(dtype=float)
+        self.run_exog(('design', 'obs_intercept'))
@@ -305,6 +305,149 @@ def test_params():
     assert_equal(mod.param_names, ['a'])
 
 
+class AR1(MLEModel):
+    # AR(1) model with parameters (ar.L1, sigma2)
+    def __init__(self, endog):
+        super(AR1, self).__init__(endog, k_states=1, design=[[1]],
+                                  selection=[[1]])
+        self.ssm.initialize_stationary()
+
+    def update(self, params, transformed=True):
+        self['transition', 0, 0] = params[0]
+        self['state_cov', 0, 0] = params[1]
+
+
+class BivariateAR1(MLEModel):
+    # Bivariate model with a single AR(1) factor, loading on the second
+    # series, measurement error in both series and a time-varying intercept
+    def __init__(self, endog):
+        super(BivariateAR1, self).__init__(endog, k_states=1,
+                                           selection=[[1]])
+        self['obs_intercept'] = np.ones((2, self.nobs)) * [[0], [1]]
+        self.ssm.initialize_known(np.array([0.5]), np.array([[2.]]))
+
+    def update(self, params, transformed=True):
+        self['design'] = np.r_[1., params[0]][:, None]
+        self['obs_cov', 0, 0] = params[1]
+        self['obs_cov', 1, 1] = params[2]
+        self['transition', 0, 0] = params[3]
+        self['state_cov', 0, 0] = params[4]
+        self['obs_intercept', 1] = params[5] * np.arange(self.nobs)
+
+
+def test_loglike_batch():
+    # Test that the batch loglikelihood matches the loglikelihood computed
+    # for each parameter vector separately
+    endog = np.cumsum(np.sin(np.arange(50)))
+    mod = AR1(endog)
+    params = np.c_[np.linspace(-0.9, 0.9, 7), np.linspace(0.5, 2, 7)]
+
+    desired = []
+    desired_burn = []
+    for params_i in params:
+        mod.update(params_i)
+        desired.append(mod.ssm.loglike())
+        desired_burn.append(mod.ssm.loglike(loglikelihood_burn=1))
+
+    assert_allclose(mod.loglike_batch(params), desired)
+    assert_allclose(mod.loglike_batch(params, nthreads=3), desired)
+    assert_allclose(mod.loglike_batch(params, loglikelihood_burn=1),
+                    desired_burn)
+
+    # In single precision the loglikelihood is accumulated (and returned) in
+    # double precision
+    mod.ssm.precision = 'single'
+    actual = mod.loglike_batch(params)
+    assert_equal(actual.dtype, np.float64)
+    assert_allclose(actual, desired, rtol=1e-4)
+
+
+def check_score_obs_analytic(mod, params):
+    # Compare with central finite differences of `loglikeobs`
+    epsilon = 1e-6
+    desired = np.zeros((mod.nobs, len(params)))
+    for i in range(len(params)):
+        increment = np.zeros(len(params))
+        increment[i] = epsilon
+        mod.update(params + increment)
+        llf_obs_upper = mod.ssm.loglikeobs()
+        mod.update(params - increment)
+        llf_obs_lower = mod.ssm.loglikeobs()
+        desired[:, i] = (llf_obs_upper - llf_obs_lower) / (2 * epsilon)
+
+    actual = mod.score_obs(params, method='analytic')
+    assert_allclose(actual, desired, rtol=1e-5, atol=1e-6)
+    assert_allclose(mod.score(params, method='analytic'),
+                    desired.sum(axis=0), rtol=1e-5, atol=1e-6)
+
+    # The representation is left at `params`
+    mod.update(params)
+    assert_allclose(mod.ssm.loglikeobs(), mod.ssm.loglikeobs())
+    assert_equal(mod.ssm.prefix, 'd')
+
+
+def test_score_obs_analytic():
+    endog = np.cumsum(np.sin(np.arange(50)))
+    check_score_obs_analytic(AR1(endog), np.array([0.5, 1.2]))
+
+    # Multivariate, with missing observations and time-varying matrices
+    endog = np.c_[np.sin(np.arange(40)), np.cos(np.arange(40) / 2.)]
+    endog[5, 1] = np.nan
+    endog[10, :] = np.nan
+    check_score_obs_analytic(BivariateAR1(endog),
+                             np.array([0.8, 0.3, 0.5, 0.6, 1.1, 0.01]))
+
+
+def test_score_obs_approx():
+    # Test the numerical approximation of the score per observation (the
+    # default), and the information matrices computed from the score, against
+    # the analytic score
+    endog = np.c_[np.sin(np.arange(40)), np.cos(np.arange(40) / 2.)]
+    mod = BivariateAR1(endog)
+    params = np.array([0.8, 0.3, 0.5, 0.6, 1.1, 0.01])
+    desired = mod.score_obs(params, method='analytic')
+
+    assert_allclose(mod.score_obs(params), desired, rtol=1e-5, atol=1e-6)
+    assert_allclose(mod.score_obs(params, transformed=True, method='approx'),
+                    desired, rtol=1e-5, atol=1e-6)
+    assert_allclose(mod.score(params, True, method='analytic'),
+                    desired.sum(axis=0), rtol=1e-5, atol=1e-6)
+    assert_allclose(mod.opg_information_matrix(params),
+                    np.dot(desired.T, desired) / mod.nobs, rtol=1e-5)
+
+    # The observed information matrix of Harvey (1989), with central finite
+    # differences of the forecast errors and their covariance matrices
+    epsilon = 1e-6
+    mod.update(params)
+    res = mod.ssm.filter()
+    inv_forecasts_error_cov = np.linalg.inv(
+        res.forecasts_error_cov.transpose(2, 0, 1))
+    partials_forecasts_error = np.zeros((mod.nobs, 2, len(params)))
+    partials_forecasts_error_cov = np.zeros((mod.nobs, 2, 2, len(params)))
+    for i in range(len(params)):
+        increment = np.zeros(len(params))
+        increment[i] = epsilon
+        mod.update(params + increment)
+        upper = mod.ssm.filter()
+        mod.update(params - increment)
+        lower = mod.ssm.filter()
+        partials_forecasts_error[..., i] = (
+            upper.forecasts_error - lower.forecasts_error).T / (2 * epsilon)
+        partials_forecasts_error_cov[..., i] = (
+            upper.forecasts_error_cov -
+            lower.forecasts_error_cov).transpose(2, 0, 1) / (2 * epsilon)
+    desired = np.zeros((len(params), len(params)))
+    for t in range(mod.nobs):
+        tmp = np.einsum('ij,jkl->ikl', inv_forecasts_error_cov[t],
+                        partials_forecasts_error_cov[t])
+        desired += 0.5 * np.einsum('ijk,jil->kl', tmp, tmp)
+        desired += np.dot(partials_forecasts_error[t].T,
+                          np.dot(inv_forecasts_error_cov[t],
+                                 partials_forecasts_error[t]))
+    assert_allclose(mod.observed_information_matrix(params),
+                    desired / mod.nobs, rtol=1e-5, atol=1e-8)
+
+
 def check_results(pandas):
     mod, res = get_dummy_mod(pandas=pandas)
 
@@ -19,6 +19,10 @@ from dismalpy.ssm.kalman_filter import (
     FILTER_COLLAPSED,
     FILTER_EXTENDED,
     FILTER_UNSCENTED,
+    FILTER_STEADY_STATE,
+    FILTER_CHANDRASEKHAR,
+    FILTER_INFORMATION,
+    FILTER_BLOCK_SEQUENTIAL,
 
     INVERT_UNIVARIATE,
     SOLVE_LU,
@@ -36,6 +40,7 @@ from dismalpy.ssm.kalman_filter import (
     MEMORY_NO_LIKELIHOOD,
     MEMORY_NO_GAIN,
     MEMORY_NO_SMOOTHING,
+    MEMORY_PACK_COV,
     MEMORY_CONSERVE
 )
 from dismalpy.ssm.kalman_smoother import (
@@ -96,7 +101,9 @@ class TestOptions(Options):
             model.filter_method,
             FILTER_CONVENTIONAL | FILTER_EXACT_INITIAL | FILTER_AUGMENTED |
             FILTER_SQUARE_ROOT | FILTER_UNIVARIATE | FILTER_COLLAPSED |
-            FILTER_EXTENDED | FILTER_UNSCENTED
+            FILTER_EXTENDED | FILTER_UNSCENTED | FILTER_STEADY_STATE |
+            FILTER_CHANDRASEKHAR | FILTER_INFORMATION |
+            FILTER_BLOCK_SEQUENTIAL
         )
         for name in model.filter_methods:
             setattr(model, name, False)
@@ -185,7 +192,7 @@ class TestOptions(Options):
         # Try setting and unsetting all
         model.conserve_memory = 0
         for name in model.memory_options:
-            if name == 'memory_conserve':
+            if name in ['memory_conserve', 'memory_pack_cov']:
                 continue
             setattr(model, name, True)
         assert_equal(
@@ -195,11 +202,17 @@ class TestOptions(Options):
         )
         assert_equal(model.conserve_memory, MEMORY_CONSERVE)
         for name in model.memory_options:
-            if name == 'memory_conserve':
+            if name in ['memory_conserve', 'memory_pack_cov']:
                 continue
             setattr(model, name, False)
         assert_equal(model.conserve_memory, 0)
 
+        # Packed storage is a storage format, not part of MEMORY_CONSERVE
+        model.memory_pack_cov = True
+        assert_equal(model.conserve_memory, MEMORY_PACK_COV)
+        model.memory_pack_cov = False
+        assert_equal(model.conserve_memory, 0)
+
     def test_smoother_outputs(self):
         model = self.model
 
@@ -22,7 +22,7 @@ import os
 from dismalpy.ssm import Representation, Model, sarimax, tools
 from dismalpy.ssm.kalman_filter import KalmanFilter, PredictionResults
 from dismalpy.ssm.simulation_smoother import SimulationSmoother
-from dismalpy.ssm.kalman_smoother import SmootherResults
+from dismalpy.ssm.kalman_smoother import KalmanSmoother, SmootherResults
 import dismalpy.ssm.tests.results_kalman as results_kalman_filter
 from numpy.testing import assert_equal, assert_almost_equal, assert_allclose, assert_raises
 from nose.exc import SkipTest
@@ -816,6 +816,192 @@ def test_cython():
     assert_equal(mod._kalman_filter == kf, False)
 
 
+def test_shared_representation():
+    # Test that the representation matrices and the data are shared with the
+    # underlying statespace object when they are of its datatype, and are
+    # otherwise copied
+
+    def model(endog):
+        mod = KalmanFilter(endog, k_states=2,
+                           initialization='approximate_diffuse')
+        mod['design'] = [[1., 0.]]
+        mod['obs_cov'] = [[0.5]]
+        mod['transition'] = [[0.5, 1.], [0., 0.2]]
+        mod['selection'] = np.eye(2)
+        mod['state_cov'] = np.eye(2) * 0.5
+        return mod
+
+    np.random.seed(1234)
+    endog = np.random.normal(size=(20, 1))
+    mod = model(endog)
+    mod.loglike()
+    ss = mod._statespace
+    assert_equal(np.may_share_memory(np.asarray(ss.obs), endog), True)
+    for name in ['design', 'obs_cov', 'transition', 'state_cov']:
+        assert_equal(np.may_share_memory(np.asarray(getattr(ss, name)),
+                                         getattr(mod, name)), True)
+
+    # Setting a slice of a matrix
+    mod['transition', 0, 0] = 0.8
+    desired = model(endog)
+    desired['transition', 0, 0] = 0.8
+    assert_allclose(mod.loglike(), desired.loglike())
+
+    # Replacing a matrix copies it into the shared matrix
+    mod['transition'] = np.eye(2) * 0.4
+    desired['transition'] = np.eye(2) * 0.4
+    assert_allclose(mod.loglike(), desired.loglike())
+    assert_equal(mod._statespace is ss, True)
+    assert_equal(np.may_share_memory(np.asarray(ss.transition),
+                                     mod.transition), True)
+
+    # Binding new data with the same missing observations replaces the
+    # observations of the statespace object
+    endog = np.random.normal(size=(20, 1))
+    mod.bind(endog)
+    desired.bind(endog)
+    assert_allclose(mod.loglike(), desired.loglike())
+    assert_equal(mod._statespace is ss, True)
+
+    # With different missing observations, it is re-created
+    endog = endog.copy()
+    endog[5] = np.nan
+    mod.bind(endog)
+    desired.bind(endog)
+    assert_allclose(mod.loglike(), desired.loglike())
+    assert_equal(mod._statespace is ss, False)
+
+    # Matrices of another datatype are copied
+    mod.precision = 'single'
+    desired.precision = 'single'
+    assert_allclose(mod.loglike(), desired.loglike())
+    assert_equal(np.may_share_memory(
+        np.asarray(mod._statespace.transition), mod.transition), False)
+
+
+def test_changed_matrices():
+    # Test that only the matrices changed since the last sync with the
+    # underlying statespace object are synced, and that the arrays it
+    # computed from the others (and the stationary initialization) are
+    # retained
+
+    def model(endog, missing=False):
+        endog = endog.copy()
+        if missing:
+            endog[3, 0] = np.nan
+            endog[5:8] = np.nan
+        mod = KalmanSmoother(endog, k_states=3, k_posdef=2,
+                             initialization='stationary')
+        mod['design'] = [[1., 0., 0.], [0.5, 1., 0.]]
+        mod['obs_cov'] = [[0.5, 0.1], [0.1, 0.4]]
+        mod['transition'] = [[0.5, 0.2, 0.], [0., 0.3, 0.], [0., 0., 0.1]]
+        mod['selection'] = np.eye(3)[:, :2]
+        mod['state_cov'] = np.eye(2) * 0.5
+        return mod
+
+    np.random.seed(1234)
+    endog = np.random.normal(size=(20, 2))
+    for missing in [False, True]:
+        mod = model(endog, missing)
+        desired = model(endog, missing)
+        names = [name for name in mod.shapes if not name == 'obs']
+        assert_equal(mod._changed_matrices('d'), set(names))
+        mod.loglike()
+        ss = mod._statespace
+        assert_equal(mod._changed_matrices('d'), set())
+
+        # If no matrix has changed, none are synced, and neither the selected
+        # state covariance matrix nor the stationary initialization is
+        # re-computed (the former is overwritten, so that re-computing it
+        # would restore it)
+        representations = dict(mod._representations['d'])
+        initial_state_cov = np.asarray(ss.initial_state_cov)
+        selected_state_cov = np.asarray(ss.selected_state_cov)
+        selected_state_cov[:] = 0
+        mod.loglike()
+        assert_equal(mod._statespace is ss, True)
+        for name in names:
+            assert_equal(mod._representations['d'][name] is
+                         representations[name], True)
+        assert_equal(np.may_share_memory(
+            np.asarray(ss.initial_state_cov), initial_state_cov), True)
+        assert_equal(selected_state_cov, 0)
+
+        # Both are re-computed once the state covariance matrix is set
+        mod['state_cov', 0, 0] = 0.5
+        assert_allclose(mod.loglike(), desired.loglike())
+        assert_allclose(selected_state_cov[:, :, 0],
+                        np.diag([0.5, 0.5, 0.]))
+        assert_equal(np.may_share_memory(
+            np.asarray(ss.initial_state_cov), initial_state_cov), False)
+
+        # Setting a slice marks the matrix as changed until it is synced, and
+        # the values of matrices which the caller does not hold are not
+        # compared
+        mod['transition', 0, 0] = 0.5
+        assert_equal(mod._changed_matrices('d'), set(['transition']))
+        assert_allclose(mod.loglike(), desired.loglike())
+        assert_equal(mod._changed_matrices('d'), set())
+        assert_equal(mod._exposed_matrices, set())
+        assert_equal(mod._synced_values['d'], {})
+
+        # Changes through `__setitem__` and in place are both found
+        for key, value in [(('obs_cov', 1, 1), 0.3),
+                           (('transition', 1, 1), 0.8),
+                           (('state_cov', 0, 0), 0.2),
+                           (('design', 1, 2), 0.4)]:
+            mod[key] = value
+            desired[key] = value
+            assert_allclose(mod.loglike(), desired.loglike())
+            mod.obs_cov[0, 0] = desired.obs_cov[0, 0] = 0.6 + value
+            assert_allclose(mod.loglike(), desired.loglike())
+            assert_allclose(mod.smooth().smoothed_state,
+                            desired.smooth().smoothed_state)
+        assert_equal(mod._statespace is ss, True)
+        assert_equal(mod._exposed_matrices, set(['obs_cov']))
+
+        # The stationary initialization is only re-computed when the
+        # transition, selection or state covariance matrices change
+        initial_state_cov = np.asarray(ss.initial_state_cov)
+        mod['obs_cov', 0, 0] = 0.2
+        mod.loglike()
+        assert_equal(np.may_share_memory(
+            np.asarray(ss.initial_state_cov), initial_state_cov), True)
+        mod['state_cov', 1, 1] = 0.1
+        mod.loglike()
+        assert_equal(np.may_share_memory(
+            np.asarray(ss.initial_state_cov), initial_state_cov), False)
+        mod.initialize_approximate_diffuse()
+        desired.initialize_approximate_diffuse()
+        desired['obs_cov', 0, 0] = 0.2
+        desired['state_cov', 1, 1] = 0.1
+        assert_allclose(mod.loglike(), desired.loglike())
+        mod.initialize_stationary()
+        desired.initialize_stationary()
+        assert_allclose(mod.loglike(), desired.loglike())
+
+    # The statespace object is told which matrices changed
+    ss = mod._statespace
+    ss.set_changed(['transition'])
+    assert_equal(np.asarray(ss.matrix_changed), [0, 0, 0, 1, 0, 0, 0])
+    ss.set_changed(['state_cov'])
+    assert_equal(np.asarray(ss.matrix_changed), [0, 0, 0, 1, 0, 0, 1])
+    mod.loglike()
+    assert_equal(np.asarray(ss.matrix_changed), [1] * 7)
+    assert_raises(ValueError, ss.set_changed, ['obs'])
+
+    # A matrix set to an array which was not copied may also be modified in
+    # place
+    mod = model(endog)
+    desired = model(endog)
+    transition = np.array(desired.transition, order="F")
+    mod['transition'] = transition
+    assert_equal(mod._exposed_matrices, set(['transition']))
+    assert_allclose(mod.loglike(), desired.loglike())
+    transition[1, 1] = desired.transition[1, 1] = 0.6
+    assert_allclose(mod.loglike(), desired.loglike())
+
+
 def test_filter():
     # Tests of invalid calls to the filter function
 
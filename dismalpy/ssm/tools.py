@@ -37,6 +37,10 @@ except ImportError:
 prefix_dtype_map = {
     's': np.float32, 'd': np.float64, 'c': np.complex64, 'z': np.complex128
 }
+precision_prefix_map = {
+    'single': {'s': 's', 'd': 's', 'c': 'c', 'z': 'c'},
+    'double': {'s': 'd', 'd': 'd', 'c': 'z', 'z': 'z'}
+}
 prefix_statespace_map = {
     's': _statespace.sStatespace, 'd': _statespace.dStatespace,
     'c': _statespace.cStatespace, 'z': _statespace.zStatespace
@@ -45,6 +49,16 @@ prefix_kalman_filter_map = {
     's': _kalman_filter.sKalmanFilter, 'd': _kalman_filter.dKalmanFilter,
     'c': _kalman_filter.cKalmanFilter, 'z': _kalman_filter.zKalmanFilter
 }
+prefix_loglikelihood_batch_map = {
+    's': _kalman_filter.sloglikelihood_batch,
+    'd': _kalman_filter.dloglikelihood_batch,
+    'c': _kalman_filter.cloglikelihood_batch,
+    'z': _kalman_filter.zloglikelihood_batch
+}
+prefix_score_obs_map = {
+    's': _kalman_filter.sscore_obs, 'd': _kalman_filter.dscore_obs,
+    'c': _kalman_filter.cscore_obs, 'z': _kalman_filter.zscore_obs
+}
 prefix_kalman_smoother_map = {
     's': _kalman_smoother.sKalmanSmoother,
     'd': _kalman_smoother.dKalmanSmoother,
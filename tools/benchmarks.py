@@ -0,0 +1,634 @@
+#!/usr/bin/env python
+""" benchmarks
+
+Benchmarks of the state space models.
+
+Usage: benchmarks [name ...]
+
+Runs the named benchmarks (by default, all of them, in the order listed
+below), each of which prints a table comparing the speed of alternative
+ways of computing the same results.
+
+    batch           loglikelihood of a batch of representations, compared
+                    with that of each representation separately
+    score           analytic score per observation, compared with its
+                    complex-step approximation
+    small_kernels   unrolled Kalman filter kernels for a single observed
+                    variable and at most four states, compared with BLAS
+    precision       single precision Kalman filter, compared with double
+                    precision
+    information     information filter for models with many observed
+                    variables, compared with the conventional filter
+    block_sequential
+                    block-sequential filter for a block-diagonal observation
+                    covariance matrix, compared with the conventional and
+                    univariate filters
+    transition      prediction step exploiting the structure of the
+                    transition matrix, compared with a dense one
+    selection       selected state covariance matrix found by index, when
+                    the selection matrix only selects states, compared with
+                    the general product
+    regimes         piecewise-constant matrices held by regime, compared with
+                    the same matrices expanded to each period
+    exog_matrices   design matrix given by exogenous data, compared with the
+                    same matrix expanded to each period
+    representation  refresh of the representation matrices shared with the
+                    statespace object, compared with casting them and with
+                    the filter itself
+    changed_matrices
+                    loglikelihood after a single matrix has changed, when
+                    only the arrays computed from it are re-computed,
+                    compared with when all matrices are assumed to have
+                    changed
+
+Each timing is the best of several repetitions, reported in milliseconds.
+"""
+from __future__ import division, print_function, absolute_import
+
+import sys
+import timeit
+from collections import OrderedDict
+
+import numpy as np
+from statsmodels.tools.numdiff import approx_fprime_cs
+from dismalpy.ssm.kalman_filter import (
+    KalmanFilter, FILTER_CONVENTIONAL, FILTER_UNIVARIATE,
+    FILTER_BLOCK_SEQUENTIAL, INVERT_UNIVARIATE, SOLVE_LU)
+from dismalpy.ssm._statespace import regime_matrices
+
+benchmarks = OrderedDict()
+
+
+def benchmark(func):
+    # Register a benchmark, by the name of its function
+    benchmarks[func.__name__] = func
+    return func
+
+
+def timed(func, repeat=5, number=20):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def ar_model(k_states, nobs, k_endog=1):
+    # Independent AR(1) states, with the observed variables given by their
+    # (noisy) sums
+    np.random.seed(1234)
+    mod = KalmanFilter(k_endog=k_endog, k_states=k_states)
+    mod.bind(np.cumsum(np.random.normal(size=(nobs, k_endog)), axis=0))
+    mod['design'] = np.ones((k_endog, k_states))
+    mod['obs_cov'] = np.eye(k_endog)
+    mod['transition'] = np.eye(k_states) * 0.5
+    mod['selection'] = np.eye(k_states)
+    mod['state_cov'] = np.eye(k_states) * 0.1
+    mod.initialize_stationary()
+    return mod
+
+
+@benchmark
+def batch(nobs=50, nbatch=50, nthreads=4):
+    # Each element of the batch has a different transition matrix; the
+    # representation matrices for each element are set in Python in either
+    # case, so "batch" includes the time to snapshot and stack them, and
+    # "filter" is the time taken by the batch filter alone
+    print('nobs = %d, batch of %d' % (nobs, nbatch))
+    print('%8s %10s %10s %10s %12s %9s' % (
+        'k_states', 'loop', 'batch', 'filter', '%d threads' % nthreads,
+        'speedup'))
+    for k_states in [1, 5, 20]:
+        mod = ar_model(k_states, nobs)
+        rhos = np.linspace(-0.9, 0.9, nbatch)
+
+        def loop():
+            for rho in rhos:
+                mod['transition'] = np.eye(k_states) * rho
+                mod.loglike()
+
+        def representations():
+            batch = []
+            for rho in rhos:
+                mod['transition'] = np.eye(k_states) * rho
+                batch.append(mod._batch_representation())
+            return batch
+
+        representations_batch = representations()
+        loop_time = timed(loop, repeat=20, number=1)
+        batch_time = timed(
+            lambda: mod._loglike_batch(representations()), repeat=20,
+            number=1)
+        filter_time = timed(
+            lambda: mod._loglike_batch(representations_batch), repeat=20,
+            number=1)
+        threads_time = timed(
+            lambda: mod._loglike_batch(representations_batch,
+                                       nthreads=nthreads), repeat=20,
+            number=1)
+        print('%8d %10.3f %10.3f %10.3f %12.3f %8.1fx' % (
+            k_states, loop_time * 1e3, batch_time * 1e3, filter_time * 1e3,
+            threads_time * 1e3, loop_time / batch_time))
+
+
+@benchmark
+def score(nobs=200):
+    # The parameters are either the diagonal of the transition matrix (which
+    # the filter exploits) or all of its elements, along with the observation
+    # variance. The complex-step approximation requires a pass of the
+    # (complex) filter for each parameter, while the analytic score requires
+    # a single pass of the derivative recursions, with products over all of
+    # the parameters at once. Each parameter adds about as much work to the
+    # recursions as a pass of the filter, and for small models the calls to
+    # BLAS dominate, so that the two take comparable time
+    print('nobs = %d' % nobs)
+    print('%8s %10s %8s %14s %14s %9s' % (
+        'k_states', 'transition', 'k_params', 'complex (ms)', 'analytic (ms)',
+        'speedup'))
+    for k_states in [1, 2, 5, 10]:
+        for dense in [False, True]:
+            if dense and k_states == 1:
+                continue
+            mod = ar_model(k_states, nobs)
+            if dense:
+                indices = np.unravel_index(np.arange(k_states**2),
+                                           (k_states, k_states))
+                params = np.r_[np.eye(k_states).ravel() * 0.5 + 0.01, 1.]
+            else:
+                indices = np.diag_indices(k_states)
+                params = np.r_[np.linspace(0.1, 0.8, k_states), 1.]
+            k_params = len(params)
+
+            def loglikeobs(params):
+                transition = np.zeros((k_states, k_states),
+                                      dtype=params.dtype)
+                transition[indices] = params[:-1]
+                mod['transition'] = transition
+                mod['obs_cov'] = params[-1:, None]
+                return mod.loglikeobs(
+                    inversion_method=INVERT_UNIVARIATE | SOLVE_LU)
+
+            partials = {
+                'transition': np.zeros((k_states, k_states, 1, k_params)),
+                'obs_cov': np.zeros((1, 1, 1, k_params)),
+            }
+            for i in range(k_params - 1):
+                partials['transition'][indices[0][i], indices[1][i], 0, i] = 1
+            partials['obs_cov'][0, 0, 0, -1] = 1
+
+            complex_time = timed(lambda: approx_fprime_cs(params, loglikeobs),
+                                 repeat=20, number=1)
+            loglikeobs(params)
+            analytic_time = timed(lambda: mod.score_obs(partials), repeat=20,
+                                  number=1)
+            print('%8d %10s %8d %14.3f %14.3f %8.1fx' % (
+                k_states, 'dense' if dense else 'diagonal', k_params,
+                complex_time * 1e3, analytic_time * 1e3,
+                complex_time / analytic_time))
+
+
+@benchmark
+def small_kernels(nobs=1000):
+    # The filter loop of the underlying Cython Kalman filter object is timed
+    # with `small_kernels` set and unset, so that the creation of the
+    # results objects is not included
+    print('nobs = %d' % nobs)
+    print('%8s %14s %14s %9s' % ('k_states', 'BLAS (ms)', 'unrolled (ms)',
+                                 'speedup'))
+    for k_states in [1, 2, 3, 4]:
+        mod = ar_model(k_states, nobs)
+        mod['transition'] = (np.eye(k_states) * 0.5 +
+                             np.eye(k_states, k=1) * 0.2)
+        mod.initialize_approximate_diffuse()
+        mod.filter()
+        kfilter = mod._kalman_filter
+
+        times = []
+        for small_kernels in [False, True]:
+            kfilter.small_kernels = small_kernels
+            times.append(timed(kfilter, repeat=20, number=5))
+        print('%8d %14.3f %14.3f %8.1fx' % (
+            k_states, times[0] * 1e3, times[1] * 1e3, times[0] / times[1]))
+
+
+@benchmark
+def precision(nobs=1000):
+    # A stationary model with ten observed variables is filtered in double
+    # and in single precision; the filter loop of the underlying Cython
+    # Kalman filter object is timed (and the covariance matrices are updated
+    # in every period). Accuracy is the absolute difference in the joint
+    # loglikelihood and the maximum absolute differences in the filtered
+    # states and in the predicted state covariance matrices; since single
+    # precision has a machine epsilon of approximately 1e-7, these are only
+    # representative of well-conditioned models
+    print('nobs = %d' % nobs)
+    print('%8s %12s %12s %8s %10s %10s %10s' % (
+        'k_states', 'double (ms)', 'single (ms)', 'speedup', 'llf diff',
+        'state diff', 'cov diff'))
+    for k_states in [5, 10, 20, 50]:
+        mod = ar_model(k_states, nobs, k_endog=10)
+        mod.bind(np.random.normal(size=(nobs, 10)))
+        mod['design'] = np.random.uniform(size=(10, k_states))
+        mod['transition'] = (np.eye(k_states) * 0.5 +
+                             np.eye(k_states, k=1) * 0.2)
+        mod.initialize_stationary()
+        mod.tolerance = 0
+
+        times = []
+        results = []
+        for precision in ['double', 'single']:
+            mod.precision = precision
+            results.append(mod.filter())
+            times.append(timed(mod._kalman_filter, repeat=20, number=1))
+        desired, res = results
+        llf = np.abs(np.sum(res.llf_obs) - np.sum(desired.llf_obs))
+        state = np.max(np.abs(res.filtered_state - desired.filtered_state))
+        cov = np.max(np.abs(res.predicted_state_cov -
+                            desired.predicted_state_cov))
+        print('%8d %12.3f %12.3f %7.1fx %10.2e %10.2e %10.2e' % (
+            k_states, times[0] * 1e3, times[1] * 1e3, times[0] / times[1],
+            llf, state, cov))
+
+
+@benchmark
+def information(nobs=500):
+    # A model with five states and a diagonal observation covariance matrix
+    # is evaluated with `loglike` (so that neither the forecast error
+    # covariance matrices nor the quantities required by the smoother are
+    # computed), with and without `filter_information`
+    print('nobs = %d' % nobs)
+    print('%8s %18s %18s %8s %10s' % (
+        'k_endog', 'conventional (ms)', 'information (ms)', 'speedup',
+        'llf diff'))
+    for k_endog in [5, 20, 50, 100, 200]:
+        mod = ar_model(5, nobs, k_endog=k_endog)
+        mod.bind(np.random.normal(size=(nobs, k_endog)))
+        mod['design'] = np.random.uniform(size=(k_endog, 5))
+        mod['obs_cov'] = np.diag(np.random.uniform(0.5, 1.5, size=k_endog))
+        mod['transition'] = np.eye(5) * 0.5 + np.eye(5, k=1) * 0.2
+        mod.initialize_stationary()
+        mod.tolerance = 0
+
+        times = []
+        llfs = []
+        for information in [False, True]:
+            mod.filter_information = information
+            llfs.append(mod.loglike())
+            times.append(timed(mod.loglike, repeat=10, number=1))
+        print('%8d %18.3f %18.3f %7.1fx %10.2e' % (
+            k_endog, times[0] * 1e3, times[1] * 1e3, times[0] / times[1],
+            np.abs(llfs[1] - llfs[0])))
+
+
+@benchmark
+def block_sequential(nobs=500):
+    # A model with five states and a block-diagonal observation covariance
+    # matrix (with the blocks randomly interleaved, so that they are not
+    # contiguous) is filtered with the conventional, univariate and
+    # block-sequential methods, timing the filter loop of the underlying
+    # Cython Kalman filter object. The univariate filter requires a diagonal
+    # observation covariance matrix, so it diagonalizes the observation
+    # covariance matrix (once) and transforms the observations (in every
+    # period)
+    print('nobs = %d' % nobs)
+    print('%8s %6s %18s %16s %16s %8s %8s %10s' % (
+        'k_endog', 'block', 'conventional (ms)', 'univariate (ms)',
+        'block seq. (ms)', 'vs conv.', 'vs univ.', 'llf diff'))
+    for k_endog in [20, 50, 100, 200]:
+        for block_size in [1, 2, 5]:
+            mod = ar_model(5, nobs, k_endog=k_endog)
+            mod.bind(np.random.normal(size=(nobs, k_endog)))
+            mod['design'] = np.random.uniform(size=(k_endog, 5))
+            obs_cov = np.zeros((k_endog, k_endog))
+            permutation = np.random.permutation(k_endog)
+            for i in range(0, k_endog, block_size):
+                block = permutation[i:i + block_size]
+                tmp = np.random.normal(size=(len(block), len(block))) * 0.5
+                obs_cov[np.ix_(block, block)] = (np.dot(tmp, tmp.T) +
+                                                 np.eye(len(block)))
+            mod['obs_cov'] = obs_cov
+            mod['transition'] = np.eye(5) * 0.5 + np.eye(5, k=1) * 0.2
+            mod.initialize_stationary()
+            mod.tolerance = 0
+
+            times = []
+            llfs = []
+            for filter_method in [
+                    FILTER_CONVENTIONAL, FILTER_UNIVARIATE,
+                    FILTER_CONVENTIONAL | FILTER_BLOCK_SEQUENTIAL]:
+                mod.filter_method = filter_method
+                mod.filter()
+                kfilter = mod._kalman_filter
+                mod._statespace.diagonal_obs_cov = False
+                times.append(timed(kfilter, repeat=5, number=1))
+                llfs.append(np.sum(kfilter.loglikelihood))
+            print('%8d %6d %18.3f %16.3f %16.3f %7.1fx %7.1fx %10.2e' % (
+                k_endog, block_size, times[0] * 1e3, times[1] * 1e3,
+                times[2] * 1e3, times[0] / times[2], times[1] / times[2],
+                np.abs(llfs[2] - llfs[0])))
+
+
+@benchmark
+def transition(nobs=500):
+    # A model with a single observed variable is filtered with and without
+    # the `structured_transition` flag of the underlying Cython statespace
+    # object, timing the filter loop of the underlying Cython Kalman filter
+    # object
+    def structured(structure, k_states):
+        if structure == 'identity':
+            return np.eye(k_states)
+        elif structure == 'diagonal':
+            return np.diag(np.random.uniform(0.2, 0.9, size=k_states))
+        elif structure == 'block_diagonal':
+            # Blocks of dimension 4 (e.g. the components of an unobserved
+            # components model)
+            transition = np.zeros((k_states, k_states))
+            for i in range(0, k_states, 4):
+                n = min(4, k_states - i)
+                transition[i:i + n, i:i + n] = np.random.uniform(
+                    -0.2, 0.2, size=(n, n))
+            return transition
+        elif structure == 'companion':
+            # A VAR(p) with two variables
+            transition = np.eye(k_states, k=-2)
+            transition[:2, :] = np.random.uniform(-0.1, 0.1,
+                                                  size=(2, k_states))
+            return transition
+        elif structure == 'transposed_companion':
+            # An ARMA(p, p - 1)
+            transition = np.eye(k_states, k=1)
+            transition[:, 0] = np.random.uniform(-0.1, 0.1, size=k_states)
+            return transition
+
+    print('nobs = %d' % nobs)
+    print('%22s %8s %12s %16s %8s %10s' % (
+        'structure', 'k_states', 'dense (ms)', 'structured (ms)', 'speedup',
+        'llf diff'))
+    for structure in ['identity', 'diagonal', 'block_diagonal', 'companion',
+                      'transposed_companion']:
+        for k_states in [8, 20, 50]:
+            mod = ar_model(k_states, nobs)
+            mod['design'] = np.random.uniform(size=(1, k_states))
+            mod['transition'] = structured(structure, k_states)
+            mod.initialize_approximate_diffuse(10)
+            mod.tolerance = 0
+            mod.filter()
+            kfilter = mod._kalman_filter
+
+            times = []
+            llfs = []
+            for structured_transition in [False, True]:
+                mod._statespace.structured_transition = structured_transition
+                times.append(timed(kfilter, repeat=10, number=1))
+                llfs.append(np.sum(kfilter.loglikelihood))
+            print('%22s %8d %12.3f %16.3f %7.1fx %10.2e' % (
+                structure, k_states, times[0] * 1e3, times[1] * 1e3,
+                times[0] / times[1], np.abs(llfs[1] - llfs[0])))
+
+
+@benchmark
+def selection(nobs=500):
+    # A model with a single observed variable and a time-varying state
+    # covariance matrix is filtered with a selection matrix which selects
+    # states (so that it is held as an index), and with the same selection
+    # matrix multiplied by two (and the state covariance matrix divided by
+    # four, so that the models are equivalent), which is not
+    def model(k_states, k_posdef, scale):
+        np.random.seed(1234)
+        mod = KalmanFilter(k_endog=1, k_states=k_states, k_posdef=k_posdef)
+        mod.bind(np.random.normal(size=(nobs, 1)))
+        mod['design'] = np.random.uniform(size=(1, k_states))
+        mod['obs_cov'] = np.eye(1)
+        mod['transition'] = np.diag(
+            np.random.uniform(0.2, 0.9, size=k_states))
+        selection = np.zeros((k_states, k_posdef))
+        selection[np.arange(k_posdef), np.arange(k_posdef)] = scale
+        mod['selection'] = selection
+        state_cov = np.random.uniform(0.5, 1.5, size=(k_posdef, nobs))
+        mod['state_cov'] = np.einsum('it,ij->ijt', state_cov,
+                                     np.eye(k_posdef)) / scale**2
+        mod.initialize_approximate_diffuse(10)
+        mod.tolerance = 0
+        return mod
+
+    print('nobs = %d' % nobs)
+    print('%8s %8s %13s %12s %8s %10s' % (
+        'k_states', 'k_posdef', 'general (ms)', 'index (ms)', 'speedup',
+        'llf diff'))
+    for k_states in [8, 20, 50]:
+        for k_posdef in [1, k_states // 2, k_states]:
+            times = []
+            llfs = []
+            for scale in [2, 1]:
+                mod = model(k_states, k_posdef, scale)
+                mod.filter()
+                kfilter = mod._kalman_filter
+                times.append(timed(kfilter, repeat=10, number=1))
+                llfs.append(np.sum(kfilter.loglikelihood))
+            print('%8d %8d %13.3f %12.3f %7.1fx %10.2e' % (
+                k_states, k_posdef, times[0] * 1e3, times[1] * 1e3,
+                times[0] / times[1], np.abs(llfs[1] - llfs[0])))
+
+
+@benchmark
+def regimes(nobs=2000, k_endog=5, k_regimes=3):
+    # A model with transition, observation covariance and state covariance
+    # matrices which take three distinct values (in consecutive regimes of
+    # equal length) is evaluated with `loglike`, with the matrices held
+    # either as the distinct values along with a regime index (see
+    # `Representation.set_regimes`) or as `nobs` copies; the memory is that
+    # used by the representation matrices (and the selected state covariance
+    # matrix) of the underlying statespace object. The filter may converge
+    # within each regime, which accounts for most of the difference in speed
+    # (and for the small difference in the loglikelihood)
+    def model(k_states, expanded):
+        np.random.seed(1234)
+        mod = KalmanFilter(k_endog=k_endog, k_states=k_states)
+        mod.bind(np.random.normal(size=(nobs, k_endog)))
+        mod['design'] = np.random.uniform(size=(k_endog, k_states))
+        mod['selection'] = np.eye(k_states)
+
+        index = np.arange(nobs) * k_regimes // nobs
+        scale = np.arange(1, k_regimes + 1)
+        matrices = {
+            'transition': (np.eye(k_states)[:, :, None] * 0.5 +
+                           np.eye(k_states, k=1)[:, :, None] * scale * 0.1),
+            'obs_cov': np.eye(k_endog)[:, :, None] * scale,
+            'state_cov': np.eye(k_states)[:, :, None] * scale * 0.1,
+        }
+        for name, value in matrices.items():
+            if expanded:
+                mod[name] = value[..., index]
+            else:
+                mod.set_regimes(name, value, index)
+        mod.initialize_stationary()
+        return mod
+
+    def memory(mod):
+        ss = mod._statespace
+        return sum([np.asarray(getattr(ss, name)).nbytes for name in [
+            'design', 'obs_intercept', 'obs_cov', 'transition',
+            'state_intercept', 'selection', 'state_cov',
+            'selected_state_cov']])
+
+    print('nobs = %d' % nobs)
+    print('%8s %14s %14s %8s %14s %14s %10s' % (
+        'k_states', 'expanded (ms)', 'regimes (ms)', 'speedup',
+        'expanded (kB)', 'regimes (kB)', 'llf diff'))
+    for k_states in [2, 5, 10, 20]:
+        mods = [model(k_states, expanded) for expanded in [True, False]]
+        times = [timed(mod.loglike, repeat=10, number=1) for mod in mods]
+        llfs = [mod.loglike() for mod in mods]
+        print('%8d %14.3f %14.3f %7.1fx %14.1f %14.1f %10.2e' % (
+            k_states, times[0] * 1e3, times[1] * 1e3, times[0] / times[1],
+            memory(mods[0]) / 1e3, memory(mods[1]) / 1e3,
+            np.abs(llfs[1] - llfs[0])))
+
+
+@benchmark
+def exog_matrices(nobs=2000, k_endog=10, k_exog=3):
+    # A model with a design matrix which is a time-invariant matrix plus a
+    # linear combination of three exogenous variables is evaluated with
+    # `loglike`, with the design matrix held either as the time-invariant
+    # matrix and the coefficients on the exogenous data (see
+    # `Representation.set_exog_matrices`) or as `nobs` slices; the memory is
+    # that used by the design matrix (together with the exogenous data and
+    # coefficients) of the underlying statespace object
+    def model(k_states, expanded):
+        np.random.seed(1234)
+        mod = KalmanFilter(k_endog=k_endog, k_states=k_states)
+        mod.bind(np.random.normal(size=(nobs, k_endog)))
+        mod['obs_cov'] = np.eye(k_endog)
+        mod['transition'] = np.eye(k_states) * 0.5
+        mod['selection'] = np.eye(k_states)
+        mod['state_cov'] = np.eye(k_states) * 0.1
+
+        exog_data = np.random.normal(size=(nobs, k_exog))
+        design = np.random.uniform(size=(k_endog, k_states))
+        coefficients = np.random.normal(
+            size=(k_endog, k_states, k_exog)) * 0.1
+        if expanded:
+            mod['design'] = (design[..., None] +
+                             np.dot(coefficients, exog_data.T))
+        else:
+            mod['design'] = design
+            mod.set_exog_matrices(exog_data, design=coefficients)
+        mod.initialize_stationary()
+        return mod
+
+    def memory(mod):
+        ss = mod._statespace
+        nbytes = np.asarray(ss.design).nbytes
+        if ss.k_exog > 0:
+            nbytes += (np.asarray(ss.exog_data).nbytes +
+                       np.asarray(ss.design_coefficients).nbytes +
+                       np.asarray(ss.design_buffer).nbytes)
+        return nbytes
+
+    print('nobs = %d' % nobs)
+    print('%8s %14s %14s %8s %14s %14s %10s' % (
+        'k_states', 'expanded (ms)', 'exog (ms)', 'speedup',
+        'expanded (kB)', 'exog (kB)', 'llf diff'))
+    for k_states in [2, 5, 10, 20]:
+        mods = [model(k_states, expanded) for expanded in [True, False]]
+        times = [timed(mod.loglike, repeat=10, number=1) for mod in mods]
+        llfs = [mod.loglike() for mod in mods]
+        print('%8d %14.3f %14.3f %7.1fx %14.1f %14.1f %10.2e' % (
+            k_states, times[0] * 1e3, times[1] * 1e3, times[0] / times[1],
+            memory(mods[0]) / 1e3, memory(mods[1]) / 1e3,
+            np.abs(llfs[1] - llfs[0])))
+
+
+@benchmark
+def representation(k_endog=10, k_states=2):
+    # A model with time-varying design and observation covariance matrices
+    # is evaluated with `loglike`, and the refresh of the representation
+    # matrices held by the underlying statespace object
+    # (`_initialize_representation`) is timed separately, both when the
+    # matrices are of the datatype of the statespace object (so that they
+    # are shared with it) and when they must be cast (here, in single
+    # precision, which copies them as every refresh used to). The matrices
+    # are marked as changed before each refresh, as after an update of the
+    # parameters, so that they are not skipped
+    print('k_endog = %d' % k_endog)
+    print('%8s %12s %14s %14s %8s' % (
+        'nobs', 'loglike (ms)', 'shared (ms)', 'cast (ms)', 'speedup'))
+    for nobs in [1000, 5000, 20000]:
+        mod = ar_model(k_states, nobs, k_endog)
+        mod['design'] = np.random.uniform(size=(k_endog, k_states, nobs))
+        mod['obs_cov'] = np.eye(k_endog)[:, :, None] * np.ones(nobs)
+        mod.loglike()
+
+        def refresh(prefix):
+            mod._set_changed(['design', 'obs_intercept', 'obs_cov',
+                              'transition', 'state_intercept', 'selection',
+                              'state_cov'])
+            mod._initialize_representation(prefix)
+
+        loglike = timed(mod.loglike, number=5)
+        shared = timed(lambda: refresh('d'), number=5)
+        refresh('s')
+        cast = timed(lambda: refresh('s'), number=5)
+        print('%8d %12.3f %14.3f %14.3f %7.1fx' % (
+            nobs, loglike * 1e3, shared * 1e3, cast * 1e3, cast / shared))
+
+
+@benchmark
+def changed_matrices(k_endog=50):
+    # A model with some observed variables missing in some periods, a
+    # stationary initialization and the information filter is evaluated
+    # with `loglike` after an element of either the observation covariance
+    # matrix (so that the stationary initialization is retained) or the
+    # transition matrix (so that the arrays computed from the observation
+    # covariance and design matrices are retained) is changed, compared with
+    # the same model for which all matrices are marked as changed (see
+    # `Statespace.set_changed`) and the stationary initialization is
+    # re-computed before each evaluation. The arrays and initialization
+    # which are retained are only computed once per evaluation, so their
+    # share of its time is largest in short samples
+    def update(mod, name, all_changed):
+        values = [0.4, 0.5]
+        state = {'i': 0}
+
+        def func():
+            state['i'] += 1
+            mod[name, 0, 0] = values[state['i'] % 2] + (name == 'obs_cov')
+            if all_changed:
+                mod._initialize_representation()
+                mod._statespace.set_changed(regime_matrices)
+                mod._stationary_initializations.clear()
+            return mod.loglike()
+        return func
+
+    print('k_endog = %d' % k_endog)
+    print('%8s %8s %12s %14s %14s %8s' % (
+        'nobs', 'k_states', 'changed', 'all (ms)', 'changed (ms)',
+        'speedup'))
+    for nobs, k_states, name in [(nobs, k_states, name)
+                                 for nobs in [20, 200]
+                                 for k_states in [5, 20, 50]
+                                 for name in ['obs_cov', 'transition']]:
+        mod = ar_model(k_states, nobs, k_endog)
+        endog = np.random.normal(size=(nobs, k_endog))
+        endog[::10, :k_endog // 2] = np.nan
+        mod.bind(endog)
+        mod['design'] = np.random.uniform(size=(k_endog, k_states))
+        obs_cov = np.random.uniform(size=(k_endog, k_endog)) * 0.1
+        mod['obs_cov'] = np.dot(obs_cov, obs_cov.T) + np.eye(k_endog)
+        mod['state_cov'] = np.eye(k_states)
+        mod.filter_information = True
+        mod.loglike()
+
+        times = [timed(update(mod, name, all_changed), repeat=20,
+                       number=1)
+                 for all_changed in [True, False]]
+        print('%8d %8d %12s %14.3f %14.3f %7.1fx' % (
+            nobs, k_states, name, times[0] * 1e3, times[1] * 1e3,
+            times[0] / times[1]))
+
+
+def main(names):
+    for name in names or benchmarks:
+        print('# %s' % name)
+        benchmarks[name]()
+        print()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])